@@ -0,0 +1,321 @@
+"""Suite de benchmarks EchoNull : analyzers seuls, sweeps complets et démarrage.
+
+Chaque cas est mesuré après ``--warmup`` exécutions à blanc, sur ``--repeat``
+échantillons ; le JSON produit (``--save``) sert de référence à ``--compare``
+pour repérer les régressions entre deux commits.
+
+    python -m benchmarks.suite --save bench.json
+    python -m benchmarks.suite --compare bench.json --tolerance 0.15
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from common.utils import AnalyzerProtocol
+from orchestrator.dataset import generate_dataset
+from orchestrator.run import Params, SweepPool, parse_shape, process_chunk, run
+
+SCHEMA_VERSION = 1
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+@dataclass
+class SuiteConfig:
+    runs: int = 20
+    workers: list[int] = field(default_factory=lambda: [1, 2])
+    thresholds: list[float] = field(default_factory=lambda: [0.25, 0.5, 0.7, 0.8])
+    graph_nodes: list[int] = field(default_factory=lambda: [10, 1000])
+    graph_engine: str = "numpy"
+    dataset_shape: tuple[int, int] = (256, 8)
+    warmup: int = 1
+    repeat: int = 5
+    # Appels par échantillon pour les analyzers (un appel est trop court à chronométrer).
+    analyzer_calls: int = 20
+
+
+@dataclass
+class BenchResult:
+    name: str
+    samples: list[float]
+    # Nombre de runs (ou d'appels) couverts par un échantillon.
+    work: int
+
+    @property
+    def median(self) -> float:
+        return float(np.median(self.samples))
+
+    @property
+    def p95(self) -> float:
+        return float(np.percentile(self.samples, 95))
+
+    @property
+    def throughput(self) -> float:
+        return self.work / self.median if self.median > 0 else float("inf")
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "work": self.work,
+            "median_s": self.median,
+            "p95_s": self.p95,
+            "runs_per_s": self.throughput,
+            "samples_s": self.samples,
+        }
+
+
+def measure(fn: Callable[[], object], warmup: int, repeat: int) -> list[float]:
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _analyzers(config: SuiteConfig, n: int) -> list[AnalyzerProtocol]:
+    # Importés ici : un worker « spawn » de bench_startup ne doit pas les payer.
+    from delta_stats.analyzer import DeltaStatsAnalyzer
+    from graph_analysis.analyzer import GraphAnalysisAnalyzer
+    from mark_counts.analyzer import MarkCountsAnalyzer
+
+    return [
+        GraphAnalysisAnalyzer(config.thresholds, n=n, engine=config.graph_engine),
+        DeltaStatsAnalyzer(),
+        MarkCountsAnalyzer(),
+    ]
+
+
+def bench_analyzers(config: SuiteConfig, scratch: Path) -> list[BenchResult]:
+    data = generate_dataset(123, *config.dataset_shape)
+    results = []
+    for n in config.graph_nodes:
+        for analyzer in _analyzers(config, n):
+            # Les analyzers hors graphe ne dépendent pas de n : mesurés une fois.
+            if analyzer.name != "graph_analysis" and n != config.graph_nodes[0]:
+                continue
+            out = scratch / f"{analyzer.name}_{n}"
+
+            def calls(a: AnalyzerProtocol = analyzer, out: Path = out) -> None:
+                for run_id in range(1, config.analyzer_calls + 1):
+                    a.analyze(run_id, 1000 + run_id, data, out)
+
+            name = f"analyzer/{analyzer.name}"
+            if analyzer.name == "graph_analysis":
+                name += f"/n={n}"
+            samples = measure(calls, config.warmup, config.repeat)
+            results.append(BenchResult(name, samples, config.analyzer_calls))
+    return results
+
+
+def bench_orchestrator(config: SuiteConfig, scratch: Path) -> list[BenchResult]:
+    results = []
+    # Un dossier de sortie neuf par sweep : rien n'est repris d'une mesure à l'autre.
+    counter = itertools.count()
+    for n in config.graph_nodes:
+        for workers in config.workers:
+
+            def sweep(n: int = n, workers: int = workers, pool: SweepPool | None = None) -> None:
+                params = Params(
+                    runs=config.runs,
+                    thresholds=config.thresholds,
+                    out=scratch / f"sweep_{next(counter)}",
+                    seed_base=1000,
+                    workers=workers,
+                    zip_out=False,
+                    collect_results=False,
+                    dataset_shape=config.dataset_shape,
+                    graph_nodes=n,
+                    graph_engine=config.graph_engine,
+                )
+                run(params, pool=pool)
+
+            samples = measure(sweep, config.warmup, config.repeat)
+            name = f"orchestrator/run/n={n}/workers={workers}"
+            results.append(BenchResult(name, samples, config.runs))
+            # Même sweep sur un SweepPool gardé d'une mesure à l'autre : sans
+            # démarrage des workers ni construction des analyzers.
+            with SweepPool(workers) as shared:
+                samples = measure(partial(sweep, pool=shared), config.warmup, config.repeat)
+            name = f"orchestrator/pool/n={n}/workers={workers}"
+            results.append(BenchResult(name, samples, config.runs))
+    return results
+
+
+def _python(*args: str) -> Callable[[], object]:
+    def call() -> object:
+        return subprocess.run(
+            [sys.executable, *args], cwd=_REPO_ROOT, check=True, capture_output=True
+        )
+
+    return call
+
+
+def bench_startup(config: SuiteConfig, scratch: Path) -> list[BenchResult]:
+    """Démarrage à froid (interpréteur neuf) et premier chunk d'un worker « spawn »."""
+    results = [
+        BenchResult(name, measure(_python(*args), config.warmup, config.repeat), 1)
+        for name, args in (
+            ("startup/import", ["-c", "import orchestrator.run"]),
+            ("startup/cli_help", ["-m", "orchestrator", "--help"]),
+        )
+    ]
+    params = Params(
+        runs=1,
+        thresholds=config.thresholds,
+        out=scratch / "startup",
+        seed_base=1000,
+        workers=1,
+        zip_out=False,
+        collect_results=False,
+        dataset_shape=config.dataset_shape,
+        graph_nodes=min(config.graph_nodes),
+        graph_engine=config.graph_engine,
+    )
+
+    def first_chunk() -> None:
+        # Pool neuf à chaque mesure : import des modules et des analyzers compris.
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            pool.submit(process_chunk, [1], params).result()
+
+    samples = measure(first_chunk, config.warmup, config.repeat)
+    results.append(BenchResult("startup/worker/spawn", samples, 1))
+    return results
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def run_suite(config: SuiteConfig, only: str | None = None) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="echonull-bench-") as tmp:
+        scratch = Path(tmp)
+        cases: list[BenchResult] = []
+        if only in (None, "analyzers"):
+            cases += bench_analyzers(config, scratch)
+        if only in (None, "orchestrator"):
+            cases += bench_orchestrator(config, scratch)
+        if only in (None, "startup"):
+            cases += bench_startup(config, scratch)
+    return {
+        "schema": SCHEMA_VERSION,
+        "meta": {
+            "commit": _git_commit(),
+            "date": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "config": asdict(config),
+        "cases": [c.to_dict() for c in cases],
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """Cas dont la médiane dépasse celle de la référence de plus de ``tolerance``."""
+    before = {c["name"]: c for c in baseline["cases"]}
+    regressions = []
+    for case in current["cases"]:
+        ref = before.get(case["name"])
+        if ref is None:
+            continue
+        ratio = case["median_s"] / ref["median_s"] if ref["median_s"] > 0 else 1.0
+        line = f"{case['name']}: {ref['median_s']:.4f}s -> {case['median_s']:.4f}s ({ratio:.2f}x)"
+        print(line)
+        if ratio > 1.0 + tolerance:
+            regressions.append(line)
+    return regressions
+
+
+def _int_list(s: str) -> list[int]:
+    return [int(x) for x in s.split(",") if x.strip()]
+
+
+def _float_list(s: str) -> list[float]:
+    return [float(x) for x in s.split(",") if x.strip()]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    defaults = SuiteConfig()
+    p = argparse.ArgumentParser(prog="echonull-bench", description="EchoNull benchmark suite")
+    p.add_argument("--runs", type=int, default=defaults.runs)
+    p.add_argument("--workers", type=_int_list, default=defaults.workers)
+    p.add_argument("--thresholds", type=_float_list, default=defaults.thresholds)
+    p.add_argument("--graph-nodes", type=_int_list, default=defaults.graph_nodes)
+    p.add_argument("--graph-engine", choices=("networkx", "numpy"), default=defaults.graph_engine)
+    p.add_argument("--dataset-shape", type=parse_shape, default=defaults.dataset_shape)
+    p.add_argument("--warmup", type=int, default=defaults.warmup)
+    p.add_argument("--repeat", type=int, default=defaults.repeat)
+    p.add_argument("--analyzer-calls", type=int, default=defaults.analyzer_calls)
+    p.add_argument("--only", choices=("analyzers", "orchestrator", "startup"), default=None)
+    p.add_argument("--save", type=str, default=None, help="écrit les résultats JSON")
+    p.add_argument("--compare", type=str, default=None, help="JSON de référence")
+    p.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.10,
+        help="hausse relative de la médiane tolérée avant de signaler une régression",
+    )
+    return p
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    config = SuiteConfig(
+        runs=args.runs,
+        workers=args.workers,
+        thresholds=args.thresholds,
+        graph_nodes=args.graph_nodes,
+        graph_engine=args.graph_engine,
+        dataset_shape=args.dataset_shape,
+        warmup=args.warmup,
+        repeat=args.repeat,
+        analyzer_calls=args.analyzer_calls,
+    )
+    report = run_suite(config, args.only)
+    for case in report["cases"]:
+        print(
+            f"{case['name']:<45} median {case['median_s']:.4f}s  p95 {case['p95_s']:.4f}s  "
+            f"{case['runs_per_s']:.1f} runs/s"
+        )
+    if args.save:
+        Path(args.save).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        regressions = compare(report, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,84 @@
+"""Registre des analyzers : un nom, une fabrique ``params -> analyzer``.
+
+Les analyzers intégrés sont enregistrés par l'orchestrateur ; les paquets
+tiers déclarent les leurs dans le groupe d'entry points ``echonull.analyzers``
+(``nom = "module:fabrique"``). Une fabrique n'importe son module qu'à la
+construction de l'analyzer : un analyzer non sélectionné ne coûte rien.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from importlib.metadata import EntryPoint, entry_points
+from typing import Any
+
+from common.utils import AnalyzerProtocol
+
+ENTRY_POINT_GROUP = "echonull.analyzers"
+
+# Reçoit les paramètres du sweep (``orchestrator.run.Params``). Les workers
+# gardent l'analyzer construit tant que les champs de contenu ne changent pas :
+# une fabrique ne doit pas dépendre des champs de planification (``out``,
+# ``runs``, ``workers``, ...), exclus de l'empreinte de ``--resume``.
+AnalyzerFactory = Callable[[Any], AnalyzerProtocol]
+
+_factories: dict[str, AnalyzerFactory] = {}
+_discovered = False
+
+
+class _EntryPointFactory:
+    def __init__(self, entry_point: EntryPoint) -> None:
+        self.entry_point = entry_point
+        self._factory: AnalyzerFactory | None = None
+
+    def __call__(self, params: Any) -> AnalyzerProtocol:
+        if self._factory is None:
+            self._factory = self.entry_point.load()
+        return self._factory(params)
+
+
+def register(name: str, factory: AnalyzerFactory) -> None:
+    if name in _factories:
+        raise ValueError(f"analyzer {name!r} is already registered")
+    _factories[name] = factory
+
+
+def _discover() -> None:
+    global _discovered
+    if _discovered:
+        return
+    _discovered = True
+    for ep in entry_points(group=ENTRY_POINT_GROUP):
+        # Un nom déjà enregistré explicitement prime sur l'entry point.
+        _factories.setdefault(ep.name, _EntryPointFactory(ep))
+
+
+def available() -> list[str]:
+    """Noms enregistrés, dans l'ordre d'enregistrement (ordre d'exécution)."""
+    _discover()
+    return list(_factories)
+
+
+def select(include: Sequence[str] | None = None, exclude: Sequence[str] = ()) -> list[str]:
+    """Noms retenus, dans l'ordre d'enregistrement quel que soit celui de ``include``."""
+    names = available()
+    unknown = sorted({*(include or ()), *exclude} - set(names))
+    if unknown:
+        raise ValueError(f"unknown analyzers {unknown}, expected among {names}")
+    chosen = [n for n in names if (include is None or n in include) and n not in exclude]
+    if not chosen:
+        raise ValueError("no analyzer selected")
+    return chosen
+
+
+# Membres sans défaut d'``AnalyzerProtocol`` ; ``cost`` est facultatif.
+_REQUIRED = ("name", "version", "config", "analyze")
+
+
+def create(name: str, params: Any) -> AnalyzerProtocol:
+    _discover()
+    analyzer = _factories[name](params)
+    missing = [attr for attr in _REQUIRED if not hasattr(analyzer, attr)]
+    if missing:
+        raise TypeError(f"analyzer {name!r} does not implement {missing}")
+    return analyzer
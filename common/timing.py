@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import itertools
+import json
+import math
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+TIMINGS_NAME = "timings.json"
+STAGES_NAME = "stages.txt"
+# Préfixe des histogrammes de spans (étapes), distincts des fonctions perf_timer.
+STAGE_PREFIX = "stage:"
+
+# Buckets logarithmiques : 8 par octave (~9 % de largeur) à partir de 1 µs.
+_BUCKETS_PER_OCTAVE = 8
+_BASE_SECONDS = 1e-6
+PERCENTILES = (0.5, 0.9, 0.99)
+
+
+def _bucket(seconds: float) -> int:
+    if seconds <= _BASE_SECONDS:
+        return 0
+    return int(math.log2(seconds / _BASE_SECONDS) * _BUCKETS_PER_OCTAVE)
+
+
+def _upper_bound(bucket: int) -> float:
+    return float(_BASE_SECONDS * 2 ** ((bucket + 1) / _BUCKETS_PER_OCTAVE))
+
+
+@dataclass
+class TimingHistogram:
+    """Histogramme de durées à buckets logarithmiques, fusionnable."""
+
+    count: int = 0
+    total: float = 0.0
+    min: float = math.inf
+    max: float = 0.0
+    buckets: dict[int, int] = field(default_factory=dict)
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        key = _bucket(seconds)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+
+    def merge(self, other: TimingHistogram) -> None:
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for key, n in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + n
+
+    def percentile(self, q: float) -> float:
+        keys = sorted(self.buckets)
+        cumulative = itertools.accumulate(self.buckets[k] for k in keys)
+        key = next(k for k, seen in zip(keys, cumulative, strict=True) if seen >= q * self.count)
+        return min(max(_upper_bound(key), self.min), self.max)
+
+    def summary(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            "count": self.count,
+            "total_s": self.total,
+            "mean_s": self.total / self.count if self.count else 0.0,
+            "min_s": self.min if self.count else 0.0,
+            "max_s": self.max,
+        }
+        for q in PERCENTILES:
+            out[f"p{round(q * 100)}_s"] = self.percentile(q) if self.count else 0.0
+        return out
+
+
+# Histogrammes du processus courant, par fonction ; les analyzers d'un run
+# peuvent tourner sur plusieurs threads.
+_lock = threading.Lock()
+_histograms: dict[str, TimingHistogram] = {}
+
+
+def record_timing(name: str, seconds: float) -> None:
+    with _lock:
+        hist = _histograms.get(name)
+        if hist is None:
+            hist = _histograms[name] = TimingHistogram()
+        hist.add(seconds)
+
+
+def drain_timings() -> dict[str, TimingHistogram]:
+    """Retourne les histogrammes accumulés depuis le dernier appel et les remet à zéro."""
+    global _histograms
+    with _lock:
+        drained, _histograms = _histograms, {}
+    return drained
+
+
+def merge_timings(into: dict[str, TimingHistogram], other: dict[str, TimingHistogram]) -> None:
+    for name, hist in other.items():
+        into.setdefault(name, TimingHistogram()).merge(hist)
+
+
+@contextmanager
+def span(name: str, enabled: bool = True) -> Iterator[None]:
+    """Mesure un bloc dans l'histogramme ``stage:<name>`` ; sans coût si désactivé."""
+    if not enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_timing(STAGE_PREFIX + name, time.perf_counter() - start)
+
+
+def write_timings(path: Path, timings: dict[str, TimingHistogram]) -> None:
+    functions = {
+        n: h.summary() for n, h in sorted(timings.items()) if not n.startswith(STAGE_PREFIX)
+    }
+    stages = {
+        n[len(STAGE_PREFIX) :]: h.summary()
+        for n, h in sorted(timings.items())
+        if n.startswith(STAGE_PREFIX)
+    }
+    payload: dict[str, Any] = {"functions": functions}
+    if stages:
+        payload["stages"] = stages
+    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+def format_stage_table(timings: dict[str, TimingHistogram], reference: str) -> str:
+    """Tableau texte des étapes, triées par temps total décroissant.
+
+    La part de chaque étape est rapportée au temps total de ``reference``
+    (la fonction qui les contient, p. ex. ``process_run``).
+    """
+    stages = [(n[len(STAGE_PREFIX) :], h) for n, h in timings.items() if n.startswith(STAGE_PREFIX)]
+    stages.sort(key=lambda item: item[1].total, reverse=True)
+    ref = timings.get(reference)
+    denom = ref.total if ref is not None and ref.total > 0 else sum(h.total for _n, h in stages)
+    lines = [
+        f"{'stage':<32} {'count':>8} {'total_s':>10} {'mean_ms':>9} "
+        f"{'p50_ms':>9} {'p99_ms':>9} {'share':>7}"
+    ]
+    for name, h in stages:
+        share = h.total / denom if denom > 0 else 0.0
+        lines.append(
+            f"{name:<32} {h.count:>8} {h.total:>10.3f} {h.total / h.count * 1e3:>9.3f} "
+            f"{h.percentile(0.5) * 1e3:>9.3f} {h.percentile(0.99) * 1e3:>9.3f} {share:>7.1%}"
+        )
+    return "\n".join(lines) + "\n"
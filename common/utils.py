@@ -2,11 +2,19 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import mmap
+import os
 import time
-from collections.abc import Callable
+import zlib
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from pathlib import Path
-from typing import Any, ParamSpec, Protocol, TypeVar, cast
+from typing import Any, ParamSpec, Protocol, TypeVar, cast, runtime_checkable
+
+import numpy as np
+
+from common.timing import record_timing
 
 logger = logging.getLogger("EchoNull")
 if not logger.handlers:
@@ -16,12 +24,43 @@ if not logger.handlers:
     )
 
 
+# Au-delà, le fichier est mappé en mémoire et haché en un seul appel (sans
+# copie, GIL relâché) ; en deçà, file_digest lit dans un buffer réutilisé.
+MMAP_HASH_THRESHOLD = 1 << 20
+
+
 def compute_sha256(path: Path) -> str:
-    sha256 = hashlib.sha256()
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(65536), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+        if os.fstat(f.fileno()).st_size >= MMAP_HASH_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def compute_sha256_many(paths: Sequence[Path], workers: int) -> list[str]:
+    """Hache plusieurs fichiers en parallèle (threads : hashlib relâche le GIL)."""
+    if workers <= 1 or len(paths) <= 1:
+        return [compute_sha256(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(compute_sha256, paths))
+
+
+# "generator" : flux np.random.Generator indépendant par (seed_base, run_id, analyzer).
+# "legacy" : reproduit exactement les sorties historiques basées sur np.random.seed(seed),
+# via un RandomState local (aucun état global modifié).
+RNG_MODES = ("generator", "legacy")
+
+
+def check_rng_mode(mode: str) -> str:
+    if mode not in RNG_MODES:
+        raise ValueError(f"unknown rng mode {mode!r}, expected one of {RNG_MODES}")
+    return mode
+
+
+def analyzer_rng(analyzer: str, run_id: int, seed: int) -> np.random.Generator:
+    seed_base = seed - run_id
+    entropy = [seed_base % (1 << 64), run_id % (1 << 64), zlib.crc32(analyzer.encode("utf-8"))]
+    return np.random.default_rng(np.random.SeedSequence(entropy))
 
 
 P = ParamSpec("P")
@@ -29,18 +68,36 @@ R = TypeVar("R")
 
 
 def perf_timer(func: Callable[P, R]) -> Callable[P, R]:
+    """Enregistre la durée de chaque appel dans l'histogramme de la fonction.
+
+    Pas de log par appel, sauf si le logger EchoNull est au niveau DEBUG.
+    """
+    name = func.__qualname__
+
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
         start = time.perf_counter()
         result = func(*args, **kwargs)
         duration = time.perf_counter() - start
-        logger.info("%s took %.4fs", func.__name__, duration)
+        record_timing(name, duration)
+        logger.debug("%s took %.4fs", name, duration)
         return result
 
     return cast(Callable[P, R], wrapper)
 
 
 class AnalyzerProtocol(Protocol):
+    # Identifiant stable (aussi nom du sous-dossier de sortie) et version de
+    # l'algorithme : à incrémenter dès que les sorties changent pour une même seed.
+    name: str
+    version: str
+    # Coût relatif estimé d'un run (mark_counts = 1) : les plus coûteux sont
+    # lancés en premier quand un run est réparti sur plusieurs threads.
+    # Facultatif : 1.0 si l'analyzer ne le déclare pas.
+    cost: float = 1.0
+
+    def config(self) -> dict[str, Any]: ...
+
     def analyze(
         self,
         run_id: int,
@@ -48,3 +105,18 @@ class AnalyzerProtocol(Protocol):
         data: Any,
         output_dir: Path,
     ) -> dict[str, Any]: ...
+
+
+@runtime_checkable
+class SupportsCacheInputs(Protocol):
+    # Analyzer qui déclare de quoi dépendent ses sorties, outre sa config et le
+    # dataset (p. ex. la seed seule) : le cache peut alors servir un même
+    # résultat à des runs différents. Sans cette méthode : (run_id, seed).
+    def cache_inputs(self, run_id: int, seed: int) -> dict[str, Any]: ...
+
+
+@runtime_checkable
+class SupportsPrefetch(Protocol):
+    # Analyzer capable de calculer un chunk de runs en une passe vectorisée ;
+    # les appels suivants à analyze() pour ces runs réutilisent le résultat.
+    def prefetch(self, run_ids: Sequence[int], seeds: Sequence[int]) -> None: ...
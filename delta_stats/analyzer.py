@@ -1,37 +1,83 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 
-from common.utils import AnalyzerProtocol, perf_timer
+from common.utils import AnalyzerProtocol, analyzer_rng, check_rng_mode, perf_timer
+
+N_DELTAS = 50
+# Colonnes de la table retournée par analyze_batch, dans l'ordre.
+STAT_FIELDS = ("n_deltas", "abs_p50", "abs_p90", "abs_p99", "mad", "max")
+
+
+def _stats_from_row(row: np.ndarray) -> dict[str, Any]:
+    stats: dict[str, Any] = {"n_deltas": int(row[0])}
+    stats.update({k: float(v) for k, v in zip(STAT_FIELDS[1:], row[1:], strict=True)})
+    return stats
 
 
 class DeltaStatsAnalyzer(AnalyzerProtocol):
-    @perf_timer
-    def analyze(self, run_id: int, seed: int, data: Any, output_dir: Path) -> dict[str, Any]:
-        np.random.seed(seed)
+    name = "delta_stats"
+    version = "1"
+    cost = 3.0
+
+    def __init__(self, rng_mode: str = "generator") -> None:
+        self.rng_mode = check_rng_mode(rng_mode)
+        self._prefetched: dict[tuple[int, int], np.ndarray] = {}
+
+    def config(self) -> dict[str, Any]:
+        return {"rng_mode": self.rng_mode}
 
+    def cache_inputs(self, run_id: int, seed: int) -> dict[str, Any]:
+        # En mode legacy, la sortie ne dépend que de la seed.
+        if self.rng_mode == "legacy":
+            return {"seed": seed}
+        return {"run_id": run_id, "seed": seed}
+
+    def _draw(self, run_id: int, seed: int) -> np.ndarray:
         # Deltas très petits avec queue lognormale
-        deltas = np.random.lognormal(mean=-8, sigma=1.5, size=50)
+        if self.rng_mode == "legacy":
+            return np.random.RandomState(seed).lognormal(mean=-8, sigma=1.5, size=N_DELTAS)
+        rng = analyzer_rng(self.name, run_id, seed)
+        return rng.lognormal(mean=-8, sigma=1.5, size=N_DELTAS)
+
+    def analyze_batch(self, run_ids: Sequence[int], seeds: Sequence[int]) -> np.ndarray:
+        """Statistiques de plusieurs runs en une passe : table (len(seeds), len(STAT_FIELDS)).
+
+        Chaque ligne est identique aux valeurs de ``stats.json`` produites par
+        :meth:`analyze` pour le même run.
+        """
+        deltas = np.empty((len(seeds), N_DELTAS))
+        for i, (run_id, seed) in enumerate(zip(run_ids, seeds, strict=True)):
+            deltas[i] = self._draw(run_id, seed)
         abs_deltas = np.abs(deltas)
 
-        p50 = float(np.percentile(abs_deltas, 50))
-        p90 = float(np.percentile(abs_deltas, 90))
-        p99 = float(np.percentile(abs_deltas, 99))
-        mad = float(np.median(np.abs(abs_deltas - np.median(abs_deltas))))
-        mx = float(np.max(abs_deltas))
-
-        stats = {
-            "n_deltas": int(abs_deltas.size),
-            "abs_p50": p50,
-            "abs_p90": p90,
-            "abs_p99": p99,
-            "mad": mad,
-            "max": mx,
-        }
+        table = np.empty((len(seeds), len(STAT_FIELDS)))
+        table[:, 0] = N_DELTAS
+        table[:, 1:4] = np.percentile(abs_deltas, [50, 90, 99], axis=1).T
+        median = np.median(abs_deltas, axis=1, keepdims=True)
+        table[:, 4] = np.median(np.abs(abs_deltas - median), axis=1)
+        table[:, 5] = np.max(abs_deltas, axis=1)
+        return table
+
+    def prefetch(self, run_ids: Sequence[int], seeds: Sequence[int]) -> None:
+        # Les lignes non consommées d'un chunk précédent (runs servis par le
+        # cache) sont abandonnées : la mémoire d'un worker persistant reste bornée.
+        self._prefetched.clear()
+        table = self.analyze_batch(run_ids, seeds)
+        for run_id, seed, row in zip(run_ids, seeds, table, strict=True):
+            self._prefetched[(run_id, seed)] = row
+
+    @perf_timer
+    def analyze(self, run_id: int, seed: int, data: Any, output_dir: Path) -> dict[str, Any]:
+        row = self._prefetched.pop((run_id, seed), None)
+        if row is None:
+            row = self.analyze_batch([run_id], [seed])[0]
+        stats = _stats_from_row(row)
 
         out = output_dir / "delta_stats"
         out.mkdir(parents=True, exist_ok=True)
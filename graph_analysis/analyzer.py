@@ -4,44 +4,152 @@ import json
 from pathlib import Path
 from typing import Any
 
-import networkx as nx
 import numpy as np
 
-from common.utils import AnalyzerProtocol, perf_timer
+from common.utils import AnalyzerProtocol, analyzer_rng, check_rng_mode, perf_timer
+from graph_analysis.engine import (
+    GRAPH_ENGINES,
+    GRAPH_SWEEPS,
+    REFERENCE_NODES,
+    EdgeArray,
+    edge_probability,
+    jaccard,
+    nest,
+    sample_gnp_edges,
+)
+from graph_analysis.reports import REPORT_LAYOUTS, report_filename, write_reports
 
 
 class GraphAnalysisAnalyzer(AnalyzerProtocol):
-    def __init__(self, thresholds: list[float] | None = None):
+    name = "graph_analysis"
+    version = "3"
+
+    def __init__(
+        self,
+        thresholds: list[float] | None = None,
+        rng_mode: str = "generator",
+        n: int = REFERENCE_NODES,
+        engine: str = "networkx",
+        sweep: str = "independent",
+        report_layout: str = "files",
+    ):
+        if engine not in GRAPH_ENGINES:
+            raise ValueError(f"unknown graph engine {engine!r}, expected one of {GRAPH_ENGINES}")
+        if sweep not in GRAPH_SWEEPS:
+            raise ValueError(f"unknown graph sweep {sweep!r}, expected one of {GRAPH_SWEEPS}")
+        if report_layout not in REPORT_LAYOUTS:
+            raise ValueError(
+                f"unknown report layout {report_layout!r}, expected one of {REPORT_LAYOUTS}"
+            )
         self.thresholds = thresholds if thresholds is not None else [0.25, 0.5, 0.7, 0.8]
+        self.rng_mode = check_rng_mode(rng_mode)
+        self.n = n
+        self.engine = engine
+        self.sweep = sweep
+        self.report_layout = report_layout
+        # Mesuré avec benchmarks.suite : networkx est quadratique en n, numpy ~linéaire.
+        per_graph = 1.5 + (240 * (n / 1000) ** 2 if engine == "networkx" else n / 1000)
+        graphs = len(self.thresholds) if sweep == "independent" else 1
+        self.cost = per_graph * max(1, graphs)
+
+    def config(self) -> dict[str, Any]:
+        return {
+            "thresholds": self.thresholds,
+            "rng_mode": self.rng_mode,
+            "n": self.n,
+            "engine": self.engine,
+            "sweep": self.sweep,
+            "report_layout": self.report_layout,
+        }
+
+    def cache_inputs(self, run_id: int, seed: int) -> dict[str, Any]:
+        # En mode legacy, la sortie dépend de la seed et de la parité du run (jaccard).
+        if self.rng_mode == "legacy":
+            return {"seed": seed, "run_parity": run_id % 2}
+        return {"run_id": run_id, "seed": seed}
+
+    def _sample(self, p: float, graph_seed: int) -> EdgeArray:
+        if self.engine == "numpy":
+            return sample_gnp_edges(self.n, p, np.random.default_rng(graph_seed))
+        # networkx n'est chargé que par le moteur qui s'en sert.
+        import networkx as nx
+
+        g = nx.erdos_renyi_graph(n=self.n, p=p, seed=graph_seed)
+        return EdgeArray.from_pairs(g.number_of_nodes(), list(g.edges()))
+
+    def _graphs(self, graph_seed: int) -> list[EdgeArray]:
+        ps = [edge_probability(thr, self.n) for thr in self.thresholds]
+        if self.sweep == "independent" or not ps:
+            return [self._sample(p, graph_seed) for p in ps]
+        # Un seul tirage au seuil le plus dense, puis un passage trié pour tous les seuils.
+        p_max = max(ps)
+        base = self._sample(p_max, graph_seed)
+        return nest(base, p_max, np.random.default_rng([graph_seed, 1])).graphs(ps)
+
+    def _reports(self, graphs: list[EdgeArray]) -> dict[str, dict[str, Any]]:
+        keys = [g.keys() for g in graphs]
+        reports: dict[str, dict[str, Any]] = {}
+        for i, (thr, graph) in enumerate(zip(self.thresholds, graphs, strict=True)):
+            # Jaccard des ensembles d'arêtes : avec le seuil précédent (le premier
+            # seuil est comparé à lui-même) et avec le graphe de référence, celui
+            # du premier seuil.
+            reports[f"{thr:.2f}"] = {
+                "nodes": graph.n,
+                "edges": graph.n_edges,
+                "jaccard": jaccard(keys[max(i - 1, 0)], keys[i]),
+                "jaccard_ref": jaccard(keys[0], keys[i]),
+            }
+        return reports
+
+    def _legacy_reports(
+        self, run_id: int, seed: int, graphs: list[EdgeArray]
+    ) -> dict[str, dict[str, Any]]:
+        # Sorties historiques (pré-version 2) à l'identique : jaccard tiré au
+        # hasard, sans jaccard_ref.
+        rng = np.random.RandomState(seed)
+        return {
+            f"{thr:.2f}": {
+                "nodes": graph.n,
+                "edges": graph.n_edges,
+                "jaccard": 1.0 if run_id % 2 == 0 else float(rng.uniform(0.9, 1.0)),
+            }
+            for thr, graph in zip(self.thresholds, graphs, strict=True)
+        }
 
     @perf_timer
     def analyze(self, run_id: int, seed: int, data: Any, output_dir: Path) -> dict[str, Any]:
-        np.random.seed(seed)
+        graph_seed = seed
+        if self.rng_mode == "generator":
+            graph_seed = int(analyzer_rng(self.name, run_id, seed).integers(1 << 32))
         results: dict[str, Any] = {}
 
         out = output_dir / "graph_analysis"
         out.mkdir(parents=True, exist_ok=True)
 
-        for thr in self.thresholds:
-            g = nx.erdos_renyi_graph(n=10, p=min(0.99, 0.2 + thr / 2), seed=seed)
-            n_nodes = g.number_of_nodes()
-            n_edges = g.number_of_edges()
-
-            # Variance contrôlée pour tests et bench
-            jaccard = 1.0 if run_id % 2 == 0 else float(np.random.uniform(0.9, 1.0))
+        graphs = self._graphs(graph_seed)
+        if self.rng_mode == "legacy":
+            reports = self._legacy_reports(run_id, seed, graphs)
+        else:
+            reports = self._reports(graphs)
 
-            report_path = out / f"thr_{thr:.2f}_report.json"
-            payload = {"nodes": n_nodes, "edges": n_edges, "jaccard": jaccard}
-            report_path.write_text(
-                json.dumps(payload, separators=(",", ":")),
-                encoding="utf-8",
-            )
+        paths: dict[str, Path] = {}
+        if self.report_layout == "jsonl" and reports:
+            consolidated = write_reports(out, reports)
+            paths = dict.fromkeys(reports, consolidated)
+        elif self.report_layout == "files":
+            for key, payload in reports.items():
+                paths[key] = out / report_filename(key)
+                paths[key].write_text(
+                    json.dumps(payload, separators=(",", ":")),
+                    encoding="utf-8",
+                )
 
-            results[f"{thr:.2f}"] = {
-                "n_nodes": n_nodes,
-                "n_edges": n_edges,
-                "jaccard": jaccard,
-                "path": str(report_path),
+        for key, payload in reports.items():
+            results[key] = {
+                "n_nodes": payload["nodes"],
+                "n_edges": payload["edges"],
+                **{k: v for k, v in payload.items() if k.startswith("jaccard")},
+                "path": str(paths[key]),
             }
 
         return {"graph_analysis": results}
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+GRAPH_ENGINES = ("networkx", "numpy")
+# independent : un graphe tiré par seuil ; coupled : graphes emboîtés tirés une seule fois.
+GRAPH_SWEEPS = ("independent", "coupled")
+
+# Taille du graphe historique : la densité est normalisée pour conserver son
+# degré moyen quand n augmente (facteur 1 pour n <= REFERENCE_NODES).
+REFERENCE_NODES = 10
+
+
+def edge_probability(thr: float, n: int) -> float:
+    p = min(0.99, 0.2 + thr / 2)
+    if n > REFERENCE_NODES:
+        p *= (REFERENCE_NODES - 1) / (n - 1)
+    return p
+
+
+def n_pairs(n: int) -> int:
+    return n * (n - 1) // 2
+
+
+def pairs_from_index(k: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Paires ``(u, v)``, ``u < v``, de l'énumération ``k = v * (v - 1) / 2 + u``."""
+    k = np.asarray(k, dtype=np.int64)
+    v = ((1.0 + np.sqrt(1.0 + 8.0 * k)) / 2.0).astype(np.int64)
+    # Correction des arrondis flottants pour les grands k.
+    v -= v * (v - 1) // 2 > k
+    v += (v + 1) * v // 2 <= k
+    return k - v * (v - 1) // 2, v
+
+
+def sample_gnp_indices(n: int, p: float, rng: np.random.Generator) -> np.ndarray:
+    """Indices triés des paires retenues dans G(n, p), par sauts géométriques.
+
+    Coût proportionnel au nombre d'arêtes (et non à n²) : l'écart entre deux
+    paires retenues suit une loi géométrique de paramètre p.
+    """
+    total = n_pairs(n)
+    if total == 0 or p <= 0.0:
+        return np.empty(0, dtype=np.int64)
+    if p >= 1.0:
+        return np.arange(total, dtype=np.int64)
+
+    blocks: list[np.ndarray] = []
+    pos = -1
+    while True:
+        expected = (total - 1 - pos) * p
+        size = int(expected + 4.0 * math.sqrt(expected) + 16)
+        idx = pos + np.cumsum(rng.geometric(p, size=size), dtype=np.int64)
+        kept = idx[idx < total]
+        blocks.append(kept)
+        if kept.size < idx.size:
+            break
+        pos = int(idx[-1])
+    return np.concatenate(blocks)
+
+
+@dataclass(frozen=True)
+class EdgeArray:
+    """Graphe non orienté compact : arêtes ``src[i] < dst[i]``, sans objet par arête."""
+
+    n: int
+    src: np.ndarray
+    dst: np.ndarray
+
+    @property
+    def n_edges(self) -> int:
+        return int(self.src.size)
+
+    @classmethod
+    def from_pairs(cls, n: int, pairs: list[tuple[int, int]]) -> EdgeArray:
+        arr = np.array(pairs, dtype=np.int64).reshape(-1, 2)
+        return cls(n, arr.min(axis=1), arr.max(axis=1))
+
+    def keys(self) -> np.ndarray:
+        """Arêtes encodées ``u * n + v`` (int64), triées : base des calculs ensemblistes."""
+        return np.sort(self.src * self.n + self.dst)
+
+    def to_csr(self) -> tuple[np.ndarray, np.ndarray]:
+        """Représentation CSR symétrique ``(indptr, indices)``."""
+        rows = np.concatenate([self.src, self.dst])
+        cols = np.concatenate([self.dst, self.src])
+        order = np.argsort(rows, kind="stable")
+        indptr = np.zeros(self.n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=self.n), out=indptr[1:])
+        return indptr, cols[order]
+
+
+def intersection_size(a: np.ndarray, b: np.ndarray) -> int:
+    """Taille de l'intersection de deux tableaux triés sans doublons."""
+    if a.size > b.size:
+        a, b = b, a
+    if a.size == 0:
+        return 0
+    pos = np.searchsorted(b, a)
+    pos[pos == b.size] = 0
+    return int(np.count_nonzero(b[pos] == a))
+
+
+def jaccard(a: np.ndarray, b: np.ndarray) -> float:
+    """Similarité de Jaccard entre deux ensembles d'arêtes (clés triées, cf. ``EdgeArray.keys``).
+
+    Deux graphes sans arête sont considérés identiques (1.0).
+    """
+    inter = intersection_size(a, b)
+    union = a.size + b.size - inter
+    return 1.0 if union == 0 else inter / union
+
+
+def sample_gnp_edges(n: int, p: float, rng: np.random.Generator) -> EdgeArray:
+    u, v = pairs_from_index(sample_gnp_indices(n, p, rng))
+    return EdgeArray(n, u, v)
+
+
+@dataclass(frozen=True)
+class NestedGraphs:
+    """Famille couplée de graphes G(n, p) emboîtés, pour tout p <= p_max.
+
+    Chaque arête candidate reçoit une valeur uniforme ; le graphe de
+    probabilité p contient les arêtes de valeur < p. Les arêtes sont stockées
+    triées par valeur : le graphe d'un seuil est un préfixe de ``edges``.
+    """
+
+    edges: EdgeArray
+    weights: np.ndarray
+
+    def counts(self, ps: list[float]) -> np.ndarray:
+        return np.searchsorted(self.weights, np.asarray(ps, dtype=np.float64), side="left")
+
+    def graphs(self, ps: list[float]) -> list[EdgeArray]:
+        # Préfixes (vues, sans copie) du tableau d'arêtes trié.
+        e = self.edges
+        return [EdgeArray(e.n, e.src[:k], e.dst[:k]) for k in self.counts(ps).tolist()]
+
+
+def nest(base: EdgeArray, p_max: float, rng: np.random.Generator) -> NestedGraphs:
+    """Couple les graphes de probabilité <= ``p_max`` à partir de ``base`` ~ G(n, p_max).
+
+    Conditionnellement à sa présence dans ``base``, la valeur uniforme d'une
+    arête est uniforme sur [0, p_max) : il suffit d'un tirage par arête de
+    ``base`` et d'un tri, soit O(E log E) pour tous les seuils.
+    """
+    weights = rng.random(base.n_edges) * p_max
+    order = np.argsort(weights, kind="stable")
+    edges = EdgeArray(base.n, base.src[order], base.dst[order])
+    return NestedGraphs(edges, weights[order])
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+REPORT_LAYOUTS = ("files", "jsonl")
+REPORTS_NAME = "reports.jsonl"
+
+
+def report_filename(thr: str) -> str:
+    return f"thr_{thr}_report.json"
+
+
+def _dumps(payload: dict[str, Any]) -> bytes:
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def write_reports(out: Path, reports: dict[str, dict[str, Any]]) -> Path:
+    """Ecrit tous les rapports d'un run dans un seul fichier ``reports.jsonl``.
+
+    La première ligne est un index ``{thr: [offset, longueur]}`` (offsets
+    relatifs à la fin de cette ligne), suivie d'une ligne JSON par seuil.
+    """
+    lines = [_dumps(payload) + b"\n" for payload in reports.values()]
+    index: dict[str, list[int]] = {}
+    offset = 0
+    for thr, line in zip(reports, lines, strict=True):
+        index[thr] = [offset, len(line) - 1]
+        offset += len(line)
+    path = out / REPORTS_NAME
+    path.write_bytes(_dumps(index) + b"\n" + b"".join(lines))
+    return path
+
+
+def read_report(path: Path, thr: str) -> dict[str, Any]:
+    """Lit le rapport d'un seuil (clé formatée ``"0.25"``).
+
+    ``path`` est le dossier ``graph_analysis`` d'un run, ou le ``path`` d'un
+    résultat. Avec ``reports.jsonl``, seule la ligne d'index et le rapport
+    demandé sont lus.
+    """
+    if path.is_dir():
+        consolidated = path / REPORTS_NAME
+        path = consolidated if consolidated.exists() else path / report_filename(thr)
+    if path.name != REPORTS_NAME:
+        payload: dict[str, Any] = json.loads(path.read_bytes())
+        return payload
+    with path.open("rb") as f:
+        index = json.loads(f.readline())
+        offset, length = index[thr]
+        f.seek(offset, 1)
+        payload = json.loads(f.read(length))
+    return payload
@@ -5,14 +5,31 @@ from typing import Any
 
 import numpy as np
 
-from common.utils import AnalyzerProtocol, perf_timer
+from common.utils import AnalyzerProtocol, analyzer_rng, check_rng_mode, perf_timer
 
 
 class MarkCountsAnalyzer(AnalyzerProtocol):
+    name = "mark_counts"
+    version = "1"
+
+    def __init__(self, rng_mode: str = "generator") -> None:
+        self.rng_mode = check_rng_mode(rng_mode)
+
+    def config(self) -> dict[str, Any]:
+        return {"rng_mode": self.rng_mode}
+
+    def cache_inputs(self, run_id: int, seed: int) -> dict[str, Any]:
+        # En mode legacy, la sortie ne dépend que de la seed.
+        if self.rng_mode == "legacy":
+            return {"seed": seed}
+        return {"run_id": run_id, "seed": seed}
+
     @perf_timer
     def analyze(self, run_id: int, seed: int, data: Any, output_dir: Path) -> dict[str, Any]:
-        np.random.seed(seed)
-        count = int(np.random.randint(1, 5))
+        if self.rng_mode == "legacy":
+            count = int(np.random.RandomState(seed).randint(1, 5))
+        else:
+            count = int(analyzer_rng(self.name, run_id, seed).integers(1, 5))
         out = output_dir / "mark_counts"
         out.mkdir(parents=True, exist_ok=True)
         (out / "count.txt").write_text(str(count), encoding="utf-8")
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import itertools
+import json
+import math
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from fractions import Fraction
+from pathlib import Path
+from typing import Any
+
+from orchestrator.columns import flatten_result
+
+AGGREGATE_NAME = "aggregate.json"
+QUANTILES = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+# Virgule fixe : tout float fini est un multiple entier de 2**-1074.
+_FRACTION_BITS = 1074
+
+
+@dataclass
+class RunningStats:
+    """Moyenne et variance exactes, fusionnables.
+
+    Somme et somme des carrés sont tenues en entiers à virgule fixe, sans
+    arrondi : le résultat ne dépend ni de l'ordre des valeurs ni de leur
+    découpage en chunks (``--workers``, ``--chunk-size``, ``--resume``).
+    """
+
+    count: int = 0
+    total: int = 0
+    total_sq: int = 0
+    min: float = math.inf
+    max: float = -math.inf
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+        num, den = x.as_integer_ratio()
+        shift = _FRACTION_BITS - den.bit_length() + 1
+        self.total += num << shift
+        self.total_sq += (num * num) << (2 * shift)
+
+    def merge(self, other: RunningStats) -> None:
+        self.count += other.count
+        self.total += other.total
+        self.total_sq += other.total_sq
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        return float(Fraction(self.total, self.count << _FRACTION_BITS)) if self.count else 0.0
+
+    @property
+    def variance(self) -> float:
+        # Variance d'échantillon (ddof=1), comme pandas.
+        n = self.count
+        if n < 2:
+            return 0.0
+        m2 = n * self.total_sq - self.total * self.total
+        return float(Fraction(m2, (n * (n - 1)) << (2 * _FRACTION_BITS)))
+
+
+@dataclass
+class QuantileSketch:
+    """Sketch de quantiles à erreur relative bornée (type DDSketch).
+
+    Chaque valeur tombe dans un bucket logarithmique de rapport ``gamma`` :
+    un quantile est estimé à ``alpha`` près en relatif. Le nombre de buckets
+    par signe est borné par ``max_buckets`` (les plus petites magnitudes sont
+    fusionnées au-delà), la mémoire ne dépend donc pas du nombre de valeurs.
+    Deux sketches de mêmes paramètres se fusionnent exactement.
+    """
+
+    alpha: float = 0.01
+    max_buckets: int = 2048
+    zero_count: int = 0
+    positive: dict[int, int] = field(default_factory=dict)
+    negative: dict[int, int] = field(default_factory=dict)
+
+    @property
+    def _ln_gamma(self) -> float:
+        return math.log((1 + self.alpha) / (1 - self.alpha))
+
+    @property
+    def count(self) -> int:
+        return self.zero_count + sum(self.positive.values()) + sum(self.negative.values())
+
+    def add(self, x: float) -> None:
+        if abs(x) < 1e-300:
+            self.zero_count += 1
+            return
+        store = self.positive if x > 0 else self.negative
+        key = math.ceil(math.log(abs(x)) / self._ln_gamma)
+        store[key] = store.get(key, 0) + 1
+        if len(store) > self.max_buckets:
+            self._collapse(store)
+
+    def _collapse(self, store: dict[int, int]) -> None:
+        keys = sorted(store)
+        excess = keys[: len(keys) - self.max_buckets + 1]
+        store[excess[-1]] += sum(store.pop(k) for k in excess[:-1])
+
+    def merge(self, other: QuantileSketch) -> None:
+        if (self.alpha, self.max_buckets) != (other.alpha, other.max_buckets):
+            raise ValueError("cannot merge sketches with different parameters")
+        self.zero_count += other.zero_count
+        for mine, theirs in ((self.positive, other.positive), (self.negative, other.negative)):
+            for key, n in theirs.items():
+                mine[key] = mine.get(key, 0) + n
+            if len(mine) > self.max_buckets:
+                self._collapse(mine)
+
+    def _value(self, key: int) -> float:
+        gamma = math.exp(self._ln_gamma)
+        return 2 * gamma**key / (gamma + 1)
+
+    def _buckets(self) -> Iterator[tuple[float, int]]:
+        # Ordre croissant des valeurs : négatifs par magnitude décroissante, zéro, positifs.
+        for key in sorted(self.negative, reverse=True):
+            yield -self._value(key), self.negative[key]
+        yield 0.0, self.zero_count
+        for key in sorted(self.positive):
+            yield self._value(key), self.positive[key]
+
+    def quantile(self, q: float) -> float:
+        total = self.count
+        if total == 0:
+            return math.nan
+        rank = q * (total - 1)
+        buckets = list(self._buckets())
+        cumulative = itertools.accumulate(n for _value, n in buckets)
+        return buckets[next(i for i, seen in enumerate(cumulative) if seen > rank)][0]
+
+
+@dataclass
+class MetricAggregate:
+    stats: RunningStats = field(default_factory=RunningStats)
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
+
+    def add(self, x: float) -> None:
+        self.stats.add(x)
+        self.sketch.add(x)
+
+    def merge(self, other: MetricAggregate) -> None:
+        self.stats.merge(other.stats)
+        self.sketch.merge(other.sketch)
+
+    def summary(self) -> dict[str, Any]:
+        s = self.stats
+        # Les quantiles approchés sont bornés par les extrêmes exacts.
+        quantiles = {
+            f"p{round(q * 100):02d}": min(max(self.sketch.quantile(q), s.min), s.max)
+            for q in QUANTILES
+        }
+        return {
+            "count": s.count,
+            "mean": s.mean,
+            "variance": s.variance,
+            "std": math.sqrt(s.variance),
+            "min": s.min,
+            "max": s.max,
+            **quantiles,
+        }
+
+
+@dataclass
+class Aggregator:
+    """Agrégats par métrique (cf. :func:`orchestrator.columns.flatten_result`).
+
+    Mémoire constante en nombre de runs ; les agrégats de plusieurs workers
+    se fusionnent avec :meth:`merge`.
+    """
+
+    runs: int = 0
+    metrics: dict[str, MetricAggregate] = field(default_factory=dict)
+
+    def add(self, result: dict[str, Any]) -> None:
+        row = flatten_result(result)
+        del row["run_id"]
+        for name, value in row.items():
+            self.metrics.setdefault(name, MetricAggregate()).add(float(value))
+        self.runs += 1
+
+    def merge(self, other: Aggregator) -> None:
+        for name, metric in other.metrics.items():
+            self.metrics.setdefault(name, MetricAggregate()).merge(metric)
+        self.runs += other.runs
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "metrics": {name: m.summary() for name, m in sorted(self.metrics.items())},
+        }
+
+    def write(self, path: Path) -> None:
+        path.write_text(
+            json.dumps(self.summary(), separators=(",", ":"), ensure_ascii=False),
+            encoding="utf-8",
+        )
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import struct
+import zlib
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, Future
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, NamedTuple
+
+# Date DOS fixe (1980-01-01 00:00) : archives reproductibles d'un sweep à l'autre.
+_DOS_TIME = 0
+_DOS_DATE = (0 << 9) | (1 << 5) | 1
+
+_STORED = 0
+_DEFLATED = 8
+_UTF8_FLAG = 0x800
+# Seuils de bascule en zip64 ; les champs 32/16 bits valent alors leur maximum.
+_ZIP64_LIMIT = 0xFFFFFFFF
+_ZIP64_COUNT_LIMIT = 0xFFFF
+_MAX32 = 0xFFFFFFFF
+_MAX16 = 0xFFFF
+_VERSION_ZIP64 = 45
+_VERSION_MADE_BY = (3 << 8) | _VERSION_ZIP64  # Unix
+_FILE_ATTRS = (0o100644 & 0xFFFF) << 16
+
+
+class ArchiveEntry(NamedTuple):
+    """Entrée de zip déjà compressée, prête à être écrite telle quelle."""
+
+    name: str
+    crc: int
+    size: int
+    method: int
+    payload: bytes
+
+
+def compress_entry(name: str, data: bytes, level: int) -> ArchiveEntry:
+    """Compresse ``data`` en deflate brut (``level`` 1-9) ou le stocke tel quel (0)."""
+    crc = zlib.crc32(data)
+    if level == 0:
+        return ArchiveEntry(name, crc, len(data), _STORED, data)
+    co = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return ArchiveEntry(name, crc, len(data), _DEFLATED, co.compress(data) + co.flush())
+
+
+def iter_tree(root: Path) -> Iterator[tuple[str, Path]]:
+    """Fichiers de ``root`` en ordre déterministe, avec leur nom d'archive (posix)."""
+    for p in sorted(root.rglob("*")):
+        if p.is_file():
+            yield p.relative_to(root).as_posix(), p
+
+
+def compress_tree(root: Path, prefix: str, level: int) -> list[ArchiveEntry]:
+    return [compress_entry(f"{prefix}{name}", p.read_bytes(), level) for name, p in iter_tree(root)]
+
+
+def _compress_file(name: str, path: Path, level: int) -> ArchiveEntry:
+    return compress_entry(name, path.read_bytes(), level)
+
+
+def compress_files(
+    files: Iterable[tuple[str, Path]], level: int, pool: Executor, window: int
+) -> Iterator[ArchiveEntry]:
+    """Compresse ``files`` en parallèle sur ``pool``, entrées rendues dans l'ordre.
+
+    zlib relâche le GIL : un pool de threads suffit. Au plus ``window``
+    fichiers sont en cours à la fois, la mémoire reste bornée.
+    """
+    pending: deque[Future[ArchiveEntry]] = deque()
+    for name, path in files:
+        pending.append(pool.submit(_compress_file, name, path, level))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+class ZipWriter:
+    """Ecrit un zip standard (zip64 si besoin) à partir d'entrées pré-compressées.
+
+    La compression est faite en amont (:func:`compress_entry`), dans les
+    workers ou un pool : l'écriture ne fait que copier des octets.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._fh: BinaryIO | None = None
+        self._central: list[bytes] = []
+        self._offset = 0
+        self.names: set[str] = set()
+
+    def __enter__(self) -> ZipWriter:
+        self._fh = self.path.open("wb")
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        assert self._fh is not None
+        try:
+            if exc_type is None:
+                self._write_central_directory()
+        finally:
+            self._fh.close()
+            self._fh = None
+
+    def add(self, entry: ArchiveEntry) -> None:
+        assert self._fh is not None
+        name = entry.name.encode("utf-8")
+        csize = len(entry.payload)
+        zip64 = entry.size >= _ZIP64_LIMIT or csize >= _ZIP64_LIMIT
+        extra = struct.pack("<HHQQ", 1, 16, entry.size, csize) if zip64 else b""
+        header = struct.pack(
+            "<IHHHHHIIIHH",
+            0x04034B50,
+            _VERSION_ZIP64 if zip64 else 20,
+            _UTF8_FLAG,
+            entry.method,
+            _DOS_TIME,
+            _DOS_DATE,
+            entry.crc,
+            _MAX32 if zip64 else csize,
+            _MAX32 if zip64 else entry.size,
+            len(name),
+            len(extra),
+        )
+        self._fh.write(header + name + extra)
+        self._fh.write(entry.payload)
+        self._central.append(self._central_record(entry, name, csize, self._offset))
+        self.names.add(entry.name)
+        self._offset += len(header) + len(name) + len(extra) + csize
+
+    def add_bytes(self, name: str, data: bytes, level: int) -> None:
+        self.add(compress_entry(name, data, level))
+
+    @staticmethod
+    def _central_record(entry: ArchiveEntry, name: bytes, csize: int, offset: int) -> bytes:
+        sizes = [entry.size, csize, offset]
+        large = [v for v in sizes if v >= _ZIP64_LIMIT]
+        extra = struct.pack(f"<HH{len(large)}Q", 1, 8 * len(large), *large) if large else b""
+        usize_f, csize_f, offset_f = (_MAX32 if v >= _ZIP64_LIMIT else v for v in sizes)
+        record = struct.pack(
+            "<IHHHHHHIIIHHHHHII",
+            0x02014B50,
+            _VERSION_MADE_BY,
+            _VERSION_ZIP64 if large else 20,
+            _UTF8_FLAG,
+            entry.method,
+            _DOS_TIME,
+            _DOS_DATE,
+            entry.crc,
+            csize_f,
+            usize_f,
+            len(name),
+            len(extra),
+            0,
+            0,
+            0,
+            _FILE_ATTRS,
+            offset_f,
+        )
+        return record + name + extra
+
+    def _write_central_directory(self) -> None:
+        assert self._fh is not None
+        cd_offset = self._offset
+        cd = b"".join(self._central)
+        self._fh.write(cd)
+        count = len(self._central)
+        zip64 = count >= _ZIP64_COUNT_LIMIT or len(cd) >= _ZIP64_LIMIT or cd_offset >= _ZIP64_LIMIT
+        if zip64:
+            eocd64_offset = cd_offset + len(cd)
+            self._fh.write(
+                struct.pack(
+                    "<IQHHIIQQQQ",
+                    0x06064B50,
+                    44,
+                    _VERSION_MADE_BY,
+                    _VERSION_ZIP64,
+                    0,
+                    0,
+                    count,
+                    count,
+                    len(cd),
+                    cd_offset,
+                )
+            )
+            self._fh.write(struct.pack("<IIQI", 0x07064B50, 0, eocd64_offset, 1))
+        self._fh.write(
+            struct.pack(
+                "<IHHHHIIH",
+                0x06054B50,
+                0,
+                0,
+                _MAX16 if zip64 else count,
+                _MAX16 if zip64 else count,
+                _MAX32 if zip64 else len(cd),
+                _MAX32 if zip64 else cd_offset,
+                0,
+            )
+        )
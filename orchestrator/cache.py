@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import Any
+
+from common.utils import AnalyzerProtocol, SupportsCacheInputs, logger
+from orchestrator.dataset import dataset_sha256
+
+_OUTPUT_DIR_TOKEN = "${OUTPUT_DIR}"
+_RESULT_NAME = "result.json"
+_FILES_DIR = "files"
+# Éviction dès que le cache a grossi d'une fraction de son budget.
+_EVICT_SLACK = 8
+
+
+def _json_escaped(path: Path) -> str:
+    return json.dumps(str(path), ensure_ascii=False)[1:-1]
+
+
+class ResultCache:
+    """Cache disque adressé par contenu des sorties d'analyzers.
+
+    Une entrée est identifiée par le nom, la version et la config de
+    l'analyzer, le sha256 du dataset et ce dont dépendent ses sorties
+    (``cache_inputs``, à défaut ``(run_id, seed)``). Elle contient le résultat
+    retourné par ``analyze`` et une copie du sous-dossier
+    ``output_dir / analyzer.name`` qu'il a écrit. Les chemins
+    absolus du résultat sont stockés relativement au dossier de sortie et
+    relocalisés à la lecture.
+
+    Les écritures sont atomiques (renommage d'un dossier temporaire), le cache
+    peut donc être partagé entre workers. L'éviction LRU (mtime des entrées,
+    rafraîchi à chaque hit) est faite par :meth:`evict` : en début et en fin de
+    sweep, et pendant le sweep dès que les octets écrits par les workers
+    (:attr:`written`, remontés par chunk) dépassent un huitième du budget.
+    """
+
+    def __init__(self, root: Path, max_bytes: int) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        # Octets des entrées écrites par ce processus (threads d'analyzers compris).
+        self.written = 0
+        self._lock = threading.Lock()
+        # Octets écrits depuis la dernière éviction, tous workers confondus.
+        self._unevicted = 0
+
+    @staticmethod
+    def key(analyzer: AnalyzerProtocol, run_id: int, seed: int, data: Any = None) -> str:
+        if isinstance(analyzer, SupportsCacheInputs):
+            inputs = analyzer.cache_inputs(run_id, seed)
+        else:
+            inputs = {"run_id": run_id, "seed": seed}
+        ident = {
+            "analyzer": analyzer.name,
+            "version": analyzer.version,
+            "config": analyzer.config(),
+            "inputs": inputs,
+            "dataset": dataset_sha256(data) if data is not None else None,
+        }
+        raw = json.dumps(ident, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def get(self, key: str, name: str, output_dir: Path) -> dict[str, Any] | None:
+        entry = self._entry(key)
+        try:
+            raw = (entry / _RESULT_NAME).read_text(encoding="utf-8")
+            dest = output_dir / name
+            shutil.copytree(entry / _FILES_DIR, dest, dirs_exist_ok=True)
+            os.utime(entry)
+        except FileNotFoundError:
+            # Entrée absente ou évincée entre-temps par un autre processus.
+            return None
+        result: dict[str, Any] = json.loads(
+            raw.replace(_OUTPUT_DIR_TOKEN, _json_escaped(output_dir))
+        )
+        return result
+
+    def put(self, key: str, name: str, output_dir: Path, result: dict[str, Any]) -> None:
+        entry = self._entry(key)
+        if entry.exists():
+            return
+        tmp = self.root / f".tmp-{uuid.uuid4().hex}"
+        src = output_dir / name
+        if src.is_dir():
+            shutil.copytree(src, tmp / _FILES_DIR)
+        else:
+            (tmp / _FILES_DIR).mkdir(parents=True)
+        raw = json.dumps(result, separators=(",", ":"), ensure_ascii=False)
+        (tmp / _RESULT_NAME).write_text(
+            raw.replace(_json_escaped(output_dir), _OUTPUT_DIR_TOKEN), encoding="utf-8"
+        )
+        size = sum(p.stat().st_size for p in tmp.rglob("*") if p.is_file())
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            tmp.rename(entry)
+        except OSError:
+            # Un autre worker a écrit la même entrée en premier.
+            shutil.rmtree(tmp, ignore_errors=True)
+            return
+        with self._lock:
+            self.written += size
+
+    def account(self, nbytes: int) -> None:
+        """Compte les octets écrits par un worker ; évince au-delà du seuil."""
+        self._unevicted += nbytes
+        if self._unevicted > self.max_bytes // _EVICT_SLACK:
+            self.evict()
+
+    def evict(self) -> int:
+        self._unevicted = 0
+        entries: list[tuple[int, int, Path]] = []
+        total = 0
+        for entry in self.root.glob("??/*"):
+            size = sum(p.stat().st_size for p in entry.rglob("*") if p.is_file())
+            entries.append((entry.stat().st_mtime_ns, size, entry))
+            total += size
+
+        removed = 0
+        for _mtime, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            removed += 1
+        if removed:
+            logger.info("result cache: evicted %d entries (%d bytes kept)", removed, total)
+        return removed
+
+
+def cached_analyze(
+    cache: ResultCache | None,
+    analyzer: AnalyzerProtocol,
+    run_id: int,
+    seed: int,
+    data: Any,
+    output_dir: Path,
+) -> dict[str, Any]:
+    if cache is None:
+        return analyzer.analyze(run_id, seed, data, output_dir)
+    key = cache.key(analyzer, run_id, seed, data)
+    hit = cache.get(key, analyzer.name, output_dir)
+    if hit is not None:
+        return hit
+    result = analyzer.analyze(run_id, seed, data, output_dir)
+    cache.put(key, analyzer.name, output_dir, result)
+    return result
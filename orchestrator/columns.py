@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import shutil
+import struct
+from pathlib import Path
+from types import TracebackType
+from typing import Any, BinaryIO
+
+COLUMNS_DIR = "columns"
+SCHEMA_NAME = "columns.json"
+
+# En-tête .npy (v1.0) de taille fixe : réécrit en place à la fermeture, une fois
+# le nombre de lignes connu, sans recopier les données.
+_HEADER_SIZE = 128
+_NPY_MAGIC = b"\x93NUMPY\x01\x00"
+
+# type Python -> (dtype NumPy, format struct) ; bool avant int (sous-classe).
+_DTYPES: list[tuple[type, str, str]] = [
+    (bool, "|b1", "?"),
+    (int, "<i8", "<q"),
+    (float, "<f8", "<d"),
+]
+
+
+def _column_type(value: bool | int | float) -> tuple[str, str]:
+    return next((dtype, fmt) for kind, dtype, fmt in _DTYPES if isinstance(value, kind))
+
+
+def _npy_header(dtype: str, rows: int) -> bytes:
+    header = f"{{'descr': '{dtype}', 'fortran_order': False, 'shape': ({rows},), }}"
+    size = _HEADER_SIZE - len(_NPY_MAGIC) - 2
+    return _NPY_MAGIC + struct.pack("<H", size) + header.ljust(size - 1).encode("latin1") + b"\n"
+
+
+def flatten_result(result: dict[str, Any]) -> dict[str, bool | int | float]:
+    """Valeurs scalaires d'un résultat de run, par nom de colonne.
+
+    Les noms suivent l'imbrication de ``results`` (``delta_stats/abs_p99``,
+    ``graph_analysis/0.70/n_edges``) ; les chaînes (chemins) sont ignorées.
+    """
+    row: dict[str, bool | int | float] = {"run_id": result["run_id"]}
+
+    def walk(prefix: str, node: Any) -> None:
+        if isinstance(node, dict):
+            for key, value in node.items():
+                walk(f"{prefix}{key}/", value)
+        elif isinstance(node, bool | int | float):
+            row[prefix[:-1]] = node
+
+    walk("", result["results"])
+    return row
+
+
+class ColumnWriter:
+    """Ecrit, au fil des runs, une colonne ``.npy`` typée par métrique.
+
+    Les colonnes sont fixées par le premier run ; les fichiers sont
+    relisibles en memmap (cf. :mod:`orchestrator.query`). ``columns.json``
+    décrit le schéma et n'est écrit qu'une fois toutes les colonnes complètes.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._files: dict[str, tuple[BinaryIO, struct.Struct]] = {}
+        self._dtypes: dict[str, str] = {}
+        self._rows = 0
+
+    def __enter__(self) -> ColumnWriter:
+        shutil.rmtree(self.root, ignore_errors=True)
+        self.root.mkdir(parents=True)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        try:
+            for name, (fh, _packer) in self._files.items():
+                if exc_type is None:
+                    fh.seek(0)
+                    fh.write(_npy_header(self._dtypes[name], self._rows))
+                fh.close()
+        finally:
+            self._files.clear()
+        if exc_type is None:
+            schema = {"rows": self._rows, "columns": self._dtypes}
+            (self.root / SCHEMA_NAME).write_text(
+                json.dumps(schema, separators=(",", ":")), encoding="utf-8"
+            )
+
+    def _open(self, row: dict[str, bool | int | float]) -> None:
+        for name, value in row.items():
+            dtype, fmt = _column_type(value)
+            path = self.root / f"{name}.npy"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fh = path.open("wb")
+            fh.write(_npy_header(dtype, 0))
+            self._files[name] = (fh, struct.Struct(fmt))
+            self._dtypes[name] = dtype
+
+    def write(self, result: dict[str, Any]) -> None:
+        row = flatten_result(result)
+        if not self._files:
+            self._open(row)
+        elif row.keys() != self._files.keys():
+            raise ValueError(f"run {result['run_id']}: columns differ from the first run")
+        for name, (fh, packer) in self._files.items():
+            fh.write(packer.pack(row[name]))
+        self._rows += 1
+
+    @property
+    def rows(self) -> int:
+        return self._rows
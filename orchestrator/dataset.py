@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import hashlib
+import io
+from pathlib import Path
+from typing import cast
+
+import numpy as np
+
+DATASET_FORMATS = ("csv", "npy")
+DATASET_STEM = "multi"
+
+# Layout canonique : float32 little-endian, C-contigu.
+CANONICAL_DTYPE = np.dtype("<f4")
+
+
+def generate_dataset(seed: int, rows: int = 256, cols: int = 8) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=(rows, cols)).astype(np.float32)
+
+
+def dataset_sha256(data: np.ndarray) -> str:
+    canonical = np.ascontiguousarray(data, dtype=CANONICAL_DTYPE)
+    return hashlib.sha256(canonical.data).hexdigest()
+
+
+def dataset_filename(fmt: str) -> str:
+    if fmt not in DATASET_FORMATS:
+        raise ValueError(f"unknown dataset format {fmt!r}, expected one of {DATASET_FORMATS}")
+    return f"{DATASET_STEM}.{fmt}"
+
+
+def _encode_csv(data: np.ndarray) -> bytes:
+    # pandas n'est chargé que pour le format CSV.
+    import pandas as pd
+
+    df = pd.DataFrame(data, columns=[f"c{i}" for i in range(data.shape[1])])
+    return cast(str, df.to_csv(index=False)).encode("utf-8")
+
+
+def _encode_npy(data: np.ndarray) -> bytes:
+    buf = io.BytesIO()
+    np.save(buf, np.ascontiguousarray(data, dtype=CANONICAL_DTYPE), allow_pickle=False)
+    return buf.getvalue()
+
+
+def write_dataset(run_dir: Path, data: np.ndarray, fmt: str = "csv") -> tuple[str, str]:
+    """Ecrit le dataset dans ``run_dir`` et retourne ``(nom, sha256)`` du fichier.
+
+    Le hash est calculé sur les octets en mémoire, sans relire le fichier.
+    """
+    name = dataset_filename(fmt)
+    payload = _encode_csv(data) if fmt == "csv" else _encode_npy(data)
+    run_dir.mkdir(parents=True, exist_ok=True)
+    (run_dir / name).write_bytes(payload)
+    return name, hashlib.sha256(payload).hexdigest()
+
+
+def load_dataset(path: Path, mmap: bool = True) -> np.ndarray:
+    """Recharge un dataset écrit par :func:`write_dataset`.
+
+    Les fichiers ``.npy`` sont mappés en mémoire (lecture seule, sans copie)
+    quand ``mmap`` est vrai.
+    """
+    if path.suffix == ".npy":
+        loaded = np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+        return cast(np.ndarray, loaded)
+    import pandas as pd
+
+    return cast(np.ndarray, pd.read_csv(path).to_numpy(dtype=np.float32))
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from common.utils import compute_sha256
+
+INDEX_NAME = "index.jsonl"
+
+
+def _dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+class CompletionIndex:
+    """Index de complétion append-only (``index.jsonl``) d'un dossier de sortie.
+
+    La première ligne décrit la configuration du sweep ; chaque ligne suivante
+    correspond à un run terminé : ``run_id``, ``seed`` et ``hashes`` des
+    artefacts, de quoi vérifier un run sans relire son résultat. Le résultat
+    lui-même est relu dans l'overview précédent à la reprise. En cas de
+    doublon, la dernière ligne d'un run fait foi.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._fh: BinaryIO | None = None
+        self._reader: BinaryIO | None = None
+        self._offsets: dict[int, int] = {}
+
+    def open(self, config: dict[str, Any], resume: bool) -> None:
+        header = {"config": config}
+        if resume and self._load(header):
+            self._fh = self.path.open("ab")
+        else:
+            self._offsets = {}
+            self._fh = self.path.open("wb")
+            self._fh.write(_dumps(header))
+            self._fh.flush()
+        self._reader = self.path.open("rb")
+
+    def close(self) -> None:
+        for fh in (self._fh, self._reader):
+            if fh is not None:
+                fh.close()
+        self._fh = self._reader = None
+
+    def _load(self, header: dict[str, Any]) -> bool:
+        if not self.path.exists():
+            return False
+        offsets: dict[int, int] = {}
+        with self.path.open("r+b") as f:
+            first = f.readline()
+            if not first.endswith(b"\n") or json.loads(first) != json.loads(_dumps(header)):
+                return False
+            offset = f.tell()
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Ligne tronquée par une interruption : on la coupe avant d'ajouter.
+                    f.truncate(offset)
+                    break
+                offsets[int(json.loads(line)["run_id"])] = offset
+                offset += len(line)
+        self._offsets = offsets
+        return True
+
+    def read(self, run_id: int) -> dict[str, Any]:
+        assert self._reader is not None
+        self._reader.seek(self._offsets[run_id])
+        entry: dict[str, Any] = json.loads(self._reader.readline())
+        return entry
+
+    def verified(
+        self,
+        run_ids: Iterable[int],
+        seed_for: Callable[[int], int],
+        run_dir_for: Callable[[int], Path],
+    ) -> set[int]:
+        ok: set[int] = set()
+        for run_id in run_ids:
+            if run_id not in self._offsets:
+                continue
+            entry = self.read(run_id)
+            if entry["seed"] != seed_for(run_id):
+                continue
+            run_dir = run_dir_for(run_id)
+            if all(
+                (run_dir / name).is_file() and compute_sha256(run_dir / name) == digest
+                for name, digest in entry["hashes"].items()
+            ):
+                ok.add(run_id)
+        return ok
+
+    def append(self, seed: int, result: dict[str, Any]) -> None:
+        assert self._fh is not None
+        self._offsets[int(result["run_id"])] = self._fh.tell()
+        entry = {"run_id": result["run_id"], "seed": seed, "hashes": result["hashes"]}
+        self._fh.write(_dumps(entry))
+        self._fh.flush()
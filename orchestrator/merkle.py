@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import hashlib
+
+MERKLE_EMPTY = hashlib.sha256(b"").hexdigest()
+
+
+def run_digest(hashes: dict[str, str]) -> str:
+    """Feuille de l'arbre pour un run : hash de ses artefacts ``nom -> sha256``."""
+    lines = "".join(f"{name}\0{digest}\n" for name, digest in sorted(hashes.items()))
+    return hashlib.sha256(lines.encode("utf-8")).hexdigest()
+
+
+def _node(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+class MerkleBuilder:
+    """Racine de Merkle (construction RFC 6962) calculée au fil des feuilles.
+
+    Seuls les sous-arbres complets en attente sont gardés (O(log n)). Un
+    sous-ensemble de runs se vérifie indépendamment des autres, puis la
+    racine se recalcule à partir des feuilles.
+    """
+
+    def __init__(self) -> None:
+        self._peaks: list[tuple[int, bytes]] = []
+        self.count = 0
+
+    def add(self, leaf: str) -> None:
+        size, node = 1, hashlib.sha256(b"\x00" + bytes.fromhex(leaf)).digest()
+        while self._peaks and self._peaks[-1][0] == size:
+            _size, left = self._peaks.pop()
+            size, node = size * 2, _node(left, node)
+        self._peaks.append((size, node))
+        self.count += 1
+
+    def root(self) -> str:
+        if not self._peaks:
+            return MERKLE_EMPTY
+        node = self._peaks[-1][1]
+        for _size, left in reversed(self._peaks[:-1]):
+            node = _node(left, node)
+        return node.hex()
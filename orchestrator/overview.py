@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Generator
+from pathlib import Path
+from types import TracebackType
+from typing import Any, BinaryIO
+
+OVERVIEW_NAME = "overview.json"
+# Overview du sweep précédent, relu par --resume pour les runs déjà faits.
+PREVIOUS_OVERVIEW_NAME = "overview.prev.json"
+_READ_CHUNK = 1 << 20
+
+
+class OverviewWriter:
+    """Ecrit overview.json entrée par entrée et hache les octets au fil de l'eau.
+
+    Le fichier produit est identique octet pour octet à
+    ``json.dumps(results, separators=(",", ":"), ensure_ascii=False)``.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._sha256 = hashlib.sha256()
+        self._fh: BinaryIO | None = None
+        self._count = 0
+
+    def __enter__(self) -> OverviewWriter:
+        self._fh = self.path.open("wb")
+        self._emit(b"[")
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        assert self._fh is not None
+        try:
+            if exc_type is None:
+                self._emit(b"]")
+        finally:
+            self._fh.close()
+            self._fh = None
+
+    def write(self, result: dict[str, Any]) -> None:
+        chunk = json.dumps(result, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        if self._count:
+            chunk = b"," + chunk
+        self._emit(chunk)
+        self._count += 1
+
+    def _emit(self, chunk: bytes) -> None:
+        assert self._fh is not None
+        self._fh.write(chunk)
+        self._fh.flush()
+        self._sha256.update(chunk)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sha256(self) -> str:
+        return self._sha256.hexdigest()
+
+
+def read_overview(path: Path) -> Generator[dict[str, Any], None, None]:
+    """Relit en flux les entrées d'un overview.json, dans l'ordre.
+
+    Un fichier tronqué (sweep interrompu) donne ses entrées complètes ; la
+    lecture s'arrête à la première entrée incomplète.
+    """
+    decoder = json.JSONDecoder()
+    with path.open("r", encoding="utf-8") as fh:
+        buf = fh.read(_READ_CHUNK)
+        if not buf.startswith("["):
+            return
+        pos, eof = 1, False
+        while True:
+            if len(buf) - pos < 2 and not eof:
+                more = fh.read(_READ_CHUNK)
+                eof = not more
+                buf, pos = buf[pos:] + more, 0
+            if buf.startswith("]", pos):
+                return
+            start = pos + 1 if buf.startswith(",", pos) else pos
+            try:
+                entry, end = decoder.raw_decode(buf, start)
+            except json.JSONDecodeError:
+                if eof:
+                    return
+                more = fh.read(_READ_CHUNK)
+                eof = not more
+                buf, pos = buf[pos:] + more, 0
+                continue
+            yield entry
+            pos = end
+
+
+def stash_overview(out: Path) -> Path:
+    """Met de côté l'overview du sweep précédent avant sa réécriture.
+
+    Si une reprise a elle-même été interrompue, son ``overview.json`` partiel
+    couvre les premiers runs et l'ancien overview mis de côté la suite : les
+    deux sont fusionnés, dans l'ordre des runs.
+    """
+    current = out / OVERVIEW_NAME
+    previous = out / PREVIOUS_OVERVIEW_NAME
+    if not current.exists():
+        return previous
+    if not previous.exists():
+        current.replace(previous)
+        return previous
+    merged = previous.with_suffix(".tmp")
+    with OverviewWriter(merged) as writer:
+        last = 0
+        for entry in read_overview(current):
+            writer.write(entry)
+            last = entry["run_id"]
+        for entry in read_overview(previous):
+            if entry["run_id"] > last:
+                writer.write(entry)
+    merged.replace(previous)
+    current.unlink()
+    return previous
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import cProfile
+import os
+import pstats
+import shutil
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from common.timing import STAGES_NAME
+
+PROFILES_DIR = "profiles"
+PROFILE_NAME = "profile.prof"
+PROFILE_REPORT_NAME = "profile.txt"
+
+
+@contextmanager
+def chunk_profiler(enabled: bool, out: Path, first_run: int) -> Iterator[None]:
+    """Profile (cProfile) le thread courant et écrit un ``.prof`` par chunk.
+
+    Les fichiers sont fusionnables avec :func:`merge_profiles` ou
+    ``pstats.Stats(*paths)``.
+    """
+    if not enabled:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profile_dir = out / PROFILES_DIR
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(profile_dir / f"runs_{first_run:06d}_pid{os.getpid()}.prof")
+
+
+def reset_profiles(out: Path) -> None:
+    """Efface profils et rapports d'un sweep précédent, pour ne pas les archiver."""
+    shutil.rmtree(out / PROFILES_DIR, ignore_errors=True)
+    for name in (PROFILE_NAME, PROFILE_REPORT_NAME, STAGES_NAME):
+        (out / name).unlink(missing_ok=True)
+
+
+def merge_profiles(out: Path, top: int = 40) -> Path | None:
+    """Fusionne les profils des chunks dans ``profile.prof`` et ``profile.txt`` (tri cumulatif)."""
+    paths = sorted((out / PROFILES_DIR).glob("*.prof"))
+    if not paths:
+        return None
+    merged = out / PROFILE_NAME
+    pstats.Stats(*(str(p) for p in paths)).dump_stats(merged)
+    with (out / PROFILE_REPORT_NAME).open("w", encoding="utf-8") as fh:
+        pstats.Stats(str(merged), stream=fh).sort_stats("cumulative").print_stats(top)
+    return merged
@@ -0,0 +1,41 @@
+"""Lecture des colonnes écrites par un sweep (``<out>/columns``).
+
+Exemple, p99 de ``abs_p99`` sur tous les runs::
+
+    from orchestrator import query
+
+    col = query.load_column(out, "delta_stats/abs_p99")
+    np.percentile(col, 99)
+
+Seules les colonnes demandées sont lues ; par défaut elles sont mappées en
+mémoire (lecture seule, sans copie). La ligne ``i`` de chaque colonne
+correspond au run ``load_column(out, "run_id")[i]``.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from pathlib import Path
+from typing import cast
+
+import numpy as np
+
+from orchestrator.columns import COLUMNS_DIR, SCHEMA_NAME
+
+
+def list_columns(out: Path) -> dict[str, str]:
+    """Colonnes disponibles et leur dtype NumPy."""
+    schema = json.loads((out / COLUMNS_DIR / SCHEMA_NAME).read_text(encoding="utf-8"))
+    return cast(dict[str, str], schema["columns"])
+
+
+def load_column(out: Path, name: str, mmap: bool = True) -> np.ndarray:
+    path = out / COLUMNS_DIR / f"{name}.npy"
+    if not path.is_file():
+        raise KeyError(f"unknown column {name!r}")
+    return cast(np.ndarray, np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False))
+
+
+def load_columns(out: Path, names: Iterable[str], mmap: bool = True) -> dict[str, np.ndarray]:
+    return {name: load_column(out, name, mmap) for name in names}
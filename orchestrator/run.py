@@ -2,20 +2,69 @@ from __future__ import annotations
 
 import argparse
 import json
+import math
 import os
-import zipfile
-from concurrent.futures import ProcessPoolExecutor
-from dataclasses import dataclass
+import shutil
+import sys
+import tempfile
+from collections import deque
+from collections.abc import Generator, Iterable, Iterator, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field, replace
 from pathlib import Path
+from types import TracebackType
 from typing import Any
 
-import numpy as np
-import pandas as pd
-
-from common.utils import compute_sha256, perf_timer
-from delta_stats.analyzer import DeltaStatsAnalyzer
-from graph_analysis.analyzer import GraphAnalysisAnalyzer
-from mark_counts.analyzer import MarkCountsAnalyzer
+from common import registry
+from common.timing import (
+    STAGES_NAME,
+    TIMINGS_NAME,
+    TimingHistogram,
+    drain_timings,
+    format_stage_table,
+    merge_timings,
+    span,
+    write_timings,
+)
+from common.utils import (
+    RNG_MODES,
+    AnalyzerProtocol,
+    SupportsPrefetch,
+    compute_sha256,
+    compute_sha256_many,
+    logger,
+    perf_timer,
+)
+from graph_analysis.engine import GRAPH_ENGINES, GRAPH_SWEEPS, REFERENCE_NODES
+from graph_analysis.reports import REPORT_LAYOUTS
+from orchestrator.aggregate import AGGREGATE_NAME, Aggregator
+from orchestrator.archive import (
+    ArchiveEntry,
+    ZipWriter,
+    compress_files,
+    compress_tree,
+    iter_tree,
+)
+from orchestrator.cache import ResultCache, cached_analyze
+from orchestrator.columns import COLUMNS_DIR, ColumnWriter
+from orchestrator.dataset import (
+    DATASET_FORMATS,
+    dataset_sha256,
+    generate_dataset,
+    write_dataset,
+)
+from orchestrator.index import INDEX_NAME, CompletionIndex
+from orchestrator.merkle import MerkleBuilder, run_digest
+from orchestrator.overview import (
+    OVERVIEW_NAME,
+    PREVIOUS_OVERVIEW_NAME,
+    OverviewWriter,
+    read_overview,
+    stash_overview,
+)
+from orchestrator.profiling import chunk_profiler, merge_profiles, reset_profiles
+from orchestrator.verify import verify_main
 
 
 @dataclass(frozen=True)
@@ -26,75 +75,710 @@ class Params:
     seed_base: int
     workers: int
     zip_out: bool
+    chunk_size: int | None = None
+    collect_results: bool = True
+    write_dataset: bool = True
+    dataset_format: str = "csv"
+    dataset_shape: tuple[int, int] = (256, 8)
+    resume: bool = False
+    cache_dir: Path | None = None
+    cache_max_bytes: int = 1 << 30
+    rng_mode: str = "generator"
+    analyzer_threads: int = 1
+    graph_nodes: int = REFERENCE_NODES
+    graph_engine: str = "networkx"
+    graph_sweep: str = "independent"
+    graph_report_layout: str = "files"
+    zip_only: bool = False
+    zip_level: int = 6
+    profile_stages: bool = False
+    cprofile: bool = False
+    # Noms du registre (common.registry) ; None : tous les analyzers enregistrés.
+    analyzers: tuple[str, ...] | None = None
+    exclude_analyzers: tuple[str, ...] = ()
 
+    def seed_for(self, run_id: int) -> int:
+        return self.seed_base + run_id
 
-def _generate_dataset_csv(path: Path, seed: int, rows: int = 256, cols: int = 8) -> None:
-    rng = np.random.default_rng(seed)
-    data = rng.normal(size=(rows, cols)).astype(np.float32)
-    df = pd.DataFrame(data, columns=[f"c{i}" for i in range(cols)])
-    path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(path, index=False)
+    def run_dir(self, run_id: int) -> Path:
+        return self.out / f"run_{run_id:04d}"
 
 
-@perf_timer
-def process_run(run_id: int, params: Params) -> dict[str, Any]:
-    seed = params.seed_base + run_id
-    run_dir = params.out / f"run_{run_id:04d}"
-    run_dir.mkdir(parents=True, exist_ok=True)
+# Champs sans effet sur le contenu d'un run : exclus de l'empreinte de config
+# utilisée pour décider si un index de complétion peut être repris.
+_SCHEDULING_FIELDS = frozenset(
+    {
+        "runs",
+        "out",
+        "workers",
+        "zip_out",
+        "chunk_size",
+        "collect_results",
+        "resume",
+        "cache_dir",
+        "cache_max_bytes",
+        "analyzer_threads",
+        "zip_only",
+        "zip_level",
+        "profile_stages",
+        "cprofile",
+    }
+)
+
+
+def _config_fingerprint(params: Params) -> dict[str, Any]:
+    config = {k: v for k, v in asdict(params).items() if k not in _SCHEDULING_FIELDS}
+    # La sélection effective, quelle que soit la façon de l'exprimer.
+    del config["exclude_analyzers"]
+    config["analyzers"] = selected_analyzers(params)
+    return config
+
+
+def _result_cache(params: Params) -> ResultCache | None:
+    if params.cache_dir is None:
+        return None
+    return ResultCache(params.cache_dir, params.cache_max_bytes)
+
+
+def _graph_analysis(params: Params) -> AnalyzerProtocol:
+    from graph_analysis.analyzer import GraphAnalysisAnalyzer
+
+    return GraphAnalysisAnalyzer(
+        params.thresholds,
+        rng_mode=params.rng_mode,
+        n=params.graph_nodes,
+        engine=params.graph_engine,
+        sweep=params.graph_sweep,
+        report_layout=params.graph_report_layout,
+    )
+
+
+def _delta_stats(params: Params) -> AnalyzerProtocol:
+    from delta_stats.analyzer import DeltaStatsAnalyzer
+
+    return DeltaStatsAnalyzer(rng_mode=params.rng_mode)
+
+
+def _mark_counts(params: Params) -> AnalyzerProtocol:
+    from mark_counts.analyzer import MarkCountsAnalyzer
+
+    return MarkCountsAnalyzer(rng_mode=params.rng_mode)
+
+
+# Dans l'ordre d'exécution : le module d'un analyzer n'est importé qu'à sa
+# construction (démarrage du CLI et des workers plus léger).
+registry.register("graph_analysis", _graph_analysis)
+registry.register("delta_stats", _delta_stats)
+registry.register("mark_counts", _mark_counts)
+
+
+def selected_analyzers(params: Params) -> list[str]:
+    return registry.select(params.analyzers, params.exclude_analyzers)
+
+
+def _build_analyzers(params: Params) -> list[AnalyzerProtocol]:
+    return [registry.create(name, params) for name in selected_analyzers(params)]
+
+
+def _analyzer_key(params: Params) -> str:
+    # Une fabrique peut lire n'importe quel champ de contenu des paramètres
+    # (hors planification) : tous font partie de la clé.
+    return json.dumps(_config_fingerprint(params), sort_keys=True, default=str)
+
+
+# Analyzers déjà construits dans ce processus, par configuration : un worker
+# les garde d'un chunk (et d'un sweep) à l'autre.
+_WARM_LIMIT = 8
+_warm: dict[str, list[AnalyzerProtocol]] = {}
+
+
+def _warm_analyzers(params: Params) -> list[AnalyzerProtocol]:
+    key = _analyzer_key(params)
+    analyzers = _warm.get(key)
+    if analyzers is None:
+        if len(_warm) >= _WARM_LIMIT:
+            _warm.pop(next(iter(_warm)))
+        analyzers = _warm[key] = _build_analyzers(params)
+    return analyzers
+
+
+def _init_worker(params: Params | None) -> None:
+    # Initializer du pool : imports et construction des analyzers une fois par worker.
+    if params is not None:
+        _warm_analyzers(params)
+
 
-    dataset_path = run_dir / "multi.csv"
-    _generate_dataset_csv(dataset_path, seed=seed)
+class SweepPool:
+    """Pool de workers réutilisable par plusieurs appels à :func:`run`.
 
-    analyzers = [
-        GraphAnalysisAnalyzer(params.thresholds),
-        DeltaStatsAnalyzer(),
-        MarkCountsAnalyzer(),
-    ]
+    Chaque worker construit ses analyzers au démarrage (pour ``params``) et
+    les réutilise pour tous les chunks qu'il reçoit ; un sweep de
+    configuration différente construit les siens au premier chunk.
 
+        with SweepPool(workers=4, params=params) as pool:
+            for p in sweeps:
+                run(p, pool=pool)
+    """
+
+    def __init__(self, workers: int, params: Params | None = None) -> None:
+        self.workers = max(1, workers)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_init_worker, initargs=(params,)
+        )
+
+    def submit(self, run_ids: Sequence[int], params: Params) -> Future[ChunkResult]:
+        return self._executor.submit(process_chunk, run_ids, params)
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+    def __enter__(self) -> SweepPool:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def _analyzer_threads(params: Params) -> AbstractContextManager[Executor | None]:
+    if params.analyzer_threads > 1:
+        return ThreadPoolExecutor(max_workers=params.analyzer_threads)
+    return nullcontext()
+
+
+def _analyze(
+    stages: bool,
+    cache: ResultCache | None,
+    analyzer: AnalyzerProtocol,
+    run_id: int,
+    seed: int,
+    data: Any,
+    run_dir: Path,
+) -> dict[str, Any]:
+    with span(f"analyzer:{analyzer.name}", stages):
+        return cached_analyze(cache, analyzer, run_id, seed, data, run_dir)
+
+
+def _run_analyzers(
+    threads: Executor | None,
+    stages: bool,
+    cache: ResultCache | None,
+    analyzers: list[AnalyzerProtocol],
+    run_id: int,
+    seed: int,
+    data: Any,
+    run_dir: Path,
+) -> dict[str, Any]:
     results: dict[str, Any] = {}
-    for analyzer in analyzers:
-        results.update(analyzer.analyze(run_id, seed, None, run_dir))
+    if threads is None:
+        for analyzer in analyzers:
+            results.update(_analyze(stages, cache, analyzer, run_id, seed, data, run_dir))
+        return results
+    # Les plus coûteux d'abord, pour que le dernier à finir démarre au plus tôt.
+    # Chaque analyzer écrit dans son sous-dossier ; fusion dans l'ordre déclaré.
+    futures = {
+        i: threads.submit(_analyze, stages, cache, analyzers[i], run_id, seed, data, run_dir)
+        for i in sorted(range(len(analyzers)), key=lambda i: -_cost(analyzers[i]))
+    }
+    for i in range(len(analyzers)):
+        results.update(futures[i].result())
+    return results
+
+
+def _cost(analyzer: AnalyzerProtocol) -> float:
+    # Un analyzer structurel (entry point sans héritage) peut ne pas déclarer
+    # de coût : le défaut du Protocol ne s'applique qu'aux sous-classes.
+    return float(getattr(analyzer, "cost", 1.0))
+
+
+@perf_timer
+def process_run(
+    run_id: int,
+    params: Params,
+    analyzers: list[AnalyzerProtocol] | None = None,
+    threads: Executor | None = None,
+    cache: ResultCache | None = None,
+) -> dict[str, Any]:
+    seed = params.seed_for(run_id)
+    run_dir = params.run_dir(run_id)
+    stages = params.profile_stages
+    with span("mkdir", stages):
+        # Le dossier ne contient que les artefacts de ce run : tous sont hachés.
+        shutil.rmtree(run_dir, ignore_errors=True)
+        run_dir.mkdir(parents=True)
+
+    with span("generate_dataset", stages):
+        data = generate_dataset(seed, *params.dataset_shape)
+
+    if analyzers is None:
+        analyzers = _warm_analyzers(params)
+
+    if cache is None:
+        cache = _result_cache(params)
+    owned = _analyzer_threads(params) if threads is None else nullcontext(threads)
+    with owned as pool:
+        results = _run_analyzers(pool, stages, cache, analyzers, run_id, seed, data, run_dir)
+
+    known: dict[str, str] = {}
+    if params.write_dataset:
+        with span("write_dataset", stages):
+            name, digest = write_dataset(run_dir, data, params.dataset_format)
+        known[name] = digest
+    with span("hash", stages):
+        # Le dataset est déjà haché en mémoire, sans relecture.
+        hashes = {name: known.get(name) or compute_sha256(p) for name, p in iter_tree(run_dir)}
+        data_digest = dataset_sha256(data)
+    return {
+        "run_id": run_id,
+        "results": results,
+        "hashes": hashes,
+        "dataset_sha256": data_digest,
+    }
+
+
+@dataclass
+class ChunkResult:
+    results: list[dict[str, Any]] = field(default_factory=list)
+    # Entrées d'archive pré-compressées de chaque run (mode zip_only uniquement).
+    entries: list[list[ArchiveEntry]] = field(default_factory=list)
+    # Agrégats partiels du chunk, fusionnés par le processus principal.
+    aggregate: Aggregator = field(default_factory=Aggregator)
+    # Histogrammes perf_timer du worker pour ce chunk.
+    timings: dict[str, TimingHistogram] = field(default_factory=dict)
+    # Octets ajoutés au cache de résultats, pour l'éviction pendant le sweep.
+    cache_bytes: int = 0
+
+
+@contextmanager
+def _scratch_dir(params: Params) -> Iterator[Path | None]:
+    if not params.zip_only:
+        yield None
+        return
+    with tempfile.TemporaryDirectory(prefix="echonull-") as tmp:
+        yield Path(tmp)
+
+
+def _relocate(result: dict[str, Any], old: Path, new: Path) -> dict[str, Any]:
+    def esc(p: Path) -> str:
+        return json.dumps(str(p), ensure_ascii=False)[1:-1]
+
+    raw = json.dumps(result, ensure_ascii=False).replace(esc(old), esc(new))
+    relocated: dict[str, Any] = json.loads(raw)
+    return relocated
+
+
+def process_chunk(run_ids: Sequence[int], params: Params) -> ChunkResult:
+    # Ecarte les mesures héritées du parent (fork) ou d'un chunk précédent.
+    drain_timings()
+    with chunk_profiler(params.cprofile, params.out, run_ids[0]):
+        chunk = _process_chunk(run_ids, params)
+    chunk.timings = drain_timings()
+    return chunk
 
-    hashes = {"multi.csv": compute_sha256(dataset_path)}
-    return {"run_id": run_id, "results": results, "hashes": hashes}
+
+def _process_chunk(run_ids: Sequence[int], params: Params) -> ChunkResult:
+    analyzers = _warm_analyzers(params)
+    seeds = [params.seed_for(run_id) for run_id in run_ids]
+    with span("prefetch", params.profile_stages):
+        for analyzer in analyzers:
+            if isinstance(analyzer, SupportsPrefetch):
+                analyzer.prefetch(run_ids, seeds)
+
+    chunk = ChunkResult()
+    cache = _result_cache(params)
+    with _analyzer_threads(params) as threads, _scratch_dir(params) as scratch:
+        # Avec une archive, chaque run est compressé par le worker dès qu'il est
+        # terminé. En mode zip_only, il est écrit dans un dossier de travail
+        # temporaire, supprimé aussitôt compressé.
+        run_params = params if scratch is None else replace(params, out=scratch)
+        for run_id in run_ids:
+            result = process_run(run_id, run_params, analyzers, threads, cache)
+            entries: list[ArchiveEntry] = []
+            if params.zip_out or params.zip_only:
+                run_dir = run_params.run_dir(run_id)
+                with span("compress", params.profile_stages):
+                    entries = compress_tree(run_dir, f"{run_dir.name}/", params.zip_level)
+            if scratch is not None:
+                shutil.rmtree(run_params.run_dir(run_id))
+                result = _relocate(result, scratch, params.out)
+            chunk.results.append(result)
+            chunk.entries.append(entries)
+            chunk.aggregate.add(result)
+    if cache is not None:
+        chunk.cache_bytes = cache.written
+    return chunk
+
+
+# Plafond de la taille de chunk automatique : avec une fenêtre de 2 chunks par
+# worker, au plus 2 * workers * _MAX_AUTO_CHUNK runs sont en mémoire.
+_MAX_AUTO_CHUNK = 64
+
+
+def _auto_chunk_size(runs: int, workers: int) -> int:
+    # ~4 chunks par worker : assez pour équilibrer la charge, peu d'IPC.
+    return max(1, min(_MAX_AUTO_CHUNK, math.ceil(runs / (max(1, workers) * 4))))
+
+
+def _iter_chunks(run_ids: range, chunk_size: int) -> Iterator[range]:
+    for start in range(0, len(run_ids), chunk_size):
+        yield run_ids[start : start + chunk_size]
+
+
+def _contiguous_ranges(run_ids: Iterable[int]) -> Iterator[range]:
+    start: int | None = None
+    prev = 0
+    for run_id in run_ids:
+        if start is None:
+            start = run_id
+        elif run_id != prev + 1:
+            yield range(start, prev + 1)
+            start = run_id
+        prev = run_id
+    if start is not None:
+        yield range(start, prev + 1)
 
 
 def build_parser() -> argparse.ArgumentParser:
-    p = argparse.ArgumentParser(prog="echonull-orchestrator", description="EchoNull sweep runner")
+    p = argparse.ArgumentParser(
+        prog="echonull-orchestrator",
+        description="EchoNull sweep runner",
+        epilog="sous-commande : verify TARGET [--fast] (voir verify --help)",
+    )
     p.add_argument("--runs", type=int, default=10)
     p.add_argument("--thresholds", type=str, default="0.25,0.5,0.7,0.8")
     p.add_argument("--out", type=str, default="_out")
     p.add_argument("--seed-base", type=int, default=1000)
     p.add_argument("--workers", type=int, default=max(1, os.cpu_count() or 1))
     p.add_argument("--zip", dest="zip_out", action="store_true")
+    p.add_argument(
+        "--chunk-size",
+        type=_positive_int,
+        default=None,
+        help="runs par tâche envoyée aux workers (défaut : auto)",
+    )
+    p.add_argument(
+        "--no-dataset",
+        dest="write_dataset",
+        action="store_false",
+        help="ne pas écrire multi.csv (les analyzers reçoivent le dataset en mémoire)",
+    )
+    p.add_argument(
+        "--dataset-format",
+        choices=DATASET_FORMATS,
+        default="csv",
+        help="format disque du dataset : csv (texte) ou npy (binaire, mappable en mémoire)",
+    )
+    p.add_argument(
+        "--dataset-shape",
+        type=parse_shape,
+        default=(256, 8),
+        help="dimensions ROWSxCOLS du dataset généré par run",
+    )
+    p.add_argument(
+        "--resume",
+        action="store_true",
+        help="reprendre un sweep interrompu (saute les runs vérifiés de index.jsonl)",
+    )
+    p.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="cache disque des résultats d'analyzers, partagé entre sweeps",
+    )
+    p.add_argument(
+        "--cache-max-mb",
+        type=_positive_int,
+        default=1024,
+        help="taille max du cache (éviction LRU pendant et en fin de sweep)",
+    )
+    p.add_argument(
+        "--rng",
+        dest="rng_mode",
+        choices=RNG_MODES,
+        default="generator",
+        help="generator : flux par (seed_base, run_id, analyzer) ; "
+        "legacy : sorties identiques aux versions basées sur np.random.seed",
+    )
+    p.add_argument(
+        "--analyzer-threads",
+        type=_positive_int,
+        default=1,
+        help="threads par worker pour exécuter les analyzers d'un run en parallèle",
+    )
+    p.add_argument(
+        "--graph-nodes",
+        type=_positive_int,
+        default=REFERENCE_NODES,
+        help="nombre de nœuds des graphes de graph_analysis",
+    )
+    p.add_argument(
+        "--graph-engine",
+        choices=GRAPH_ENGINES,
+        default="networkx",
+        help="networkx (historique) ou numpy (arêtes échantillonnées, pour les grands n)",
+    )
+    p.add_argument(
+        "--graph-sweep",
+        choices=GRAPH_SWEEPS,
+        default="independent",
+        help="independent : un graphe par seuil ; coupled : graphes emboîtés, un seul tirage",
+    )
+    p.add_argument(
+        "--graph-reports",
+        dest="graph_report_layout",
+        choices=REPORT_LAYOUTS,
+        default="files",
+        help="files : un JSON par seuil ; jsonl : un seul reports.jsonl indexé par run",
+    )
+    p.add_argument(
+        "--zip-only",
+        action="store_true",
+        help="écrire les runs directement dans l'archive, sans arborescence run_* (implique --zip)",
+    )
+    p.add_argument(
+        "--zip-level",
+        type=_zip_level,
+        default=6,
+        help="niveau de compression deflate 1-9, 0 = stocké sans compression",
+    )
+    p.add_argument(
+        "--analyzers",
+        type=_parse_names,
+        default=None,
+        help="analyzers à exécuter, séparés par des virgules (défaut : tous les enregistrés)",
+    )
+    p.add_argument(
+        "--exclude-analyzers",
+        type=_parse_names,
+        default=(),
+        help="analyzers à ne pas exécuter, séparés par des virgules",
+    )
+    p.add_argument(
+        "--profile-stages",
+        action="store_true",
+        help="chronométrer chaque étape d'un run (timings.json, stages.txt)",
+    )
+    p.add_argument(
+        "--cprofile",
+        action="store_true",
+        help="profiler chaque chunk avec cProfile (profiles/*.prof, fusionnés dans profile.prof)",
+    )
     return p
 
 
+def _zip_level(s: str) -> int:
+    value = int(s)
+    if not 0 <= value <= 9:
+        raise argparse.ArgumentTypeError(f"expected a level between 0 and 9, got {s!r}")
+    return value
+
+
+def _positive_int(s: str) -> int:
+    value = int(s)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {s!r}")
+    return value
+
+
+def parse_shape(s: str) -> tuple[int, int]:
+    rows, sep, cols = s.lower().partition("x")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"expected ROWSxCOLS, got {s!r}")
+    return _positive_int(rows), _positive_int(cols)
+
+
+def _parse_names(s: str) -> tuple[str, ...]:
+    return tuple(x.strip() for x in s.split(",") if x.strip())
+
+
 def _parse_thresholds(s: str) -> list[float]:
     parts = [x.strip() for x in s.split(",") if x.strip()]
     return [float(x) for x in parts]
 
 
+def _sweep_pool(params: Params, shared: SweepPool | None) -> AbstractContextManager[SweepPool]:
+    if shared is None:
+        return SweepPool(params.workers, params)
+    # Pool fourni par l'appelant : il le ferme lui-même.
+    return nullcontext(shared)
+
+
+def _iter_results(
+    params: Params,
+    run_ids: list[int],
+    aggregate: Aggregator,
+    timings: dict[str, TimingHistogram],
+    shared: SweepPool | None,
+    cache: ResultCache | None = None,
+) -> Iterator[tuple[dict[str, Any], list[ArchiveEntry]]]:
+    with _sweep_pool(params, shared) as pool:
+        chunk_size = params.chunk_size or _auto_chunk_size(len(run_ids), pool.workers)
+        # Fenêtre bornée de chunks en vol, chunks de taille bornée : la mémoire
+        # ne dépend pas du nombre de runs.
+        max_in_flight = pool.workers * 2
+        pending: deque[Future[ChunkResult]] = deque()
+        for block in _contiguous_ranges(run_ids):
+            for chunk in _iter_chunks(block, chunk_size):
+                pending.append(pool.submit(chunk, params))
+                if len(pending) >= max_in_flight:
+                    yield from _merge_chunk(pending.popleft().result(), aggregate, timings, cache)
+        while pending:
+            yield from _merge_chunk(pending.popleft().result(), aggregate, timings, cache)
+
+
+def _merge_chunk(
+    done: ChunkResult,
+    aggregate: Aggregator,
+    timings: dict[str, TimingHistogram],
+    cache: ResultCache | None,
+) -> Iterator[tuple[dict[str, Any], list[ArchiveEntry]]]:
+    aggregate.merge(done.aggregate)
+    merge_timings(timings, done.timings)
+    if cache is not None:
+        # Le cache reste borné pendant le sweep, pas seulement à la fin.
+        cache.account(done.cache_bytes)
+    return zip(done.results, done.entries, strict=True)
+
+
 @perf_timer
-def run(params: Params) -> tuple[list[dict[str, Any]], Path | None]:
+def run(params: Params, pool: SweepPool | None = None) -> tuple[list[dict[str, Any]], Path | None]:
+    """Exécute le sweep ; ``pool`` réutilise les workers d'un :class:`SweepPool`."""
+    if params.resume and params.zip_only:
+        raise ValueError("resume needs the run_* tree on disk and cannot be used with zip_only")
+    # Sélection invalide : erreur avant de toucher au dossier de sortie.
+    selected_analyzers(params)
     params.out.mkdir(parents=True, exist_ok=True)
+    zip_path = params.out.with_suffix(".zip") if params.zip_out or params.zip_only else None
+    # Les profils d'un sweep précédent ne doivent pas se mêler à ceux-ci.
+    reset_profiles(params.out)
 
-    with ProcessPoolExecutor(max_workers=params.workers) as pool:
-        futures = [pool.submit(process_run, i, params) for i in range(1, params.runs + 1)]
-        results = [f.result() for f in futures]
+    index = CompletionIndex(params.out / INDEX_NAME)
+    index.open(_config_fingerprint(params), resume=params.resume)
+    run_ids = range(1, params.runs + 1)
+    done: set[int] = set()
+    previous: Generator[dict[str, Any], None, None] | None = None
+    if params.resume:
+        verified = index.verified(run_ids, params.seed_for, params.run_dir)
+        # Le résultat d'un run repris est relu dans l'overview précédent : il
+        # doit y figurer avec les hashes de l'index, sinon le run est refait.
+        previous_path = stash_overview(params.out)
+        if previous_path.exists():
+            done = {
+                entry["run_id"]
+                for entry in read_overview(previous_path)
+                if entry["run_id"] in verified
+                and entry["hashes"] == index.read(entry["run_id"])["hashes"]
+            }
+            previous = read_overview(previous_path)
+    aggregate = Aggregator()
+    merkle = MerkleBuilder()
+    timings: dict[str, TimingHistogram] = {}
+    todo = [i for i in run_ids if i not in done]
+    cache = _result_cache(params)
+    if cache is not None:
+        # Rattrape la croissance laissée par un sweep interrompu.
+        cache.evict()
+    computed = _iter_results(params, todo, aggregate, timings, pool, cache)
 
-    overview_path = params.out / "overview.json"
-    overview_path.write_text(
-        json.dumps(results, separators=(",", ":"), ensure_ascii=False),
-        encoding="utf-8",
-    )
+    results: list[dict[str, Any]] = []
+    overview_path = params.out / OVERVIEW_NAME
+    try:
+        with _archive(zip_path) as zw, _compression_pool(params, zw) as compressors:
+            with (
+                OverviewWriter(overview_path) as overview,
+                ColumnWriter(params.out / COLUMNS_DIR) as columns,
+            ):
+                for run_id in run_ids:
+                    if run_id in done:
+                        assert previous is not None
+                        result = _previous_result(previous, run_id)
+                        aggregate.add(result)
+                        if zw is not None:
+                            # Run repris : ses fichiers sont relus depuis le disque.
+                            run_dir = params.run_dir(run_id)
+                            files = ((f"{run_dir.name}/{n}", p) for n, p in iter_tree(run_dir))
+                            _add_files(zw, compressors, params, files)
+                    else:
+                        result, entries = next(computed)
+                        index.append(params.seed_for(run_id), result)
+                        for entry in entries:
+                            assert zw is not None
+                            zw.add(entry)
+                    overview.write(result)
+                    columns.write(result)
+                    merkle.add(run_digest(result["hashes"]))
+                    if params.collect_results:
+                        results.append(result)
+            index.close()
+            (params.out / PREVIOUS_OVERVIEW_NAME).unlink(missing_ok=True)
+            aggregate.write(params.out / AGGREGATE_NAME)
+            write_timings(params.out / TIMINGS_NAME, timings)
+            if params.profile_stages:
+                table = format_stage_table(timings, process_run.__qualname__)
+                (params.out / STAGES_NAME).write_text(table, encoding="utf-8")
+                logger.info("stages:\n%s", table)
+            if params.cprofile:
+                merge_profiles(params.out)
+            _write_manifest(params, overview.sha256, merkle.root())
+            if zw is not None:
+                # Le reste du dossier de sortie : overview, manifest, index, ...
+                rest = ((n, p) for n, p in iter_tree(params.out) if n not in zw.names)
+                _add_files(zw, compressors, params, rest)
+    finally:
+        index.close()
+        if previous is not None:
+            previous.close()
+        if cache is not None:
+            cache.evict()
 
+    return results, zip_path
+
+
+def _previous_result(previous: Iterator[dict[str, Any]], run_id: int) -> dict[str, Any]:
+    # Les deux overviews suivent l'ordre des runs : on avance jusqu'au run.
+    return next(entry for entry in previous if entry["run_id"] == run_id)
+
+
+def _archive(zip_path: Path | None) -> AbstractContextManager[ZipWriter | None]:
+    if zip_path is None:
+        return nullcontext()
+    return ZipWriter(zip_path)
+
+
+def _compression_pool(
+    params: Params, zw: ZipWriter | None
+) -> AbstractContextManager[Executor | None]:
+    if zw is None:
+        return nullcontext()
+    return ThreadPoolExecutor(max_workers=params.workers)
+
+
+def _add_files(
+    zw: ZipWriter, pool: Executor | None, params: Params, files: Iterable[tuple[str, Path]]
+) -> None:
+    assert pool is not None
+    for entry in compress_files(files, params.zip_level, pool, window=params.workers * 4):
+        zw.add(entry)
+
+
+def _write_manifest(params: Params, overview_sha256: str, runs_merkle_root: str) -> None:
+    # Fichiers de synthèse hors overview (agrégats, colonnes), hachés en parallèle.
+    columns = params.out / COLUMNS_DIR
+    tree = [(AGGREGATE_NAME, params.out / AGGREGATE_NAME)]
+    tree += [(f"{COLUMNS_DIR}/{name}", p) for name, p in iter_tree(columns)]
+    digests = compute_sha256_many([p for _name, p in tree], params.workers)
     manifest = {
         "name": "EchoNull",
         "runs": params.runs,
         "thresholds": params.thresholds,
         "seed_base": params.seed_base,
-        "overview_sha256": compute_sha256(overview_path),
+        "overview_sha256": overview_sha256,
+        "runs_merkle_root": runs_merkle_root,
+        "files": {name: digest for (name, _p), digest in zip(tree, digests, strict=True)},
     }
     manifest_path = params.out / "manifest.json"
     manifest_path.write_text(
@@ -102,22 +786,11 @@ def run(params: Params) -> tuple[list[dict[str, Any]], Path | None]:
         encoding="utf-8",
     )
 
-    zip_path: Path | None = None
-    if params.zip_out:
-        zip_path = params.out.with_suffix(".zip")
-        _zip_dir(params.out, zip_path)
-
-    return results, zip_path
-
-
-def _zip_dir(src_dir: Path, zip_path: Path) -> None:
-    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for p in src_dir.rglob("*"):
-            if p.is_file():
-                zf.write(p, arcname=p.relative_to(src_dir))
-
 
 def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["verify"]:
+        return verify_main(argv[1:])
     parser = build_parser()
     args = parser.parse_args(argv)
 
@@ -128,7 +801,31 @@ def main(argv: list[str] | None = None) -> int:
         seed_base=int(args.seed_base),
         workers=int(args.workers),
         zip_out=bool(args.zip_out),
+        chunk_size=args.chunk_size,
+        collect_results=False,
+        write_dataset=bool(args.write_dataset),
+        dataset_format=str(args.dataset_format),
+        dataset_shape=args.dataset_shape,
+        resume=bool(args.resume),
+        cache_dir=Path(args.cache_dir) if args.cache_dir else None,
+        cache_max_bytes=int(args.cache_max_mb) * 1024 * 1024,
+        rng_mode=str(args.rng_mode),
+        analyzer_threads=int(args.analyzer_threads),
+        graph_nodes=int(args.graph_nodes),
+        graph_engine=str(args.graph_engine),
+        graph_sweep=str(args.graph_sweep),
+        graph_report_layout=str(args.graph_report_layout),
+        zip_only=bool(args.zip_only),
+        zip_level=int(args.zip_level),
+        profile_stages=bool(args.profile_stages),
+        cprofile=bool(args.cprofile),
+        analyzers=args.analyzers,
+        exclude_analyzers=args.exclude_analyzers,
     )
+    try:
+        selected_analyzers(params)
+    except ValueError as exc:
+        parser.error(str(exc))
     run(params)
     return 0
 
@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import zipfile
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import TracebackType
+from typing import Any, BinaryIO, NamedTuple
+
+from common.utils import compute_sha256
+from orchestrator.index import INDEX_NAME
+from orchestrator.merkle import MerkleBuilder, run_digest
+
+MANIFEST_NAME = "manifest.json"
+
+
+class Mismatch(NamedTuple):
+    name: str
+    reason: str
+
+
+@dataclass
+class VerifyReport:
+    checked: int = 0
+    mismatches: list[Mismatch] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches
+
+
+class _Group(NamedTuple):
+    """Unité de travail : les fichiers d'un run (``prefix="run_XXXX/"``) ou de la racine."""
+
+    prefix: str
+    # Mode complet : sha256 attendu (None : relevé de stat seulement).
+    hashes: dict[str, str | None]
+    # Mode rapide : (taille, mtime_ns) relevés, ou (taille, CRC) pour une entrée de zip.
+    stats: dict[str, tuple[int, int]]
+
+
+class _Source:
+    """Lecture uniforme d'un dossier de sortie ou de son archive zip."""
+
+    def __init__(self, target: Path) -> None:
+        self.target = target
+        self._zip = zipfile.ZipFile(target) if target.is_file() else None
+
+    def __enter__(self) -> _Source:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self._zip is not None:
+            self._zip.close()
+
+    @property
+    def is_zip(self) -> bool:
+        return self._zip is not None
+
+    def open(self, name: str) -> BinaryIO:
+        if self._zip is None:
+            return (self.target / name).open("rb")
+        try:
+            return self._zip.open(name)  # type: ignore[return-value]
+        except KeyError:
+            raise FileNotFoundError(name) from None
+
+    def stat(self, name: str) -> tuple[int, int] | None:
+        if self._zip is None:
+            try:
+                st = (self.target / name).stat()
+            except FileNotFoundError:
+                return None
+            return st.st_size, st.st_mtime_ns
+        try:
+            info = self._zip.getinfo(name)
+        except KeyError:
+            return None
+        # Les dates des entrées sont figées (archive reproductible) : le CRC du
+        # répertoire central tient lieu de mtime.
+        return info.file_size, info.CRC
+
+    def sha256(self, name: str) -> str:
+        if self._zip is None:
+            return compute_sha256(self.target / name)
+        # Décompression en flux, sans extraire l'entrée.
+        sha256 = hashlib.sha256()
+        with self.open(name) as fh:
+            while chunk := fh.read(1 << 20):
+                sha256.update(chunk)
+        return sha256.hexdigest()
+
+    def names(self, prefix: str) -> set[str]:
+        if self._zip is None:
+            root = self.target / prefix
+            return {p.relative_to(root).as_posix() for p in root.rglob("*") if p.is_file()}
+        names = self._zip.namelist()
+        return {n[len(prefix) :] for n in names if n.startswith(prefix) and not n.endswith("/")}
+
+    def lines(self, name: str) -> Iterator[bytes]:
+        with self.open(name) as fh:
+            yield from fh
+
+
+def stat_index_path(target: Path) -> Path:
+    """Relevé de la dernière vérification complète réussie, à côté de la cible.
+
+    Hors du dossier de sortie : un sweep ``--zip`` suivant ne l'archive pas.
+    """
+    target = target.resolve()
+    return target.parent / f"{target.name}.verify.jsonl"
+
+
+def _check_group(
+    src: _Source, group: _Group, fast: bool
+) -> tuple[list[Mismatch], dict[str, tuple[int, int]]]:
+    mismatches: list[Mismatch] = []
+    stats: dict[str, tuple[int, int]] = {}
+    expected = set(group.stats) if fast else set(group.hashes)
+    for name in sorted(expected):
+        full = group.prefix + name
+        st = src.stat(full)
+        if st is None:
+            mismatches.append(Mismatch(full, "missing"))
+        elif fast:
+            size, stamp = group.stats[name]
+            if st[0] != size:
+                mismatches.append(Mismatch(full, "size"))
+            elif st[1] != stamp:
+                mismatches.append(Mismatch(full, "crc" if src.is_zip else "mtime"))
+        elif group.hashes[name] is not None and src.sha256(full) != group.hashes[name]:
+            mismatches.append(Mismatch(full, "sha256"))
+        else:
+            stats[name] = st
+    if group.prefix:
+        for extra in sorted(src.names(group.prefix) - expected):
+            mismatches.append(Mismatch(group.prefix + extra, "unexpected"))
+    return mismatches, stats
+
+
+def _check_groups(
+    target: Path, groups: list[_Group], fast: bool
+) -> list[tuple[list[Mismatch], dict[str, tuple[int, int]]]]:
+    with _Source(target) as src:
+        return [_check_group(src, group, fast) for group in groups]
+
+
+def _read_json(src: _Source, name: str) -> Any:
+    with src.open(name) as fh:
+        return json.load(fh)
+
+
+def _full_groups(src: _Source, report: VerifyReport) -> list[_Group]:
+    manifest = _read_json(src, MANIFEST_NAME)
+    top: dict[str, str | None] = {"overview.json": manifest["overview_sha256"]}
+    top.update(manifest.get("files", {}))
+    top.update({MANIFEST_NAME: None, INDEX_NAME: None})
+    groups = [_Group("", top, {})]
+
+    # Dernière entrée de l'index pour chaque run (les reprises ajoutent des lignes).
+    hashes: dict[int, dict[str, str]] = {}
+    for i, line in enumerate(src.lines(INDEX_NAME)):
+        if i and line.strip():
+            entry = json.loads(line)
+            hashes[int(entry["run_id"])] = entry["hashes"]
+
+    merkle = MerkleBuilder()
+    for run_id in range(1, int(manifest["runs"]) + 1):
+        prefix = f"run_{run_id:04d}/"
+        if run_id not in hashes:
+            report.mismatches.append(Mismatch(prefix, "not indexed"))
+            continue
+        merkle.add(run_digest(hashes[run_id]))
+        groups.append(_Group(prefix, dict(hashes[run_id]), {}))
+    root = manifest.get("runs_merkle_root")
+    if root is not None and merkle.root() != root:
+        report.mismatches.append(Mismatch(MANIFEST_NAME, "runs_merkle_root"))
+    return groups
+
+
+def _archive_stat(target: Path) -> tuple[int, int]:
+    st = target.stat()
+    return st.st_size, st.st_mtime_ns
+
+
+def _fast_groups(target: Path, report: VerifyReport) -> list[_Group]:
+    path = stat_index_path(target)
+    if not path.exists():
+        raise FileNotFoundError(f"{path}: no stat index, run a full verify first")
+    groups = []
+    with path.open("r", encoding="utf-8") as fh:
+        for line in fh:
+            entry = json.loads(line)
+            if "archive" in entry:
+                # Zip : l'archive elle-même, puis les CRC de ses entrées.
+                size, mtime_ns = _archive_stat(target)
+                if size != entry["archive"][0]:
+                    report.mismatches.append(Mismatch(target.name, "size"))
+                elif mtime_ns != entry["archive"][1]:
+                    report.mismatches.append(Mismatch(target.name, "mtime"))
+                continue
+            stats = {name: (int(s[0]), int(s[1])) for name, s in entry["files"].items()}
+            groups.append(_Group(entry["prefix"], {}, stats))
+    return groups
+
+
+def verify(target: Path, workers: int = 1, fast: bool = False) -> VerifyReport:
+    """Vérifie un dossier de sortie (ou son zip) contre ``manifest.json``.
+
+    Mode complet : re-hache chaque artefact (hashes de l'index, racine de
+    Merkle, fichiers de synthèse) sur un pool de processus ; s'il est
+    concluant, enregistre tailles et mtimes (pour un zip : taille et mtime de
+    l'archive, taille et CRC de chaque entrée). Mode rapide (``fast``) : ne
+    compare qu'à ce relevé.
+    """
+    report = VerifyReport()
+    if fast:
+        groups = _fast_groups(target, report)
+    else:
+        with _Source(target) as src:
+            groups = _full_groups(src, report)
+
+    size = max(1, math.ceil(len(groups) / (max(1, workers) * 4)))
+    batches = [groups[i : i + size] for i in range(0, len(groups), size)]
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_check_groups, target, b, fast) for b in batches]
+            outcomes = [o for f in futures for o in f.result()]
+    else:
+        outcomes = [o for b in batches for o in _check_groups(target, b, fast)]
+
+    for group, (mismatches, _stats) in zip(groups, outcomes, strict=True):
+        report.checked += len(group.stats) if fast else len(group.hashes)
+        report.mismatches.extend(mismatches)
+
+    if not fast and report.ok:
+        entries: list[dict[str, Any]] = [
+            {"prefix": g.prefix, "files": stats}
+            for g, (_m, stats) in zip(groups, outcomes, strict=True)
+        ]
+        if target.is_file():
+            entries.insert(0, {"archive": _archive_stat(target)})
+        lines = [json.dumps(e, separators=(",", ":")) + "\n" for e in entries]
+        stat_index_path(target).write_text("".join(lines), encoding="utf-8")
+    return report
+
+
+def build_verify_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="echonull-orchestrator verify",
+        description="vérifie un dossier de sortie ou son zip contre manifest.json",
+    )
+    p.add_argument("target", help="dossier de sortie (--out) ou archive .zip")
+    p.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    p.add_argument(
+        "--fast",
+        action="store_true",
+        help="compare seulement tailles et mtimes (CRC pour un zip) au relevé "
+        "de la dernière vérification complète",
+    )
+    return p
+
+
+def verify_main(argv: list[str]) -> int:
+    parser = build_verify_parser()
+    args = parser.parse_args(argv)
+    try:
+        report = verify(Path(args.target), workers=max(1, int(args.workers)), fast=bool(args.fast))
+    except (FileNotFoundError, zipfile.BadZipFile) as exc:
+        # Cible absente, pas encore de relevé pour --fast, ou zip illisible.
+        parser.error(str(exc))
+    for m in report.mismatches:
+        print(f"MISMATCH {m.reason}: {m.name}")
+    print(f"{report.checked} files checked, {len(report.mismatches)} mismatches")
+    return 0 if report.ok else 1
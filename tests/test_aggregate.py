@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from orchestrator.aggregate import AGGREGATE_NAME, QuantileSketch, RunningStats
+from orchestrator.run import Params, run
+
+
+def _values(n: int = 5000) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return np.concatenate([rng.lognormal(size=n), -rng.exponential(size=n // 4), np.zeros(10)])
+
+
+def test_running_stats_merge_matches_numpy() -> None:
+    x = _values()
+    shards = [RunningStats() for _ in range(3)]
+    for i, v in enumerate(x.tolist()):
+        shards[i % 3].add(v)
+    total = RunningStats()
+    for shard in [*shards, RunningStats()]:
+        total.merge(shard)
+
+    assert total.count == x.size
+    assert total.mean == pytest.approx(x.mean())
+    assert total.variance == pytest.approx(x.var(ddof=1))
+    assert (total.min, total.max) == (x.min(), x.max())
+    assert RunningStats().variance == 0.0
+    assert RunningStats().mean == 0.0
+
+
+def test_running_stats_do_not_depend_on_sharding() -> None:
+    x = _values().tolist()
+    sequential = RunningStats()
+    for v in x:
+        sequential.add(v)
+    for size in (1, 7, 1000):
+        merged = RunningStats()
+        for start in range(len(x) - size, -size, -size):
+            shard = RunningStats()
+            for v in x[max(0, start) : start + size]:
+                shard.add(v)
+            merged.merge(shard)
+        assert merged == sequential
+        assert (merged.mean, merged.variance) == (sequential.mean, sequential.variance)
+
+
+@pytest.mark.parametrize("q", [0.0, 0.01, 0.1, 0.5, 0.9, 0.99, 1.0])
+def test_sketch_quantiles_have_bounded_relative_error(q: float) -> None:
+    x = _values()
+    a, b = QuantileSketch(), QuantileSketch()
+    for i, v in enumerate(x.tolist()):
+        (a if i % 2 else b).add(v)
+    a.merge(b)
+
+    assert a.count == x.size
+    exact = float(np.quantile(x, q, method="lower"))
+    assert abs(a.quantile(q) - exact) <= a.alpha * abs(exact)
+
+
+def test_sketch_memory_is_bounded() -> None:
+    sketch = QuantileSketch(max_buckets=16)
+    other = QuantileSketch(max_buckets=16)
+    for e in range(-50, 50):
+        sketch.add(10.0**e)
+        other.add(-(10.0**e))
+        other.add(10.0 ** (e + 100))
+    other.merge(sketch)
+    assert len(sketch.positive) <= 16 and len(other.positive) <= 16
+    assert len(other.negative) <= 16
+    assert sketch.count == 100 and other.count == 300
+    assert other.quantile(0.0) == pytest.approx(-1e49, rel=other.alpha)
+    # Les grandes valeurs restent exactes à alpha près, seules les petites sont fusionnées.
+    assert sketch.quantile(1.0) == pytest.approx(1e49, rel=sketch.alpha)
+
+    assert math.isnan(QuantileSketch().quantile(0.5))
+    with pytest.raises(ValueError, match="parameters"):
+        sketch.merge(QuantileSketch())
+
+
+def test_sweep_writes_aggregate(tmp_path: Path) -> None:
+    out = tmp_path / "_out"
+    params = Params(runs=12, thresholds=[0.25, 0.7], out=out, seed_base=4, workers=2, zip_out=False)
+    results, _ = run(params)
+    agg = json.loads((out / AGGREGATE_NAME).read_text(encoding="utf-8"))
+
+    assert agg["runs"] == 12
+    edges = np.array([r["results"]["graph_analysis"]["0.70"]["n_edges"] for r in results])
+    m = agg["metrics"]["graph_analysis/0.70/n_edges"]
+    assert m["count"] == 12
+    assert m["mean"] == pytest.approx(edges.mean())
+    assert m["std"] == pytest.approx(edges.std(ddof=1))
+    assert (m["min"], m["max"]) == (edges.min(), edges.max())
+    assert m["min"] <= m["p01"] <= m["p50"] <= m["p99"] <= m["max"]
+    assert "delta_stats/abs_p99" in agg["metrics"]
+
+    # Reprise : les runs relus depuis l'index sont agrégés comme les autres.
+    run(replace(params, runs=14, resume=True))
+    agg = json.loads((out / AGGREGATE_NAME).read_text(encoding="utf-8"))
+    assert agg["runs"] == agg["metrics"]["mark_counts/median_count"]["count"] == 14
+
+
+def test_manifest_does_not_depend_on_scheduling(tmp_path: Path) -> None:
+    # Même dossier : les chemins de overview.json ne changent pas.
+    out = tmp_path / "_out"
+    params = Params(runs=9, thresholds=[0.25, 0.7], out=out, seed_base=4, workers=1, zip_out=False)
+    manifests = []
+    for kw in ({}, {"workers": 3}, {"workers": 2, "chunk_size": 2}):
+        run(replace(params, **kw))  # type: ignore[arg-type]
+        manifests.append((out / "manifest.json").read_bytes())
+    # Reprise après un sweep partiel : agrégats relus et calculés mélangés.
+    run(replace(params, runs=4))
+    run(replace(params, resume=True, workers=2))
+    manifests.append((out / "manifest.json").read_bytes())
+    assert len(set(manifests)) == 1
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
+from typing import Any
 
-from delta_stats.analyzer import DeltaStatsAnalyzer
+import networkx as nx
+import numpy as np
+import pytest
+
+from common.utils import RNG_MODES, analyzer_rng
+from delta_stats.analyzer import STAT_FIELDS, DeltaStatsAnalyzer
 from graph_analysis.analyzer import GraphAnalysisAnalyzer
 from mark_counts.analyzer import MarkCountsAnalyzer
 
@@ -35,3 +42,92 @@ def test_mark_counts(tmp_path: Path) -> None:
     count = r["mark_counts"]["median_count"]
     assert 1 <= count <= 4
     assert (tmp_path / "mark_counts" / "count.txt").exists()
+
+
+@pytest.mark.parametrize("rng_mode", RNG_MODES)
+def test_delta_stats_batch_matches_single_runs(tmp_path: Path, rng_mode: str) -> None:
+    run_ids = [1, 2, 3, 4, 5]
+    seeds = [0, 1, 42, 1000, 123456]
+    batched = DeltaStatsAnalyzer(rng_mode)
+    table = batched.analyze_batch(run_ids, seeds)
+    assert table.shape == (len(seeds), len(STAT_FIELDS))
+
+    batched.prefetch(run_ids, seeds)
+    for i, (run_id, seed) in enumerate(zip(run_ids, seeds, strict=True)):
+        single = DeltaStatsAnalyzer(rng_mode).analyze(run_id, seed, None, tmp_path / "single")
+        stats = batched.analyze(run_id, seed, None, tmp_path / "batch")["delta_stats"]
+        assert stats == single["delta_stats"]
+        assert stats == dict(zip(STAT_FIELDS, [int(table[i, 0]), *table[i, 1:]], strict=True))
+        assert (tmp_path / "batch/delta_stats/stats.json").read_bytes() == (
+            tmp_path / "single/delta_stats/stats.json"
+        ).read_bytes()
+    assert batched._prefetched == {}
+
+    # Un nouveau chunk remplace les lignes non consommées du précédent.
+    batched.prefetch(run_ids[:2], seeds[:2])
+    batched.prefetch(run_ids[2:3], seeds[2:3])
+    assert list(batched._prefetched) == [(run_ids[2], seeds[2])]
+
+
+def _legacy_delta_stats(seed: int) -> dict[str, Any]:
+    # Implémentation historique, basée sur l'état global de np.random.
+    np.random.seed(seed)
+    abs_deltas = np.abs(np.random.lognormal(mean=-8, sigma=1.5, size=50))
+    return {
+        "n_deltas": int(abs_deltas.size),
+        "abs_p50": float(np.percentile(abs_deltas, 50)),
+        "abs_p90": float(np.percentile(abs_deltas, 90)),
+        "abs_p99": float(np.percentile(abs_deltas, 99)),
+        "mad": float(np.median(np.abs(abs_deltas - np.median(abs_deltas)))),
+        "max": float(np.max(abs_deltas)),
+    }
+
+
+def test_legacy_mode_reproduces_historical_outputs(tmp_path: Path) -> None:
+    for run_id, seed in [(1, 101), (2, 102), (7, 42)]:
+        delta = DeltaStatsAnalyzer("legacy").analyze(run_id, seed, None, tmp_path)
+        assert delta["delta_stats"] == _legacy_delta_stats(seed)
+
+        np.random.seed(seed)
+        expected_count = int(np.random.randint(1, 5))
+        marks = MarkCountsAnalyzer("legacy").analyze(run_id, seed, None, tmp_path)
+        assert marks["mark_counts"]["median_count"] == expected_count
+
+        expected_edges = [
+            nx.erdos_renyi_graph(n=10, p=0.2 + thr / 2, seed=seed).number_of_edges()
+            for thr in (0.25, 0.5)
+        ]
+        np.random.seed(seed)
+        expected_jaccard = [1.0 if run_id % 2 == 0 else np.random.uniform(0.9, 1.0) for _ in "ab"]
+        graph = GraphAnalysisAnalyzer([0.25, 0.5], "legacy").analyze(run_id, seed, None, tmp_path)
+        assert [v["n_edges"] for v in graph["graph_analysis"].values()] == expected_edges
+        assert [v["jaccard"] for v in graph["graph_analysis"].values()] == expected_jaccard
+        assert all("jaccard_ref" not in v for v in graph["graph_analysis"].values())
+        report = json.loads((tmp_path / "graph_analysis/thr_0.25_report.json").read_text())
+        assert set(report) == {"nodes", "edges", "jaccard"}
+
+
+def test_analyzers_leave_global_random_state_untouched(tmp_path: Path) -> None:
+    np.random.seed(2024)
+    expected = np.random.random()
+
+    np.random.seed(2024)
+    for mode in RNG_MODES:
+        GraphAnalysisAnalyzer([0.25], mode).analyze(1, 11, None, tmp_path)
+        DeltaStatsAnalyzer(mode).analyze(1, 11, None, tmp_path)
+        MarkCountsAnalyzer(mode).analyze(1, 11, None, tmp_path)
+    assert np.random.random() == expected
+
+
+def test_generator_streams_depend_on_run_and_analyzer() -> None:
+    a = analyzer_rng("delta_stats", run_id=1, seed=101).random()
+    assert a == analyzer_rng("delta_stats", run_id=1, seed=101).random()
+    assert a != analyzer_rng("delta_stats", run_id=2, seed=102).random()
+    assert a != analyzer_rng("mark_counts", run_id=1, seed=101).random()
+    # Même seed, seed_base différente : flux distincts.
+    assert a != analyzer_rng("delta_stats", run_id=2, seed=101).random()
+
+
+def test_unknown_rng_mode_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        DeltaStatsAnalyzer("mt19937")
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+import orchestrator.archive as archive
+from orchestrator.archive import ZipWriter, compress_entry, compress_files, compress_tree
+from orchestrator.run import Params, process_chunk, run
+
+
+def test_zip_writer_output_is_readable_by_zipfile(tmp_path: Path) -> None:
+    data = b"echonull " * 1000
+    zip_path = tmp_path / "a.zip"
+    with ZipWriter(zip_path) as zw:
+        zw.add_bytes("stored.txt", data, 0)
+        zw.add_bytes("dir/deflated.txt", data, 9)
+        zw.add_bytes("empty", b"", 6)
+
+    with zipfile.ZipFile(zip_path) as zf:
+        assert zf.testzip() is None
+        infos = {i.filename: i for i in zf.infolist()}
+        assert infos["stored.txt"].compress_type == zipfile.ZIP_STORED
+        assert infos["dir/deflated.txt"].compress_type == zipfile.ZIP_DEFLATED
+        assert infos["dir/deflated.txt"].compress_size < len(data)
+        assert zf.read("dir/deflated.txt") == data
+        assert zf.read("empty") == b""
+
+
+def test_compress_entry_is_deterministic() -> None:
+    assert compress_entry("a", b"x" * 100, 6) == compress_entry("a", b"x" * 100, 6)
+
+
+def test_compress_tree_uses_sorted_posix_names(tmp_path: Path) -> None:
+    (tmp_path / "b").mkdir()
+    (tmp_path / "b" / "z.txt").write_text("z")
+    (tmp_path / "a.txt").write_text("a")
+    names = [e.name for e in compress_tree(tmp_path, "run_0001/", 6)]
+    assert names == ["run_0001/a.txt", "run_0001/b/z.txt"]
+
+
+def test_zip64_records(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Seuils abaissés : exerce les champs zip64 sans écrire des Go.
+    monkeypatch.setattr(archive, "_ZIP64_LIMIT", 16)
+    monkeypatch.setattr(archive, "_ZIP64_COUNT_LIMIT", 2)
+    zip_path = tmp_path / "big.zip"
+    with ZipWriter(zip_path) as zw:
+        for i in range(3):
+            zw.add_bytes(f"f{i}", bytes(range(64)) * (i + 1), 0)
+
+    with zipfile.ZipFile(zip_path) as zf:
+        assert zf.testzip() is None
+        for i in range(3):
+            assert zf.read(f"f{i}") == bytes(range(64)) * (i + 1)
+
+
+def test_zip_only_sweep_matches_directory_sweep(tmp_path: Path) -> None:
+    common = {"runs": 3, "thresholds": [0.25, 0.5], "seed_base": 7, "workers": 1, "zip_out": True}
+    dir_results, dir_zip = run(Params(out=tmp_path / "dir", **common))  # type: ignore[arg-type]
+    out = tmp_path / "only"
+    results, zip_path = run(Params(out=out, zip_only=True, **common))  # type: ignore[arg-type]
+
+    assert zip_path == out.with_suffix(".zip")
+    assert not list(out.glob("run_*"))
+    relocated = json.dumps(dir_results).replace(str(tmp_path / "dir"), str(out))
+    assert results == json.loads(relocated)
+
+    assert dir_zip is not None
+    with zipfile.ZipFile(dir_zip) as a, zipfile.ZipFile(zip_path) as b:
+        assert b.testzip() is None
+        assert sorted(a.namelist()) == sorted(b.namelist())
+        for name in a.namelist():
+            if name.startswith("run_"):
+                assert a.read(name) == b.read(name)
+        assert b.read("overview.json") == (out / "overview.json").read_bytes()
+
+
+def test_zip_only_rejects_resume(tmp_path: Path) -> None:
+    params = Params(
+        runs=1,
+        thresholds=[0.5],
+        out=tmp_path / "_out",
+        seed_base=1,
+        workers=1,
+        zip_out=False,
+        zip_only=True,
+        resume=True,
+    )
+    with pytest.raises(ValueError, match="zip_only"):
+        run(params)
+
+
+def test_process_chunk_zip_only_returns_entries(tmp_path: Path) -> None:
+    out = tmp_path / "_out"
+    params = Params(
+        runs=2,
+        thresholds=[0.5],
+        out=out,
+        seed_base=3,
+        workers=1,
+        zip_out=False,
+        zip_only=True,
+        zip_level=0,
+    )
+    chunk = process_chunk([1, 2], params)
+    assert [r["run_id"] for r in chunk.results] == [1, 2]
+    assert all(e.name.startswith("run_0002/") for e in chunk.entries[1])
+    assert all(e.method == 0 for entries in chunk.entries for e in entries)
+    assert str(out) in chunk.results[0]["results"]["graph_analysis"]["0.50"]["path"]
+    assert not out.exists()
+
+
+def test_compress_files_keeps_input_order(tmp_path: Path) -> None:
+    files = []
+    for i in range(10):
+        p = tmp_path / f"f{i}"
+        p.write_bytes(bytes([i]) * (1000 * (10 - i)))
+        files.append((p.name, p))
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        entries = list(compress_files(files, 6, pool, window=3))
+    assert [e.name for e in entries] == [name for name, _ in files]
+    assert entries[0] == compress_entry("f0", files[0][1].read_bytes(), 6)
+
+
+def test_resumed_sweep_archives_reused_runs(tmp_path: Path) -> None:
+    out = tmp_path / "_out"
+    common = {"thresholds": [0.5], "out": out, "seed_base": 5, "workers": 1, "zip_out": True}
+    run(Params(runs=2, **common))  # type: ignore[arg-type]
+    _results, zip_path = run(Params(runs=3, resume=True, **common))  # type: ignore[arg-type]
+
+    assert zip_path is not None
+    with zipfile.ZipFile(zip_path) as zf:
+        assert zf.testzip() is None
+        names = zf.namelist()
+    expected = sorted(p.relative_to(out).as_posix() for p in out.rglob("*") if p.is_file())
+    assert sorted(names) == expected
+    assert len(names) == len(set(names))
+    assert "run_0001/multi.csv" in names
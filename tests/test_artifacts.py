@@ -56,7 +56,8 @@ def test_manifest_integrity_and_zip_contents(tmp_path: Path) -> None:
         raw = zf.read("run_0001/graph_analysis/thr_0.25_report.json").decode("utf-8")
         payload_any = json.loads(raw)
         payload = cast(dict[str, Any], payload_any)
-        assert set(payload.keys()) == {"nodes", "edges", "jaccard"}
+        assert set(payload.keys()) == {"nodes", "edges", "jaccard", "jaccard_ref"}
         assert payload["nodes"] == 10
         assert isinstance(payload["edges"], int)
-        assert 0.9 <= float(payload["jaccard"]) <= 1.0
+        # Premier seuil : graphe de référence, comparé à lui-même.
+        assert payload["jaccard"] == payload["jaccard_ref"] == 1.0
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks.suite import BenchResult, SuiteConfig, compare, main, measure, run_suite
+
+
+def test_measure_runs_warmup_then_repeats() -> None:
+    calls: list[int] = []
+    samples = measure(lambda: calls.append(1), warmup=2, repeat=3)
+    assert len(calls) == 5
+    assert len(samples) == 3 and all(s >= 0 for s in samples)
+
+
+def test_bench_result_stats() -> None:
+    r = BenchResult("x", [1.0, 2.0, 3.0, 4.0], work=10)
+    assert r.median == 2.5
+    assert r.p95 == pytest.approx(3.85)
+    assert r.throughput == 4.0
+    assert r.to_dict()["runs_per_s"] == 4.0
+
+
+def test_run_suite_covers_all_cases() -> None:
+    config = SuiteConfig(
+        runs=2, workers=[1], graph_nodes=[10, 50], warmup=0, repeat=1, analyzer_calls=1
+    )
+    report = run_suite(config)
+    names = [c["name"] for c in report["cases"]]
+    assert names == [
+        "analyzer/graph_analysis/n=10",
+        "analyzer/delta_stats",
+        "analyzer/mark_counts",
+        "analyzer/graph_analysis/n=50",
+        "orchestrator/run/n=10/workers=1",
+        "orchestrator/pool/n=10/workers=1",
+        "orchestrator/run/n=50/workers=1",
+        "orchestrator/pool/n=50/workers=1",
+        "startup/import",
+        "startup/cli_help",
+        "startup/worker/spawn",
+    ]
+    assert report["config"]["runs"] == 2
+    assert all(c["runs_per_s"] > 0 for c in report["cases"])
+
+
+def test_compare_flags_regressions() -> None:
+    baseline = {"cases": [{"name": "a", "median_s": 1.0}, {"name": "b", "median_s": 1.0}]}
+    current = {
+        "cases": [
+            {"name": "a", "median_s": 1.05},
+            {"name": "b", "median_s": 1.5},
+            {"name": "new", "median_s": 9.0},
+        ]
+    }
+    regressions = compare(current, baseline, tolerance=0.10)
+    assert len(regressions) == 1 and regressions[0].startswith("b:")
+
+
+def test_main_saves_and_compares(tmp_path: Path) -> None:
+    argv = ["--only", "analyzers", "--graph-nodes", "10", "--repeat", "1", "--warmup", "0"]
+    saved = tmp_path / "bench.json"
+    assert main([*argv, "--save", str(saved)]) == 0
+    assert json.loads(saved.read_text())["schema"] == 1
+    assert main([*argv, "--compare", str(saved), "--tolerance", "1000"]) == 0
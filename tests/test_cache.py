@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from delta_stats.analyzer import DeltaStatsAnalyzer
+from graph_analysis.analyzer import GraphAnalysisAnalyzer
+from mark_counts.analyzer import MarkCountsAnalyzer
+from orchestrator.cache import ResultCache, cached_analyze
+from orchestrator.dataset import generate_dataset
+from orchestrator.run import Params, process_chunk, process_run, run
+
+
+def _params(out: Path, cache_dir: Path, **kw: Any) -> Params:
+    return Params(
+        runs=3,
+        thresholds=[0.25, 0.5],
+        out=out,
+        seed_base=50,
+        workers=1,
+        zip_out=False,
+        cache_dir=cache_dir,
+        **kw,
+    )
+
+
+def test_cache_key_covers_analyzer_identity() -> None:
+    g = GraphAnalysisAnalyzer([0.25])
+    base = ResultCache.key(g, run_id=1, seed=2)
+    assert base == ResultCache.key(GraphAnalysisAnalyzer([0.25]), run_id=1, seed=2)
+    assert base != ResultCache.key(GraphAnalysisAnalyzer([0.5]), run_id=1, seed=2)
+    assert base != ResultCache.key(g, run_id=1, seed=3)
+    assert base != ResultCache.key(g, run_id=2, seed=2)
+    assert ResultCache.key(DeltaStatsAnalyzer(), 1, 2) != ResultCache.key(
+        MarkCountsAnalyzer(), 1, 2
+    )
+    # Le dataset passé aux analyzers fait partie de la clé.
+    small, large = generate_dataset(2, 16, 8), generate_dataset(2, 32, 8)
+    assert base != ResultCache.key(g, 1, 2, small) != ResultCache.key(g, 1, 2, large)
+    assert ResultCache.key(g, 1, 2, small) == ResultCache.key(g, 1, 2, small.copy())
+
+
+def test_cache_key_follows_declared_inputs() -> None:
+    # Legacy : seule la seed compte (et la parité du run pour graph_analysis).
+    legacy = DeltaStatsAnalyzer("legacy")
+    assert ResultCache.key(legacy, 1, 7) == ResultCache.key(legacy, 6, 7)
+    marks = MarkCountsAnalyzer("legacy")
+    assert ResultCache.key(marks, 1, 7) == ResultCache.key(marks, 6, 7)
+    graph = GraphAnalysisAnalyzer([0.25], "legacy")
+    assert ResultCache.key(graph, 1, 7) == ResultCache.key(graph, 3, 7)
+    assert ResultCache.key(graph, 1, 7) != ResultCache.key(graph, 2, 7)
+    # Generator : le flux dépend de (seed_base, run_id).
+    assert ResultCache.key(MarkCountsAnalyzer(), 1, 7) != ResultCache.key(
+        MarkCountsAnalyzer(), 6, 7
+    )
+
+    class Plain:
+        name = "plain"
+        version = "1"
+
+        def config(self) -> dict[str, Any]:
+            return {}
+
+    # Sans cache_inputs : (run_id, seed), par prudence.
+    assert ResultCache.key(Plain(), 1, 7) != ResultCache.key(Plain(), 6, 7)  # type: ignore[arg-type]
+
+
+def test_overlapping_legacy_seed_ranges_hit_the_cache(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+
+    def entries() -> int:
+        return len(list(cache_dir.glob("??/*")))
+
+    base = _params(tmp_path / "a", cache_dir, rng_mode="legacy", analyzers=("delta_stats",))
+    base = replace(base, runs=20, seed_base=1000)
+    run(base)
+    assert entries() == 20
+    shifted, _ = run(replace(base, out=tmp_path / "b", seed_base=1005))
+    # 15 seeds communes : seules les 5 nouvelles sont calculées.
+    assert entries() == 25
+    fresh, _ = run(replace(base, out=tmp_path / "c", seed_base=1005, cache_dir=None))
+    assert [r["results"] for r in shifted] == [
+        json.loads(json.dumps(r["results"]).replace(str(tmp_path / "c"), str(tmp_path / "b")))
+        for r in fresh
+    ]
+    assert [r["hashes"] for r in shifted] == [r["hashes"] for r in fresh]
+
+    run(replace(base, out=tmp_path / "d", rng_mode="generator"))
+    run(replace(base, out=tmp_path / "e", rng_mode="generator", seed_base=1005))
+    assert entries() == 25 + 40
+
+
+def test_cache_hits_restore_artifacts_and_relocate_paths(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache_dir = tmp_path / "cache"
+    first = process_run(1, _params(tmp_path / "a", cache_dir))
+
+    calls: list[str] = []
+
+    def no_compute(self: Any, *args: Any) -> Any:
+        calls.append(type(self).__name__)
+        raise AssertionError("analyze should not run on a cache hit")
+
+    for cls in (GraphAnalysisAnalyzer, DeltaStatsAnalyzer, MarkCountsAnalyzer):
+        monkeypatch.setattr(cls, "analyze", no_compute)
+
+    second = process_run(1, _params(tmp_path / "b", cache_dir))
+    assert calls == []
+
+    report = tmp_path / "b" / "run_0001" / "graph_analysis" / "thr_0.25_report.json"
+    assert second["results"]["graph_analysis"]["0.25"]["path"] == str(report)
+    assert (
+        report.read_bytes()
+        == (tmp_path / "a" / "run_0001" / "graph_analysis" / "thr_0.25_report.json").read_bytes()
+    )
+    assert (tmp_path / "b" / "run_0001" / "mark_counts" / "count.txt").exists()
+    assert second["hashes"] == first["hashes"]
+    assert str(second["results"]).replace(str(tmp_path / "b"), str(tmp_path / "a")) == str(
+        first["results"]
+    )
+
+
+def test_cached_sweep_matches_uncached_sweep(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    run(_params(tmp_path / "_out", cache_dir))
+    uncached = (tmp_path / "_out" / "overview.json").read_bytes()
+    run(_params(tmp_path / "_out", cache_dir))
+    assert (tmp_path / "_out" / "overview.json").read_bytes() == uncached
+
+
+def test_cache_miss_and_lost_race(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = ResultCache(tmp_path / "cache", max_bytes=1 << 20)
+    a = MarkCountsAnalyzer()
+    assert cache.get(cache.key(a, 1, 1), a.name, tmp_path / "out") is None
+
+    # Analyzer sans sous-dossier de sortie.
+    key = "ab" + "0" * 62
+    cache.put(key, "nothing", tmp_path / "out", {"x": 1})
+    assert cache.get(key, "nothing", tmp_path / "out") == {"x": 1}
+    cache.put(key, "nothing", tmp_path / "out", {"x": 2})
+    assert cache.get(key, "nothing", tmp_path / "out") == {"x": 1}
+
+    def busy(self: Path, target: Any) -> Path:
+        raise OSError("directory not empty")
+
+    monkeypatch.setattr(Path, "rename", busy)
+    cached_analyze(cache, a, 2, 2, None, tmp_path / "out")
+    assert not list((tmp_path / "cache").glob(".tmp-*"))
+
+
+def test_evict_drops_least_recently_used(tmp_path: Path) -> None:
+    cache = ResultCache(tmp_path / "cache", max_bytes=1 << 20)
+    out = tmp_path / "out"
+    a = DeltaStatsAnalyzer()
+    keys = [cache.key(a, i, i) for i in range(3)]
+    for i, key in enumerate(keys):
+        cached_analyze(cache, a, i, i, None, out)
+        os.utime(cache.root / key[:2] / key, ns=(i, i))
+    cache.get(keys[0], a.name, out)  # rafraîchit l'entrée 0
+
+    assert cache.evict() == 0
+    entry_size = sum(p.stat().st_size for p in (cache.root / keys[0][:2]).rglob("*") if p.is_file())
+    cache.max_bytes = entry_size
+    assert cache.evict() == 2
+    assert (cache.root / keys[0][:2] / keys[0]).exists()
+    assert not (cache.root / keys[1][:2] / keys[1]).exists()
+
+
+def test_written_bytes_trigger_eviction(tmp_path: Path) -> None:
+    cache = ResultCache(tmp_path / "cache", max_bytes=1 << 20)
+    cached_analyze(cache, DeltaStatsAnalyzer(), 1, 1, None, tmp_path / "out")
+    size = sum(p.stat().st_size for p in cache.root.rglob("*") if p.is_file())
+    assert cache.written == size > 0
+
+    cache.max_bytes = 8 * size
+    cache.account(size)
+    assert cache.root.exists() and any(cache.root.glob("??/*"))
+    cache.max_bytes = size // 2
+    # Au-delà d'un huitième du budget : éviction immédiate, sans attendre la fin.
+    cache.account(size)
+    assert not any(cache.root.glob("??/*"))
+
+
+def test_sweep_evicts_while_running(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    evictions: list[Path] = []
+    evict = ResultCache.evict
+
+    def counting(self: ResultCache) -> int:
+        evictions.append(self.root)
+        return evict(self)
+
+    monkeypatch.setattr(ResultCache, "evict", counting)
+    params = _params(tmp_path / "_out", tmp_path / "cache", chunk_size=1, cache_max_bytes=1)
+    run(replace(params, runs=5))
+    # Début de sweep, après chaque chunk (budget de 1 octet), fin de sweep.
+    assert len(evictions) == 1 + 5 + 1
+    assert not any((tmp_path / "cache").glob("??/*"))
+    # Les octets écrits par un worker remontent avec son chunk.
+    assert process_chunk([1], params).cache_bytes > 0
+
+    # Sweep interrompu : l'éviction a lieu quand même.
+    evictions.clear()
+    monkeypatch.setattr("orchestrator.run.write_timings", _boom)
+    with pytest.raises(RuntimeError):
+        run(replace(params, runs=2, cache_max_bytes=1 << 30))
+    assert len(evictions) >= 2
+
+
+def _boom(*args: Any) -> None:
+    raise RuntimeError("interrupted")
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import json
+import subprocess
+import sys
 from pathlib import Path
 
+import pytest
+
 from orchestrator.run import build_parser, main
 
 
@@ -41,3 +45,140 @@ def test_main_writes_outputs(tmp_path: Path) -> None:
     manifest = json.loads((out / "manifest.json").read_text(encoding="utf-8"))
     assert manifest["name"] == "EchoNull"
     assert manifest["runs"] == 2
+
+
+def test_chunk_size_flag() -> None:
+    parser = build_parser()
+    assert parser.parse_args([]).chunk_size is None
+    assert parser.parse_args(["--chunk-size", "16"]).chunk_size == 16
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--chunk-size", "0"])
+
+
+def test_dataset_flags() -> None:
+    parser = build_parser()
+    args = parser.parse_args([])
+    assert args.write_dataset is True
+    assert args.dataset_format == "csv"
+    args = parser.parse_args(["--no-dataset", "--dataset-format", "npy"])
+    assert args.write_dataset is False
+    assert args.dataset_format == "npy"
+
+
+def test_resume_flag() -> None:
+    parser = build_parser()
+    assert parser.parse_args([]).resume is False
+    assert parser.parse_args(["--resume"]).resume is True
+
+
+def test_cache_flags(tmp_path: Path) -> None:
+    args = build_parser().parse_args(["--cache-dir", str(tmp_path), "--cache-max-mb", "8"])
+    assert args.cache_dir == str(tmp_path)
+    assert args.cache_max_mb == 8
+    out = str(tmp_path / "_out")
+    cache = str(tmp_path / "cache")
+    rc = main(["--runs", "1", "--out", out, "--workers", "1", "--cache-dir", cache])
+    assert rc == 0
+    assert list((tmp_path / "cache").glob("??/*"))
+
+
+def test_rng_flag() -> None:
+    parser = build_parser()
+    assert parser.parse_args([]).rng_mode == "generator"
+    assert parser.parse_args(["--rng", "legacy"]).rng_mode == "legacy"
+
+
+def test_analyzer_threads_flag() -> None:
+    parser = build_parser()
+    assert parser.parse_args([]).analyzer_threads == 1
+    assert parser.parse_args(["--analyzer-threads", "3"]).analyzer_threads == 3
+
+
+def test_graph_flags() -> None:
+    parser = build_parser()
+    args = parser.parse_args([])
+    assert (args.graph_nodes, args.graph_engine) == (10, "networkx")
+    args = parser.parse_args(["--graph-nodes", "10000", "--graph-engine", "numpy"])
+    assert (args.graph_nodes, args.graph_engine) == (10000, "numpy")
+
+
+def test_graph_sweep_flag() -> None:
+    parser = build_parser()
+    assert parser.parse_args([]).graph_sweep == "independent"
+    assert parser.parse_args(["--graph-sweep", "coupled"]).graph_sweep == "coupled"
+
+
+def test_graph_reports_flag() -> None:
+    parser = build_parser()
+    assert parser.parse_args([]).graph_report_layout == "files"
+    assert parser.parse_args(["--graph-reports", "jsonl"]).graph_report_layout == "jsonl"
+
+
+def test_zip_flags() -> None:
+    parser = build_parser()
+    args = parser.parse_args([])
+    assert (args.zip_only, args.zip_level) == (False, 6)
+    args = parser.parse_args(["--zip-only", "--zip-level", "0"])
+    assert (args.zip_only, args.zip_level) == (True, 0)
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--zip-level", "10"])
+
+
+def test_dataset_shape_flag(tmp_path: Path) -> None:
+    parser = build_parser()
+    assert parser.parse_args([]).dataset_shape == (256, 8)
+    assert parser.parse_args(["--dataset-shape", "64x3"]).dataset_shape == (64, 3)
+    for bad in ("64", "0x3"):
+        with pytest.raises(SystemExit):
+            parser.parse_args(["--dataset-shape", bad])
+
+    out = tmp_path / "_out"
+    assert main(["--runs", "1", "--out", str(out), "--dataset-shape", "5x2", "--workers", "1"]) == 0
+    assert (out / "run_0001" / "multi.csv").read_text().splitlines()[0] == "c0,c1"
+
+
+def test_cli_import_is_lazy() -> None:
+    # pandas, networkx et les analyzers ne sont chargés qu'à l'usage.
+    code = (
+        "import sys, orchestrator.run\n"
+        "heavy = ('pandas', 'networkx', 'graph_analysis.analyzer', 'delta_stats.analyzer',"
+        " 'mark_counts.analyzer')\n"
+        "print([m for m in heavy if m in sys.modules])"
+    )
+    root = Path(__file__).resolve().parents[1]
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=root, check=True, capture_output=True, text=True
+    )
+    assert out.stdout.strip() == "[]"
+
+
+def test_analyzer_flags(tmp_path: Path) -> None:
+    parser = build_parser()
+    args = parser.parse_args([])
+    assert (args.analyzers, args.exclude_analyzers) == (None, ())
+    args = parser.parse_args(
+        ["--analyzers", "delta_stats, mark_counts", "--exclude-analyzers", "x"]
+    )
+    assert (args.analyzers, args.exclude_analyzers) == (("delta_stats", "mark_counts"), ("x",))
+
+    out = tmp_path / "_out"
+    with pytest.raises(SystemExit):
+        main(["--runs", "1", "--out", str(out), "--analyzers", "nope"])
+    assert not out.exists()
+    main(
+        [
+            "--runs",
+            "2",
+            "--out",
+            str(out),
+            "--workers",
+            "1",
+            "--exclude-analyzers",
+            "graph_analysis",
+        ]
+    )
+    assert sorted(p.name for p in (out / "run_0001").iterdir()) == [
+        "delta_stats",
+        "mark_counts",
+        "multi.csv",
+    ]
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from orchestrator import query
+from orchestrator.columns import ColumnWriter, flatten_result
+from orchestrator.run import Params, run
+
+
+def test_flatten_result_keeps_scalars_only() -> None:
+    result = {
+        "run_id": 3,
+        "results": {"g": {"0.50": {"n": 4, "j": 0.5, "path": "x"}}, "m": {"ok": True}},
+    }
+    assert flatten_result(result) == {"run_id": 3, "g/0.50/n": 4, "g/0.50/j": 0.5, "m/ok": True}
+
+
+def test_columns_match_overview(tmp_path: Path) -> None:
+    out = tmp_path / "_out"
+    params = Params(runs=5, thresholds=[0.25, 0.7], out=out, seed_base=11, workers=1, zip_out=False)
+    results, _ = run(params)
+
+    schema = query.list_columns(out)
+    assert schema["run_id"] == "<i8"
+    assert schema["graph_analysis/0.70/n_edges"] == "<i8"
+    assert schema["delta_stats/abs_p99"] == "<f8"
+    assert not any(name.endswith("/path") for name in schema)
+
+    cols = query.load_columns(out, ["run_id", "delta_stats/abs_p99", "graph_analysis/0.70/jaccard"])
+    assert isinstance(cols["run_id"], np.memmap)
+    assert cols["run_id"].tolist() == [1, 2, 3, 4, 5]
+    assert cols["delta_stats/abs_p99"].tolist() == [
+        r["results"]["delta_stats"]["abs_p99"] for r in results
+    ]
+    assert cols["graph_analysis/0.70/jaccard"].tolist() == [
+        r["results"]["graph_analysis"]["0.70"]["jaccard"] for r in results
+    ]
+    overview = json.loads((out / "overview.json").read_text(encoding="utf-8"))
+    edges = query.load_column(out, "graph_analysis/0.25/n_edges", mmap=False)
+    assert not isinstance(edges, np.memmap)
+    assert edges.tolist() == [r["results"]["graph_analysis"]["0.25"]["n_edges"] for r in overview]
+
+    with pytest.raises(KeyError):
+        query.load_column(out, "nope")
+
+
+def test_empty_writer_and_column_mismatch(tmp_path: Path) -> None:
+    with ColumnWriter(tmp_path / "columns"):
+        pass
+    assert query.list_columns(tmp_path) == {}
+
+    root = tmp_path / "broken"
+    with pytest.raises(ValueError, match="columns differ"), ColumnWriter(root) as writer:
+        writer.write({"run_id": 1, "results": {"a": 1}})
+        writer.write({"run_id": 2, "results": {"b": 1}})
+    # Sweep interrompu : pas de schéma, les colonnes restent vides.
+    assert not (root / "columns.json").exists()
+    assert np.load(root / "a.npy").shape == (0,)
+    assert writer.rows == 1
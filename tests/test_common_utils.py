@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 
-from common.utils import compute_sha256, perf_timer
+import pytest
+
+import common.utils
+from common.utils import compute_sha256, compute_sha256_many, perf_timer
 
 
 def test_compute_sha256(tmp_path: Path) -> None:
@@ -13,6 +17,26 @@ def test_compute_sha256(tmp_path: Path) -> None:
     assert len(h) == 64
 
 
+@pytest.mark.parametrize("threshold", [1, 1 << 40])
+def test_compute_sha256_mmap_and_buffered_agree(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, threshold: int
+) -> None:
+    monkeypatch.setattr(common.utils, "MMAP_HASH_THRESHOLD", threshold)
+    p = tmp_path / "x.bin"
+    p.write_bytes(bytes(range(256)) * 5000)
+    assert compute_sha256(p) == hashlib.sha256(p.read_bytes()).hexdigest()
+
+
+def test_compute_sha256_many(tmp_path: Path) -> None:
+    paths = []
+    for i in range(5):
+        paths.append(tmp_path / f"{i}.bin")
+        paths[-1].write_bytes(bytes([i]) * 1000)
+    expected = [compute_sha256(p) for p in paths]
+    assert compute_sha256_many(paths, workers=3) == expected
+    assert compute_sha256_many(paths, workers=1) == expected
+
+
 def test_perf_timer_wraps() -> None:
     calls = {"n": 0}
 
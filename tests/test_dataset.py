@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from common.utils import compute_sha256
+from orchestrator.dataset import (
+    dataset_filename,
+    dataset_sha256,
+    generate_dataset,
+    load_dataset,
+    write_dataset,
+)
+from orchestrator.run import Params, process_run
+
+
+def test_write_dataset_formats_round_trip(tmp_path: Path) -> None:
+    data = generate_dataset(seed=3, rows=16, cols=4)
+
+    for fmt in ("csv", "npy"):
+        name, digest = write_dataset(tmp_path / fmt, data, fmt)
+        path = tmp_path / fmt / name
+        assert name == f"multi.{fmt}"
+        assert digest == compute_sha256(path)
+        np.testing.assert_allclose(load_dataset(path), data, rtol=1e-6)
+
+
+def test_npy_dataset_is_memory_mapped_and_canonical(tmp_path: Path) -> None:
+    data = generate_dataset(seed=3, rows=16, cols=4)
+    name, _ = write_dataset(tmp_path, data, "npy")
+
+    mapped = load_dataset(tmp_path / name)
+    assert isinstance(mapped, np.memmap)
+    assert mapped.dtype == np.dtype("<f4")
+    np.testing.assert_array_equal(mapped, data)
+    assert not isinstance(load_dataset(tmp_path / name, mmap=False), np.memmap)
+
+    # Le hash canonique ne dépend ni de l'ordre mémoire ni du format disque.
+    assert dataset_sha256(np.asfortranarray(data)) == dataset_sha256(mapped)
+
+
+def test_unknown_dataset_format_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        dataset_filename("parquet")
+
+
+def test_process_run_with_npy_dataset(tmp_path: Path) -> None:
+    params = Params(
+        runs=1,
+        thresholds=[0.25],
+        out=tmp_path,
+        seed_base=100,
+        workers=1,
+        zip_out=False,
+        dataset_format="npy",
+    )
+    r = process_run(1, params)
+    assert "multi.npy" in r["hashes"] and "multi.csv" not in r["hashes"]
+    assert r["dataset_sha256"] == dataset_sha256(load_dataset(tmp_path / "run_0001/multi.npy"))
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import cast
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from graph_analysis.analyzer import GraphAnalysisAnalyzer
+from graph_analysis.engine import (
+    EdgeArray,
+    edge_probability,
+    intersection_size,
+    jaccard,
+    n_pairs,
+    nest,
+    pairs_from_index,
+    sample_gnp_edges,
+    sample_gnp_indices,
+)
+
+
+def test_pairs_from_index_enumerates_every_pair_once() -> None:
+    n = 40
+    u, v = pairs_from_index(np.arange(n_pairs(n)))
+    assert (u < v).all()
+    assert (v < n).all()
+    assert len(set(zip(u.tolist(), v.tolist(), strict=True))) == n_pairs(n)
+
+    big = np.array([2**40, 10**12 - 1, n_pairs(1_000_000) - 1])
+    u, v = pairs_from_index(big)
+    assert (v * (v - 1) // 2 + u == big).all()
+    assert (u < v).all()
+
+
+def test_sample_gnp_indices_edge_cases() -> None:
+    rng = np.random.default_rng(0)
+    assert sample_gnp_indices(1, 0.5, rng).size == 0
+    assert sample_gnp_indices(10, 0.0, rng).size == 0
+    np.testing.assert_array_equal(sample_gnp_indices(5, 1.0, rng), np.arange(10))
+
+    idx = sample_gnp_indices(300, 0.05, rng)
+    assert (np.diff(idx) > 0).all()
+    assert idx[-1] < n_pairs(300)
+
+
+def test_sample_gnp_edges_matches_expected_density() -> None:
+    n, p = 200, 0.3
+    counts = [sample_gnp_edges(n, p, np.random.default_rng(s)).n_edges for s in range(100)]
+    expected = n_pairs(n) * p
+    assert abs(np.mean(counts) - expected) < 0.02 * expected
+
+
+def test_large_sparse_graph_without_networkx() -> None:
+    n = 200_000
+    edges = sample_gnp_edges(n, edge_probability(0.5, n), np.random.default_rng(1))
+    # Degré moyen conservé par rapport au graphe de référence à 10 nœuds.
+    assert abs(2 * edges.n_edges / n - 9 * 0.45) < 0.05
+    indptr, indices = edges.to_csr()
+    assert indptr[-1] == indices.size == 2 * edges.n_edges
+    assert (np.diff(indptr) >= 0).all()
+
+
+def test_edge_array_from_networkx_and_csr() -> None:
+    g = nx.path_graph(4)
+    edges = EdgeArray.from_pairs(4, [(1, 0), (1, 2), (3, 2)])
+    assert edges.n_edges == g.number_of_edges()
+    indptr, indices = edges.to_csr()
+    neighbours = {i: sorted(indices[indptr[i] : indptr[i + 1]].tolist()) for i in range(4)}
+    assert neighbours == {i: sorted(g.neighbors(i)) for i in range(4)}
+    assert EdgeArray.from_pairs(3, []).n_edges == 0
+
+
+def test_edge_probability_is_unchanged_for_reference_size() -> None:
+    assert edge_probability(0.5, 10) == 0.45
+    assert edge_probability(1.99, 10) == 0.99
+    assert edge_probability(0.5, 100) == pytest.approx(0.45 * 9 / 99)
+
+
+def test_numpy_engine_in_analyzer(tmp_path: Path) -> None:
+    a = GraphAnalysisAnalyzer([0.25, 0.5], n=5000, engine="numpy")
+    r = a.analyze(run_id=2, seed=3, data=None, output_dir=tmp_path)["graph_analysis"]
+    assert r["0.25"]["n_nodes"] == 5000
+    assert 0 < r["0.25"]["n_edges"] < r["0.50"]["n_edges"]
+    assert r == a.analyze(run_id=2, seed=3, data=None, output_dir=tmp_path)["graph_analysis"]
+
+    with pytest.raises(ValueError):
+        GraphAnalysisAnalyzer(engine="igraph")
+
+
+def test_sample_gnp_indices_draws_more_blocks_when_needed() -> None:
+    class DenseGaps:
+        # Écarts minimaux : le premier bloc ne suffit pas à couvrir toutes les paires.
+        def geometric(self, p: float, size: int) -> np.ndarray:
+            return np.ones(size, dtype=np.int64)
+
+    idx = sample_gnp_indices(100, 0.01, cast(np.random.Generator, DenseGaps()))
+    np.testing.assert_array_equal(idx, np.arange(n_pairs(100)))
+
+
+def test_nested_graphs_are_prefixes_with_expected_density() -> None:
+    n, p_max = 300, 0.4
+    base = sample_gnp_edges(n, p_max, np.random.default_rng(5))
+    nested = nest(base, p_max, np.random.default_rng(6))
+    assert (np.diff(nested.weights) >= 0).all()
+
+    ps = [0.1, 0.2, 0.4]
+    small, mid, full = nested.graphs(ps)
+    assert full.n_edges == base.n_edges
+    assert small.n_edges <= mid.n_edges <= full.n_edges
+    np.testing.assert_array_equal(mid.src[: small.n_edges], small.src)
+    assert abs(mid.n_edges - n_pairs(n) * 0.2) < 0.1 * n_pairs(n) * 0.2
+    assert nested.counts([0.0, 1.0]).tolist() == [0, base.n_edges]
+
+
+@pytest.mark.parametrize("engine", ["networkx", "numpy"])
+def test_coupled_sweep_in_analyzer(tmp_path: Path, engine: str) -> None:
+    thresholds = [0.8, 0.25, 0.5]
+    a = GraphAnalysisAnalyzer(thresholds, n=400, engine=engine, sweep="coupled")
+    r = a.analyze(run_id=2, seed=9, data=None, output_dir=tmp_path)["graph_analysis"]
+    assert list(r) == ["0.80", "0.25", "0.50"]
+    assert r["0.25"]["n_edges"] <= r["0.50"]["n_edges"] <= r["0.80"]["n_edges"]
+    assert all(v["n_nodes"] == 400 for v in r.values())
+
+    empty = GraphAnalysisAnalyzer([], sweep="coupled").analyze(2, 9, None, tmp_path)
+    assert empty == {"graph_analysis": {}}
+    with pytest.raises(ValueError):
+        GraphAnalysisAnalyzer(sweep="adaptive")
+
+
+def test_jaccard_on_sorted_edge_keys() -> None:
+    a = np.array([1, 3, 5, 7], dtype=np.int64)
+    b = np.array([3, 4, 5, 8, 9], dtype=np.int64)
+    assert intersection_size(a, b) == 2
+    assert intersection_size(b, a) == 2
+    assert jaccard(a, b) == 2 / 7
+    assert jaccard(a, a) == 1.0
+    empty = np.empty(0, dtype=np.int64)
+    assert jaccard(empty, empty) == 1.0
+    assert jaccard(empty, a) == 0.0
+
+    rng = np.random.default_rng(3)
+    x = np.unique(rng.integers(0, 10_000, 3_000))
+    y = np.unique(rng.integers(0, 10_000, 4_000))
+    expected = len(set(x.tolist()) & set(y.tolist())) / len(set(x.tolist()) | set(y.tolist()))
+    assert jaccard(x, y) == expected
+
+
+def test_edge_keys_are_sorted_and_unique() -> None:
+    edges = EdgeArray.from_pairs(5, [(3, 4), (0, 1), (2, 0)])
+    assert edges.keys().tolist() == [0 * 5 + 1, 0 * 5 + 2, 3 * 5 + 4]
+
+
+def test_analyzer_reports_real_jaccard(tmp_path: Path) -> None:
+    thresholds = [0.25, 0.5, 0.8]
+    a = GraphAnalysisAnalyzer(thresholds, n=500, engine="numpy", sweep="coupled")
+    r = a.analyze(run_id=1, seed=4, data=None, output_dir=tmp_path)["graph_analysis"]
+
+    # Graphes emboîtés : J(G_a, G_b) = |E_a| / |E_b|.
+    edges = [r[f"{t:.2f}"]["n_edges"] for t in thresholds]
+    assert r["0.25"]["jaccard"] == r["0.25"]["jaccard_ref"] == 1.0
+    assert r["0.50"]["jaccard"] == edges[0] / edges[1]
+    assert r["0.80"]["jaccard"] == edges[1] / edges[2]
+    assert r["0.80"]["jaccard_ref"] == edges[0] / edges[2]
+
+    independent = GraphAnalysisAnalyzer(thresholds, n=500, engine="numpy")
+    r = independent.analyze(run_id=1, seed=4, data=None, output_dir=tmp_path)["graph_analysis"]
+    assert 0.0 < r["0.50"]["jaccard"] < 1.0
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from graph_analysis.analyzer import GraphAnalysisAnalyzer
+from graph_analysis.reports import REPORTS_NAME, read_report, write_reports
+from orchestrator.run import Params, run
+
+
+def test_write_and_read_consolidated_reports(tmp_path: Path) -> None:
+    reports: dict[str, dict[str, Any]] = {"0.25": {"edges": 3}, "0.50": {"edges": 10, "note": "é"}}
+    path = write_reports(tmp_path, reports)
+    assert path == tmp_path / REPORTS_NAME
+    assert read_report(path, "0.50") == {"edges": 10, "note": "é"}
+    assert read_report(tmp_path, "0.25") == {"edges": 3}
+    with pytest.raises(KeyError):
+        read_report(path, "0.99")
+
+
+def test_jsonl_layout_matches_per_file_layout(tmp_path: Path) -> None:
+    thresholds = [0.25, 0.5, 0.7]
+    files = GraphAnalysisAnalyzer(thresholds).analyze(1, 5, None, tmp_path / "a")
+    jsonl = GraphAnalysisAnalyzer(thresholds, report_layout="jsonl").analyze(
+        1, 5, None, tmp_path / "b"
+    )
+
+    out_a = tmp_path / "a" / "graph_analysis"
+    out_b = tmp_path / "b" / "graph_analysis"
+    assert [p.name for p in out_b.iterdir()] == [REPORTS_NAME]
+    for key in ("0.25", "0.50", "0.70"):
+        assert read_report(out_a, key) == read_report(out_b, key)
+        assert read_report(Path(files["graph_analysis"][key]["path"]), key) == read_report(
+            Path(jsonl["graph_analysis"][key]["path"]), key
+        )
+        assert jsonl["graph_analysis"][key]["path"] == str(out_b / REPORTS_NAME)
+
+    empty = GraphAnalysisAnalyzer([], report_layout="jsonl").analyze(1, 5, None, tmp_path / "c")
+    assert empty == {"graph_analysis": {}}
+    assert not (tmp_path / "c" / "graph_analysis" / REPORTS_NAME).exists()
+
+    with pytest.raises(ValueError):
+        GraphAnalysisAnalyzer(report_layout="sqlite")
+
+
+def test_sweep_with_consolidated_reports(tmp_path: Path) -> None:
+    params = Params(
+        runs=2,
+        thresholds=[0.25, 0.5],
+        out=tmp_path,
+        seed_base=1,
+        workers=1,
+        zip_out=False,
+        graph_report_layout="jsonl",
+    )
+    results, _ = run(params)
+    run_dir = tmp_path / "run_0002" / "graph_analysis"
+    assert sorted(p.name for p in run_dir.iterdir()) == [REPORTS_NAME]
+    assert read_report(run_dir, "0.50")["edges"] == (
+        results[1]["results"]["graph_analysis"]["0.50"]["n_edges"]
+    )
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+
+from common.utils import compute_sha256
+from orchestrator.merkle import MERKLE_EMPTY, MerkleBuilder, run_digest
+from orchestrator.run import Params, run
+
+
+def _reference_root(leaves: list[bytes]) -> bytes:
+    # Définition récursive de la RFC 6962 (MTH).
+    if len(leaves) == 1:
+        return hashlib.sha256(b"\x00" + leaves[0]).digest()
+    k = 1
+    while k * 2 < len(leaves):
+        k *= 2
+    left, right = _reference_root(leaves[:k]), _reference_root(leaves[k:])
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 5, 8, 13])
+def test_builder_matches_rfc6962(n: int) -> None:
+    leaves = [hashlib.sha256(str(i).encode()).hexdigest() for i in range(n)]
+    builder = MerkleBuilder()
+    for leaf in leaves:
+        builder.add(leaf)
+    assert builder.count == n
+    assert builder.root() == _reference_root([bytes.fromhex(x) for x in leaves]).hex()
+    assert MerkleBuilder().root() == MERKLE_EMPTY
+
+
+def test_run_digest_is_order_independent() -> None:
+    assert run_digest({"a": "1", "b": "2"}) == run_digest({"b": "2", "a": "1"})
+    assert run_digest({"a": "1"}) != run_digest({"a": "2"})
+
+
+def test_manifest_covers_every_artifact(tmp_path: Path) -> None:
+    out = tmp_path / "_out"
+    params = Params(runs=3, thresholds=[0.25, 0.5], out=out, seed_base=9, workers=2, zip_out=False)
+    results, _ = run(params)
+    manifest = json.loads((out / "manifest.json").read_text(encoding="utf-8"))
+
+    for r in results:
+        run_dir = out / f"run_{r['run_id']:04d}"
+        on_disk = {p.relative_to(run_dir).as_posix() for p in run_dir.rglob("*") if p.is_file()}
+        assert set(r["hashes"]) == on_disk
+        assert all(compute_sha256(run_dir / n) == d for n, d in r["hashes"].items())
+
+    builder = MerkleBuilder()
+    for r in results:
+        builder.add(run_digest(r["hashes"]))
+    assert manifest["runs_merkle_root"] == builder.root()
+
+    assert "aggregate.json" in manifest["files"]
+    assert "columns/columns.json" in manifest["files"]
+    assert all(compute_sha256(out / n) == d for n, d in manifest["files"].items())
@@ -1,9 +1,28 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
+from concurrent.futures import Future
+from dataclasses import replace
 from pathlib import Path
+from typing import Any
 
-from orchestrator.run import Params, _parse_thresholds, process_run, run
+import pytest
+
+from common.utils import compute_sha256
+from orchestrator.aggregate import Aggregator
+from orchestrator.overview import OverviewWriter
+from orchestrator.run import (
+    ChunkResult,
+    Params,
+    _auto_chunk_size,
+    _iter_chunks,
+    _iter_results,
+    _parse_thresholds,
+    process_chunk,
+    process_run,
+    run,
+)
 
 
 def test_parse_thresholds() -> None:
@@ -35,3 +54,111 @@ def test_process_run_and_run(tmp_path: Path) -> None:
 
     assert z is not None
     assert z.exists()
+
+
+def test_chunking_covers_all_runs_in_order(tmp_path: Path) -> None:
+    assert _auto_chunk_size(runs=0, workers=4) == 1
+    assert _auto_chunk_size(runs=100, workers=4) == 7
+    assert _auto_chunk_size(runs=100, workers=0) == 25
+    assert _auto_chunk_size(runs=100_000, workers=8) == 64
+
+    chunks = list(_iter_chunks(range(1, 11), 4))
+    assert chunks == [range(1, 5), range(5, 9), range(9, 11)]
+
+    params = Params(
+        runs=5,
+        thresholds=[0.25],
+        out=tmp_path / "_out",
+        seed_base=100,
+        workers=2,
+        zip_out=False,
+        chunk_size=2,
+    )
+    results, _ = run(params)
+    assert [r["run_id"] for r in results] == [1, 2, 3, 4, 5]
+    assert process_chunk(range(1, 3), params).results == results[:2]
+
+
+def test_overview_is_streamed_and_hashed_while_writing(tmp_path: Path) -> None:
+    out = tmp_path / "_out"
+    params = Params(
+        runs=4,
+        thresholds=[0.25],
+        out=out,
+        seed_base=5,
+        workers=1,
+        zip_out=False,
+        chunk_size=1,
+        collect_results=False,
+    )
+    results, _ = run(params)
+    assert results == []
+
+    raw = (out / "overview.json").read_bytes()
+    overview = json.loads(raw)
+    assert [r["run_id"] for r in overview] == [1, 2, 3, 4]
+    assert raw == json.dumps(overview, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    manifest = json.loads((out / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["overview_sha256"] == compute_sha256(out / "overview.json")
+
+
+def test_overview_writer_leaves_partial_file_on_error(tmp_path: Path) -> None:
+    path = tmp_path / "overview.json"
+    with pytest.raises(RuntimeError), OverviewWriter(path) as w:
+        w.write({"run_id": 1})
+        raise RuntimeError("boom")
+    assert path.read_bytes() == b'[{"run_id":1}'
+    assert w.count == 1
+
+
+def test_analyzer_threads_merge_results_deterministically(tmp_path: Path) -> None:
+    base = Params(
+        runs=3,
+        thresholds=[0.25, 0.5, 0.7],
+        out=tmp_path / "seq",
+        seed_base=9,
+        workers=1,
+        zip_out=False,
+    )
+    threaded = replace(base, out=tmp_path / "thr", analyzer_threads=3)
+
+    one = process_run(1, threaded)
+    assert list(one["results"]) == ["graph_analysis", "delta_stats", "mark_counts"]
+
+    run(base)
+    run(threaded)
+    seq = (tmp_path / "seq" / "overview.json").read_text(encoding="utf-8")
+    thr = (tmp_path / "thr" / "overview.json").read_text(encoding="utf-8")
+    assert thr == seq.replace(str(tmp_path / "seq"), str(tmp_path / "thr"))
+
+
+class _CountingPool:
+    """Pool factice : compte les runs soumis mais pas encore consommés."""
+
+    def __init__(self, workers: int) -> None:
+        self.workers = workers
+        self.submitted = 0
+
+    def submit(self, run_ids: Sequence[int], params: Params) -> Future[ChunkResult]:
+        self.submitted += len(run_ids)
+        future: Future[ChunkResult] = Future()
+        results = [{"run_id": i} for i in run_ids]
+        future.set_result(ChunkResult(results=results, entries=[[] for _ in run_ids]))
+        return future
+
+
+@pytest.mark.parametrize("runs", [1_000, 100_000])
+def test_buffered_results_stay_bounded(runs: int, tmp_path: Path) -> None:
+    params = Params(
+        runs=runs, thresholds=[0.5], out=tmp_path, seed_base=0, workers=8, zip_out=False
+    )
+    pool = _CountingPool(workers=8)
+    peak = consumed = 0
+    results: Any = _iter_results(params, list(range(1, runs + 1)), Aggregator(), {}, pool)  # type: ignore[arg-type]
+    for _result, _entries in results:
+        consumed += 1
+        peak = max(peak, pool.submitted - consumed)
+    assert consumed == runs
+    # Même borne quel que soit runs : 2 chunks de 64 runs par worker.
+    assert peak < 2 * 8 * 64
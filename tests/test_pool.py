@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+from orchestrator import run as run_module
+from orchestrator.run import Params, SweepPool, process_chunk, run
+
+
+def _params(out: Path) -> Params:
+    return Params(runs=5, thresholds=[0.25, 0.7], out=out, seed_base=9, workers=2, zip_out=False)
+
+
+def _summary(results: list[dict[str, Any]]) -> list[tuple[Any, ...]]:
+    # Les chemins dépendent du dossier de sortie ; les contenus, non.
+    return [(r["run_id"], r["hashes"], r["dataset_sha256"]) for r in results]
+
+
+def test_pool_serves_several_sweeps(tmp_path: Path) -> None:
+    params = _params(tmp_path / "fresh")
+    expected = _summary(run(params)[0])
+
+    with SweepPool(workers=2, params=params) as pool:
+        first, _ = run(replace(params, out=tmp_path / "a"), pool=pool)
+        # Configuration différente : les analyzers sont construits au premier chunk.
+        other, _ = run(replace(params, out=tmp_path / "b", thresholds=[0.5], runs=3), pool=pool)
+        last, _ = run(replace(params, out=tmp_path / "c"), pool=pool)
+
+    assert _summary(first) == _summary(last) == expected
+    assert [r["run_id"] for r in other] == [1, 2, 3]
+    assert list(other[0]["results"]["graph_analysis"]) == ["0.50"]
+    overview = json.loads((tmp_path / "b" / "overview.json").read_text(encoding="utf-8"))
+    assert len(overview) == 3
+
+
+def test_worker_reuses_analyzers(tmp_path: Path) -> None:
+    params = _params(tmp_path / "_out")
+    run_module._warm.clear()
+    run_module._init_worker(None)
+    assert run_module._warm == {}
+    run_module._init_worker(params)
+    warm = run_module._warm_analyzers(params)
+    assert [a.name for a in warm] == ["graph_analysis", "delta_stats", "mark_counts"]
+
+    # Mêmes instances d'un chunk et d'un sweep à l'autre.
+    process_chunk([1, 2], params)
+    process_chunk([3], replace(params, out=tmp_path / "other", workers=1))
+    assert run_module._warm_analyzers(params) is warm
+    assert len(run_module._warm) == 1
+
+    # Nombre de configurations gardées borné : la plus ancienne est évincée.
+    for i in range(run_module._WARM_LIMIT):
+        run_module._warm_analyzers(replace(params, graph_nodes=20 + i))
+    assert len(run_module._warm) == run_module._WARM_LIMIT
+    assert run_module._warm_analyzers(params) is not warm
+    run_module._warm.clear()
+
+
+def test_warm_analyzers_are_keyed_on_all_content_fields(tmp_path: Path) -> None:
+    params = _params(tmp_path / "_out")
+    run_module._warm.clear()
+    warm = run_module._warm_analyzers(params)
+    # Champ lu seulement par une fabrique tierce : nouvelle construction.
+    for changed in (replace(params, dataset_shape=(64, 4)), replace(params, seed_base=10)):
+        assert run_module._warm_analyzers(changed) is not warm
+    # Planification seule : mêmes instances.
+    assert run_module._warm_analyzers(replace(params, runs=50, workers=1)) is warm
+    run_module._warm.clear()
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+import os
+import pstats
+from dataclasses import replace
+from pathlib import Path
+
+from common.timing import STAGES_NAME, TIMINGS_NAME, drain_timings
+from orchestrator.profiling import (
+    PROFILE_NAME,
+    PROFILE_REPORT_NAME,
+    PROFILES_DIR,
+    merge_profiles,
+)
+from orchestrator.run import Params, process_chunk, run
+from orchestrator.verify import verify
+
+
+def _params(out: Path) -> Params:
+    return Params(runs=4, thresholds=[0.25, 0.7], out=out, seed_base=3, workers=2, zip_out=False)
+
+
+def test_sweep_profiles_stages(tmp_path: Path) -> None:
+    out = tmp_path / "_out"
+    run(replace(_params(out), profile_stages=True, zip_out=True))
+    stages = json.loads((out / TIMINGS_NAME).read_text(encoding="utf-8"))["stages"]
+
+    for name in ("mkdir", "generate_dataset", "hash", "compress"):
+        assert stages[name]["count"] == 4
+    assert stages["analyzer:graph_analysis"]["count"] == 4
+    assert stages["prefetch"]["count"] >= 1
+    table = (out / STAGES_NAME).read_text(encoding="utf-8")
+    assert "analyzer:delta_stats" in table and "%" in table
+    assert verify(out).ok
+
+
+def test_sweep_without_flags_has_no_stages(tmp_path: Path) -> None:
+    out = tmp_path / "_out"
+    run(_params(out))
+    assert "stages" not in json.loads((out / TIMINGS_NAME).read_text(encoding="utf-8"))
+    assert not (out / STAGES_NAME).exists()
+    assert not (out / PROFILES_DIR).exists()
+
+
+def test_cprofile_per_chunk_and_merge(tmp_path: Path) -> None:
+    out = tmp_path / "_out"
+    params = replace(_params(out), cprofile=True, analyzer_threads=2, profile_stages=True)
+    run(params)
+    assert len(list((out / PROFILES_DIR).glob("*.prof"))) >= 1
+    merged = pstats.Stats(str(out / PROFILE_NAME))
+    assert any(func[2] == "process_run" for func in merged.stats)  # type: ignore[attr-defined]
+    assert "cumulative" in (out / PROFILE_REPORT_NAME).read_text(encoding="utf-8")
+
+    # Dans le processus courant : un fichier par chunk, nommé d'après son premier run.
+    drain_timings()
+    chunk = process_chunk([3, 4], params)
+    assert chunk.timings["stage:analyzer:mark_counts"].count == 2
+    assert len(list((out / PROFILES_DIR).glob(f"runs_000003_pid{os.getpid()}.prof"))) == 1
+
+    # Un nouveau sweep sans --cprofile ni --profile-stages efface les profils
+    # et rapports précédents.
+    assert (out / STAGES_NAME).exists()
+    run(replace(params, cprofile=False, profile_stages=False))
+    assert not (out / PROFILES_DIR).exists()
+    for name in (PROFILE_NAME, PROFILE_REPORT_NAME, STAGES_NAME):
+        assert not (out / name).exists()
+
+
+def test_merge_profiles_without_files(tmp_path: Path) -> None:
+    assert merge_profiles(tmp_path) is None
+    assert not (tmp_path / PROFILE_NAME).exists()
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+from dataclasses import replace
+from importlib.metadata import EntryPoint
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+
+from common import registry
+from common.utils import AnalyzerProtocol
+from graph_analysis.analyzer import GraphAnalysisAnalyzer
+from mark_counts.analyzer import MarkCountsAnalyzer
+from orchestrator.index import INDEX_NAME
+from orchestrator.run import Params, _run_analyzers, _warm_analyzers, run, selected_analyzers
+
+BUILTINS = ["graph_analysis", "delta_stats", "mark_counts"]
+
+
+def test_select_keeps_registration_order() -> None:
+    assert registry.available()[:3] == BUILTINS
+    assert registry.select(["mark_counts", "graph_analysis"]) == ["graph_analysis", "mark_counts"]
+    assert registry.select(exclude=["graph_analysis"])[:2] == ["delta_stats", "mark_counts"]
+    with pytest.raises(ValueError, match=r"unknown analyzers \['nope'\]"):
+        registry.select(["delta_stats", "nope"])
+    with pytest.raises(ValueError, match="no analyzer selected"):
+        registry.select(["delta_stats"], exclude=["delta_stats"])
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register("delta_stats", lambda params: MarkCountsAnalyzer())
+
+
+def test_entry_points_are_discovered_lazily(monkeypatch: pytest.MonkeyPatch) -> None:
+    eps = [
+        EntryPoint("extra", "orchestrator.run:_mark_counts", registry.ENTRY_POINT_GROUP),
+        # Un nom déjà enregistré n'est pas remplacé par un entry point.
+        EntryPoint("delta_stats", "orchestrator.run:_mark_counts", registry.ENTRY_POINT_GROUP),
+    ]
+    monkeypatch.setattr(registry, "_factories", dict(registry._factories))
+    monkeypatch.setattr(registry, "_discovered", False)
+    monkeypatch.setattr(registry, "entry_points", lambda group: eps)
+
+    assert registry.available() == [*BUILTINS, "extra"]
+    params = Params(
+        runs=1, thresholds=[0.5], out=Path("_out"), seed_base=0, workers=1, zip_out=False
+    )
+    assert registry.create("delta_stats", params).name == "delta_stats"
+    extra = registry.create("extra", params)
+    assert extra.name == "mark_counts" and registry.create("extra", params) is not extra
+
+
+def test_costs() -> None:
+    numpy = GraphAnalysisAnalyzer([0.25, 0.5], n=1000, engine="numpy")
+    nx = GraphAnalysisAnalyzer([0.25, 0.5], n=1000, engine="networkx")
+    coupled = GraphAnalysisAnalyzer([0.25, 0.5], n=1000, engine="networkx", sweep="coupled")
+    assert MarkCountsAnalyzer().cost == 1.0
+    assert MarkCountsAnalyzer().cost < numpy.cost < nx.cost
+    assert coupled.cost == nx.cost / 2
+
+
+class _RecordingExecutor:
+    def __init__(self) -> None:
+        self.order: list[str] = []
+
+    def submit(self, fn: Any, *args: Any) -> Future[dict[str, Any]]:
+        self.order.append(args[2].name)
+        future: Future[dict[str, Any]] = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+def test_threads_start_expensive_analyzers_first(tmp_path: Path) -> None:
+    params = Params(runs=1, thresholds=[0.5], out=tmp_path, seed_base=0, workers=1, zip_out=False)
+    threads = _RecordingExecutor()
+    for nodes, order in (
+        (10, ["delta_stats", "graph_analysis", "mark_counts"]),
+        (400, ["graph_analysis", "delta_stats", "mark_counts"]),
+    ):
+        threads.order.clear()
+        analyzers = _warm_analyzers(replace(params, graph_nodes=nodes))
+        results = _run_analyzers(
+            threads, False, None, analyzers, 1, 1, None, tmp_path  # type: ignore[arg-type]
+        )
+        assert threads.order == order
+        # Fusion dans l'ordre déclaré, pas dans l'ordre de lancement.
+        assert list(results) == BUILTINS
+
+
+def test_sweep_runs_only_selected_analyzers(tmp_path: Path) -> None:
+    out = tmp_path / "_out"
+    params = Params(
+        runs=3,
+        thresholds=[0.5],
+        out=out,
+        seed_base=1,
+        workers=1,
+        zip_out=False,
+        analyzers=("delta_stats",),
+    )
+    results, _ = run(params)
+    assert [list(r["results"]) for r in results] == [["delta_stats"]] * 3
+    assert not (out / "run_0001" / "graph_analysis").exists()
+
+    # Même sélection exprimée autrement : la reprise garde les runs faits.
+    index = (out / INDEX_NAME).read_bytes()
+    other = replace(params, analyzers=None, exclude_analyzers=("mark_counts", "graph_analysis"))
+    assert selected_analyzers(other) == ["delta_stats"]
+    run(replace(other, resume=True))
+    assert (out / INDEX_NAME).read_bytes() == index
+
+    with pytest.raises(ValueError, match="unknown analyzers"):
+        run(replace(params, out=tmp_path / "bad", analyzers=("nope",)))
+    assert not (tmp_path / "bad").exists()
+
+
+class _Structural:
+    # Analyzer d'entry point sans héritage du Protocol : pas d'attribut cost.
+    name = "structural"
+    version = "1"
+
+    def config(self) -> dict[str, Any]:
+        return {}
+
+    def analyze(self, run_id: int, seed: int, data: Any, output_dir: Path) -> dict[str, Any]:
+        return {"structural": {"seed": seed}}
+
+
+def test_structural_analyzer_without_cost_runs_on_threads(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(registry, "_factories", dict(registry._factories))
+    registry.register("structural", lambda params: cast(AnalyzerProtocol, _Structural()))
+    params = Params(
+        runs=2,
+        thresholds=[0.5],
+        out=tmp_path / "_out",
+        seed_base=1,
+        workers=1,
+        zip_out=False,
+        analyzer_threads=2,
+        analyzers=("structural", "mark_counts"),
+    )
+    results, _ = run(params)
+    assert [list(r["results"]) for r in results] == [["mark_counts", "structural"]] * 2
+    assert results[0]["results"]["structural"] == {"seed": 2}
+
+
+def test_create_rejects_incomplete_analyzers(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(registry, "_factories", dict(registry._factories))
+    registry.register("incomplete", lambda params: cast(AnalyzerProtocol, object()))
+    with pytest.raises(TypeError, match=r"'incomplete' does not implement \['name', 'version'"):
+        registry.create("incomplete", None)
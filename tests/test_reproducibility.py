@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+import pytest
+
+from common.utils import compute_sha256
+from delta_stats.analyzer import DeltaStatsAnalyzer
+from orchestrator.dataset import generate_dataset
 from orchestrator.run import Params, process_run
 
 
@@ -62,3 +69,42 @@ def test_seed_base_changes_output(tmp_path: Path) -> None:
 
     # The dataset hash is extremely unlikely to match if seed changes.
     assert r1["hashes"]["multi.csv"] != r2["hashes"]["multi.csv"]
+
+
+def test_dataset_hash_is_computed_in_memory(tmp_path: Path) -> None:
+    params = Params(
+        runs=1,
+        thresholds=[0.25],
+        out=tmp_path / "a",
+        seed_base=100,
+        workers=1,
+        zip_out=False,
+        write_dataset=False,
+    )
+    r = process_run(1, params)
+    assert "multi.csv" not in r["hashes"]
+    assert not (params.out / "run_0001" / "multi.csv").exists()
+
+    with_csv = process_run(1, replace(params, out=tmp_path / "b", write_dataset=True))
+    assert with_csv["dataset_sha256"] == r["dataset_sha256"]
+    assert with_csv["hashes"]["multi.csv"] == compute_sha256(tmp_path / "b/run_0001/multi.csv")
+    assert _strip_paths(with_csv["results"]) == _strip_paths(r["results"])
+
+
+def test_analyzers_receive_generated_dataset(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    seen: list[Any] = []
+
+    def spy(self: DeltaStatsAnalyzer, run_id: int, seed: int, data: Any, out: Path) -> Any:
+        seen.append(data)
+        return {}
+
+    monkeypatch.setattr(DeltaStatsAnalyzer, "analyze", spy)
+    params = Params(runs=1, thresholds=[], out=tmp_path, seed_base=7, workers=1, zip_out=False)
+    process_run(1, params)
+
+    assert len(seen) == 1
+    assert seen[0].dtype == np.float32
+    assert seen[0].shape == (256, 8)
+    np.testing.assert_array_equal(seen[0], generate_dataset(seed=8))
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from orchestrator import overview
+from orchestrator.index import INDEX_NAME
+from orchestrator.overview import PREVIOUS_OVERVIEW_NAME
+from orchestrator.run import Params, _contiguous_ranges, run
+
+
+def _params(out: Path, **kw: object) -> Params:
+    base = Params(
+        runs=4,
+        thresholds=[0.25, 0.5],
+        out=out,
+        seed_base=321,
+        workers=1,
+        zip_out=False,
+        resume=True,
+    )
+    return replace(base, **kw)  # type: ignore[arg-type]
+
+
+def _stats_mtime(out: Path, run_id: int) -> int:
+    return (out / f"run_{run_id:04d}" / "delta_stats" / "stats.json").stat().st_mtime_ns
+
+
+def test_contiguous_ranges() -> None:
+    assert list(_contiguous_ranges([])) == []
+    assert list(_contiguous_ranges([1, 2, 3, 5, 7, 8])) == [range(1, 4), range(5, 6), range(7, 9)]
+
+
+def test_resume_skips_verified_runs_and_redoes_the_rest(tmp_path: Path) -> None:
+    out = tmp_path / "_out"
+    run(_params(out, resume=False))
+    expected = (out / "overview.json").read_bytes()
+
+    # Simule une interruption : index coupé après le run 3, au milieu d'une ligne.
+    index_path = out / INDEX_NAME
+    lines = index_path.read_bytes().splitlines(keepends=True)
+    index_path.write_bytes(b"".join(lines[:4]) + lines[4][:10])
+    # Run 2 : artefact corrompu (un rapport d'analyzer), doit être recalculé.
+    (out / "run_0002" / "graph_analysis" / "thr_0.25_report.json").write_text("{}")
+    for run_id in (1, 2, 3):
+        os.utime(out / f"run_{run_id:04d}" / "delta_stats" / "stats.json", ns=(0, 0))
+
+    results, _ = run(_params(out))
+
+    assert [r["run_id"] for r in results] == [1, 2, 3, 4]
+    assert (out / "overview.json").read_bytes() == expected
+    assert _stats_mtime(out, 1) == 0
+    assert _stats_mtime(out, 3) == 0
+    assert _stats_mtime(out, 2) != 0
+
+    # Un second resume n'a plus rien à faire.
+    os.utime(out / "run_0004" / "delta_stats" / "stats.json", ns=(0, 0))
+    run(_params(out))
+    assert (out / "overview.json").read_bytes() == expected
+    assert _stats_mtime(out, 4) == 0
+
+
+def test_resume_with_different_config_starts_over(tmp_path: Path) -> None:
+    out = tmp_path / "_out"
+    run(_params(out, runs=2))
+    os.utime(out / "run_0001" / "delta_stats" / "stats.json", ns=(0, 0))
+
+    results, _ = run(_params(out, runs=2, thresholds=[0.7]))
+    assert _stats_mtime(out, 1) != 0
+    assert set(results[0]["results"]["graph_analysis"]) == {"0.70"}
+
+
+def test_resume_rejects_mismatched_seed(tmp_path: Path) -> None:
+    out = tmp_path / "_out"
+    run(_params(out, runs=1))
+    index_path = out / INDEX_NAME
+    raw = index_path.read_text(encoding="utf-8").replace('"seed":322', '"seed":9')
+    index_path.write_text(raw, encoding="utf-8")
+    os.utime(out / "run_0001" / "delta_stats" / "stats.json", ns=(0, 0))
+
+    run(_params(out, runs=1))
+    assert _stats_mtime(out, 1) != 0
+
+
+def test_resume_without_index_runs_everything(tmp_path: Path) -> None:
+    results, _ = run(_params(tmp_path / "_out", runs=2))
+    assert [r["run_id"] for r in results] == [1, 2]
+
+
+def test_index_stores_only_run_id_seed_and_hashes(tmp_path: Path) -> None:
+    out = tmp_path / "_out"
+    run(_params(out, runs=2, resume=False))
+    lines = (out / INDEX_NAME).read_text(encoding="utf-8").splitlines()
+    entries = [json.loads(line) for line in lines[1:]]
+    assert [sorted(e) for e in entries] == [["hashes", "run_id", "seed"]] * 2
+    assert [e["seed"] for e in entries] == [322, 323]
+
+
+def test_resume_recomputes_runs_missing_from_truncated_overview(tmp_path: Path) -> None:
+    out = tmp_path / "_out"
+    run(_params(out, resume=False))
+    overview_path = out / "overview.json"
+    expected = overview_path.read_bytes()
+    # Interruption au milieu de l'entrée du run 3 : runs 1 et 2 relisibles.
+    cut = expected.index(b',{"run_id":3') + 20
+    overview_path.write_bytes(expected[:cut])
+    for run_id in (1, 2, 3):
+        os.utime(out / f"run_{run_id:04d}" / "delta_stats" / "stats.json", ns=(0, 0))
+
+    run(_params(out))
+
+    assert overview_path.read_bytes() == expected
+    assert not (out / PREVIOUS_OVERVIEW_NAME).exists()
+    assert _stats_mtime(out, 1) == 0
+    assert _stats_mtime(out, 2) == 0
+    assert _stats_mtime(out, 3) != 0
+
+
+def test_resume_after_interrupted_resume_merges_overviews(tmp_path: Path) -> None:
+    out = tmp_path / "_out"
+    run(_params(out, resume=False))
+    overview_path = out / "overview.json"
+    expected = overview_path.read_bytes()
+    # Reprise interrompue : l'ancien overview est de côté, le nouveau s'arrête
+    # après le run 1.
+    overview_path.replace(out / PREVIOUS_OVERVIEW_NAME)
+    overview_path.write_bytes(expected[: expected.index(b',{"run_id":2')])
+    for run_id in (1, 2, 3, 4):
+        os.utime(out / f"run_{run_id:04d}" / "delta_stats" / "stats.json", ns=(0, 0))
+
+    run(_params(out))
+
+    assert overview_path.read_bytes() == expected
+    assert all(_stats_mtime(out, run_id) == 0 for run_id in (1, 2, 3, 4))
+
+
+def test_resume_recomputes_runs_whose_overview_hashes_differ(tmp_path: Path) -> None:
+    out = tmp_path / "_out"
+    run(_params(out, runs=2, resume=False))
+    overview_path = out / "overview.json"
+    entries = json.loads(overview_path.read_text(encoding="utf-8"))
+    entries[1]["hashes"] = {}
+    overview_path.write_text(json.dumps(entries, separators=(",", ":")), encoding="utf-8")
+    for run_id in (1, 2):
+        os.utime(out / f"run_{run_id:04d}" / "delta_stats" / "stats.json", ns=(0, 0))
+
+    run(_params(out, runs=2))
+    assert _stats_mtime(out, 1) == 0
+    assert _stats_mtime(out, 2) != 0
+
+
+def test_read_overview_streams_complete_entries(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Petits blocs : les entrées (non ASCII) chevauchent les lectures.
+    monkeypatch.setattr(overview, "_READ_CHUNK", 5)
+    entries = [{"run_id": i, "label": "é" * i} for i in range(1, 6)]
+    path = tmp_path / "overview.json"
+    path.write_text(json.dumps(entries, separators=(",", ":"), ensure_ascii=False), "utf-8")
+    assert list(overview.read_overview(path)) == entries
+
+    raw = path.read_bytes()
+    path.write_bytes(raw[: raw.index(b',{"run_id":4') + 3])
+    assert list(overview.read_overview(path)) == entries[:3]
+    path.write_bytes(b"")
+    assert list(overview.read_overview(path)) == []
+    path.write_bytes(b"[]")
+    assert list(overview.read_overview(path)) == []
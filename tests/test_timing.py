@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from common.timing import (
+    STAGE_PREFIX,
+    TIMINGS_NAME,
+    TimingHistogram,
+    drain_timings,
+    format_stage_table,
+    merge_timings,
+    record_timing,
+    span,
+    write_timings,
+)
+from common.utils import perf_timer
+from orchestrator.run import Params, run
+
+
+def test_histogram_percentiles_and_merge() -> None:
+    durations = np.random.default_rng(0).lognormal(mean=-6, sigma=1, size=2000)
+    a, b = TimingHistogram(), TimingHistogram()
+    for i, d in enumerate(durations.tolist()):
+        (a if i % 2 else b).add(d)
+    a.merge(b)
+
+    assert a.count == 2000
+    assert a.total == pytest.approx(durations.sum())
+    for q in (0.5, 0.9, 0.99):
+        assert a.percentile(q) == pytest.approx(np.quantile(durations, q), rel=0.1)
+    summary = a.summary()
+    assert summary["min_s"] == durations.min() and summary["max_s"] == durations.max()
+    assert summary["p50_s"] <= summary["p90_s"] <= summary["p99_s"]
+
+    tiny = TimingHistogram()
+    tiny.add(0.0)
+    assert tiny.percentile(0.5) == 0.0
+    assert TimingHistogram().summary()["p99_s"] == 0.0
+
+
+def test_perf_timer_records_without_info_logs(caplog: pytest.LogCaptureFixture) -> None:
+    @perf_timer
+    def f() -> int:
+        return 1
+
+    drain_timings()
+    with caplog.at_level(logging.INFO, logger="EchoNull"):
+        f()
+        f()
+    assert not caplog.records
+    timings = drain_timings()
+    assert timings[f.__qualname__].count == 2
+
+    with caplog.at_level(logging.DEBUG, logger="EchoNull"):
+        f()
+    assert "took" in caplog.records[0].getMessage()
+    assert drain_timings()[f.__qualname__].count == 1
+
+
+def test_merge_timings() -> None:
+    record_timing("x", 0.01)
+    into = drain_timings()
+    record_timing("x", 0.02)
+    record_timing("y", 0.03)
+    merge_timings(into, drain_timings())
+    assert (into["x"].count, into["y"].count) == (2, 1)
+
+
+def test_sweep_writes_worker_timings(tmp_path: Path) -> None:
+    out = tmp_path / "_out"
+    params = Params(runs=6, thresholds=[0.25], out=out, seed_base=2, workers=2, zip_out=False)
+    run(params)
+    timings = json.loads((out / TIMINGS_NAME).read_text(encoding="utf-8"))["functions"]
+
+    assert timings["process_run"]["count"] == 6
+    assert timings["GraphAnalysisAnalyzer.analyze"]["count"] == 6
+    assert timings["DeltaStatsAnalyzer.analyze"]["count"] == 6
+    assert timings["process_run"]["p50_s"] > 0
+    # Le sweep lui-même est mesuré dans le processus principal, après écriture.
+    assert "run" not in timings
+
+
+def test_span_records_stage_and_write_splits_it(tmp_path: Path) -> None:
+    drain_timings()
+    with span("load"):
+        pass
+    with span("skipped", enabled=False):
+        pass
+    with pytest.raises(RuntimeError), span("load"):
+        raise RuntimeError
+    record_timing("f", 0.5)
+    timings = drain_timings()
+    assert timings[STAGE_PREFIX + "load"].count == 2
+    assert STAGE_PREFIX + "skipped" not in timings
+
+    write_timings(tmp_path / TIMINGS_NAME, timings)
+    payload = json.loads((tmp_path / TIMINGS_NAME).read_text(encoding="utf-8"))
+    assert list(payload["functions"]) == ["f"]
+    assert list(payload["stages"]) == ["load"]
+
+
+def test_stage_table_shares() -> None:
+    record_timing("outer", 1.0)
+    record_timing(STAGE_PREFIX + "a", 0.25)
+    record_timing(STAGE_PREFIX + "b", 0.5)
+    timings = drain_timings()
+
+    lines = format_stage_table(timings, "outer").splitlines()
+    assert lines[0].split() == ["stage", "count", "total_s", "mean_ms", "p50_ms", "p99_ms", "share"]
+    # Tri par temps total décroissant, part rapportée à la fonction englobante.
+    assert lines[1].split()[0] == "b" and lines[1].endswith("50.0%")
+    assert lines[2].split()[0] == "a" and lines[2].endswith("25.0%")
+    # Sans référence, la part est rapportée à la somme des étapes.
+    assert format_stage_table(timings, "missing").splitlines()[1].endswith("66.7%")
+    assert len(format_stage_table({}, "outer").splitlines()) == 1
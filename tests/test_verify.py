@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import json
+import os
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from orchestrator.index import INDEX_NAME
+from orchestrator.run import Params, main, run
+from orchestrator.verify import Mismatch, stat_index_path, verify
+
+
+def _sweep(tmp_path: Path) -> tuple[Path, Path]:
+    out = tmp_path / "_out"
+    params = Params(runs=3, thresholds=[0.25, 0.5], out=out, seed_base=8, workers=1, zip_out=True)
+    _results, zip_path = run(params)
+    assert zip_path is not None
+    return out, zip_path
+
+
+def test_verify_clean_tree_then_fast_mode(tmp_path: Path) -> None:
+    out, _zip = _sweep(tmp_path)
+    report = verify(out)
+    assert report.ok
+    # 3 runs x 5 fichiers, overview, manifest, index, aggregate et colonnes.
+    assert report.checked > 3 * 5 + 4
+    # Relevé à côté du dossier, hors de l'arbre archivé par --zip.
+    assert stat_index_path(out) == tmp_path / "_out.verify.jsonl"
+    assert stat_index_path(out).exists()
+
+    fast = verify(out, fast=True)
+    assert fast.ok and fast.checked == report.checked
+
+
+def test_verify_reports_mismatches(tmp_path: Path) -> None:
+    out, _zip = _sweep(tmp_path)
+    verify(out)
+
+    report_path = out / "run_0001" / "graph_analysis" / "thr_0.25_report.json"
+    raw = report_path.read_bytes()
+    report_path.write_bytes(raw.replace(b'"nodes":10', b'"nodes":11'))
+    (out / "run_0002" / "mark_counts" / "count.txt").unlink()
+    (out / "run_0003" / "extra.txt").write_text("x")
+    (out / "run_0003" / "multi.csv").write_text("short")
+
+    fast = verify(out, fast=True)
+    assert set(fast.mismatches) == {
+        Mismatch("run_0001/graph_analysis/thr_0.25_report.json", "mtime"),
+        Mismatch("run_0002/mark_counts/count.txt", "missing"),
+        Mismatch("run_0003/extra.txt", "unexpected"),
+        Mismatch("run_0003/multi.csv", "size"),
+    }
+
+    full = verify(out)
+    assert not full.ok
+    assert Mismatch("run_0001/graph_analysis/thr_0.25_report.json", "sha256") in full.mismatches
+    assert Mismatch("run_0003/multi.csv", "sha256") in full.mismatches
+
+
+def test_verify_detects_index_and_manifest_tampering(tmp_path: Path) -> None:
+    out, _zip = _sweep(tmp_path)
+    index_path = out / INDEX_NAME
+    lines = index_path.read_text(encoding="utf-8").splitlines(keepends=True)
+    index_path.write_text("".join(lines[:-1]), encoding="utf-8")
+
+    report = verify(out)
+    assert Mismatch("run_0003/", "not indexed") in report.mismatches
+    assert Mismatch("manifest.json", "runs_merkle_root") in report.mismatches
+    # Vérification non concluante : pas de relevé pour le mode rapide.
+    assert not stat_index_path(out).exists()
+    with pytest.raises(FileNotFoundError, match="full verify"):
+        verify(out, fast=True)
+
+
+def test_verify_streams_from_zip(tmp_path: Path) -> None:
+    _out, zip_path = _sweep(tmp_path)
+    report = verify(zip_path, workers=2)
+    assert report.ok
+    assert stat_index_path(zip_path) == tmp_path / "_out.zip.verify.jsonl"
+    assert verify(zip_path, fast=True).ok
+
+    broken = tmp_path / "broken.zip"
+    with zipfile.ZipFile(zip_path) as src, zipfile.ZipFile(broken, "w") as dst:
+        for info in src.infolist():
+            if info.filename == "run_0001/mark_counts/count.txt":
+                continue
+            data = src.read(info)
+            if info.filename == "run_0002/delta_stats/stats.json":
+                data = json.dumps({"tampered": True}).encode()
+            dst.writestr(info, data)
+        dst.writestr("run_0002/", b"")
+    assert verify(broken).mismatches == [
+        Mismatch("run_0001/mark_counts/count.txt", "missing"),
+        Mismatch("run_0002/delta_stats/stats.json", "sha256"),
+    ]
+
+    empty = tmp_path / "empty.zip"
+    with zipfile.ZipFile(empty, "w") as zf:
+        zf.writestr("x", b"")
+    with pytest.raises(FileNotFoundError):
+        verify(empty)
+
+
+def test_verify_cli(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    out, _zip = _sweep(tmp_path)
+    assert main(["verify", str(out), "--workers", "1"]) == 0
+    assert "0 mismatches" in capsys.readouterr().out
+
+    (out / "run_0001" / "multi.csv").write_text("tampered")
+    assert main(["verify", str(out), "--fast"]) == 1
+    assert "MISMATCH size: run_0001/multi.csv" in capsys.readouterr().out
+
+
+def test_verify_fast_zip_checks_archive_stat_and_entry_crcs(tmp_path: Path) -> None:
+    _out, zip_path = _sweep(tmp_path)
+    assert verify(zip_path).ok
+
+    # Même taille, même date figée : seul le CRC de l'entrée change.
+    name = "run_0002/mark_counts/count.txt"
+    rewritten = tmp_path / "rewritten.zip"
+    with zipfile.ZipFile(zip_path) as src, zipfile.ZipFile(rewritten, "w") as dst:
+        for info in src.infolist():
+            data = src.read(info)
+            if info.filename == name:
+                data = bytes(b ^ 1 if chr(b).isdigit() else b for b in data)
+            dst.writestr(info, data)
+    rewritten.replace(zip_path)
+    fast = verify(zip_path, fast=True)
+    assert Mismatch(name, "crc") in fast.mismatches
+    assert [m.name for m in fast.mismatches] == ["_out.zip", name]
+
+    assert verify(zip_path).mismatches == [Mismatch(name, "sha256")]
+
+
+def test_verify_fast_zip_detects_touched_archive(tmp_path: Path) -> None:
+    _out, zip_path = _sweep(tmp_path)
+    assert verify(zip_path).ok
+    os.utime(zip_path, ns=(0, 0))
+    assert verify(zip_path, fast=True).mismatches == [Mismatch("_out.zip", "mtime")]
+    with zip_path.open("ab") as fh:
+        fh.write(b"x")
+    assert Mismatch("_out.zip", "size") in verify(zip_path, fast=True).mismatches
+
+
+def test_stat_index_is_not_archived_by_next_zip_sweep(tmp_path: Path) -> None:
+    out, _zip = _sweep(tmp_path)
+    assert verify(out).ok
+    _out, zip_path = _sweep(tmp_path)
+    with zipfile.ZipFile(zip_path) as zf:
+        assert not [n for n in zf.namelist() if n.endswith(".verify.jsonl")]
+
+
+def test_verify_cli_reports_user_errors(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    not_zip = tmp_path / "not.zip"
+    not_zip.write_bytes(b"plain")
+    for argv, message in (
+        (["verify", str(tmp_path / "missing")], "No such file"),
+        (["verify", str(tmp_path), "--fast"], "run a full verify first"),
+        (["verify", str(not_zip)], "not a zip file"),
+    ):
+        with pytest.raises(SystemExit) as exc:
+            main(argv)
+        assert exc.value.code == 2
+        err = capsys.readouterr().err
+        assert "Traceback" not in err and message in err